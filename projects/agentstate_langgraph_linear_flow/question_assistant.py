@@ -3,16 +3,28 @@
 # ! =============================================================================
 # ! 1. IMPORTS
 # ! =============================================================================
+import argparse
+import asyncio
+import json
 import logging
+import re
 import sys
-from typing import TypedDict
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import cache, partial
+from itertools import starmap
+from pathlib import Path
+from typing import Any, TextIO, TypedDict
 
 from dotenv import load_dotenv
-from langchain_core.exceptions import LangChainError
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.exceptions import LangChainException
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
-from langgraph.graph.graph import CompiledGraph
+from langgraph.graph.state import CompiledStateGraph
 
 # ! =============================================================================
 # ! 2. CONFIGURAÇÃO DE LOGGING
@@ -30,6 +42,7 @@ logger = logging.getLogger(__name__)
 # ! =============================================================================
 # ! 3. CONSTANTES
 # ! =============================================================================
+TRIAGE_NODE = "triage"
 REFORMULATE_NODE = "reformulate"
 ANSWER_NODE = "answer"
 DEFAULT_MODEL = "gpt-4o-mini"
@@ -42,12 +55,85 @@ ANSWER_SYSTEM_PROMPT = (
     "Você é um tutor expert em Python. Responda de forma clara, didática "
     "e com exemplos de código."
 )
+# Heurística de clareza: perguntas claras vão direto para o nó de resposta
+MIN_CLEAR_WORDS = 4
+MAX_CLEAR_WORDS = 40
+QUESTION_WORDS = frozenset(
+    {
+        "qual",
+        "quais",
+        "quando",
+        "onde",
+        "quem",
+        "quanto",
+        "quantos",
+        "porque",
+        "how",
+        "what",
+        "which",
+        "why",
+        "when",
+        "where",
+        "who",
+    }
+)
+# "que" e "por" sozinhos aparecem em qualquer frase ("por favor", "acho que"):
+# só contam como interrogativos dentro destas locuções
+QUESTION_PHRASES = ("o que", "por que", "pra que", "para que")
+# "como" também é comparação ("use python como calculadora"): só conta como
+# interrogativo quando abre a pergunta ("como criar uma classe...")
+LEADING_QUESTION_WORDS = frozenset({"como"})
+DOMAIN_TERMS = frozenset(
+    {
+        "python",
+        "pip",
+        "lista",
+        "list",
+        "tupla",
+        "tuple",
+        "dicionario",
+        "dict",
+        "set",
+        "string",
+        "funcao",
+        "function",
+        "classe",
+        "class",
+        "metodo",
+        "method",
+        "modulo",
+        "module",
+        "pacote",
+        "package",
+        "decorator",
+        "decorador",
+        "generator",
+        "gerador",
+        "loop",
+        "excecao",
+        "exception",
+        "asyncio",
+        "async",
+        "thread",
+        "pandas",
+        "numpy",
+        "pytest",
+        "langchain",
+        "langgraph",
+        "virtualenv",
+        "venv",
+    }
+)
+REFORMULATION_CACHE_SIZE = 1024
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_OUTPUT_PATH = "answers.jsonl"
 ERROR_LLM_CONFIG = "Falha na configuração do LLM."
 ERROR_EMPTY_QUESTION = "A pergunta original não pode estar vazia."
 ERROR_EMPTY_CLARIFIED_QUESTION = "A pergunta clarificada não pode estar vazia."
 ERROR_INVALID_LLM_TYPE = "O argumento 'llm' deve ser uma instância de ChatOpenAI."
 ERROR_USER_QUESTION_EMPTY = "A pergunta do usuário não pode estar vazia."
 ERROR_LLM_RESPONSE_NOT_STRING = "A resposta do LLM não é uma string válida."
+ERROR_INVALID_CONCURRENCY = "max_concurrency deve ser maior ou igual a 1."
 
 
 # ! =============================================================================
@@ -74,7 +160,7 @@ def setup_llm(
     try:
         load_dotenv()
         llm = ChatOpenAI(model=model, temperature=temperature)
-    except LangChainError as e:
+    except LangChainException as e:
         logger.exception("Erro ao configurar LLM")
         raise ValueError(ERROR_LLM_CONFIG) from e
     else:
@@ -104,111 +190,427 @@ class AgentState(TypedDict):
 
 
 # ! =============================================================================
-# ! 6. DEFINIÇÃO DOS NÓS (LÓGICA DO AGENTE)
+# ! 6. CAMINHO RÁPIDO (HEURÍSTICA DE CLAREZA E CACHE DE REFORMULAÇÕES)
 # ! =============================================================================
-def reformulate_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
-    """Nó para reformular e clarificar a pergunta do usuário.
+def normalize_question(question: str) -> str:
+    """Normaliza a pergunta: minúsculas, sem acentos e com espaços colapsados.
+
+    Args:
+        question (str): A pergunta do usuário.
+
+    Returns:
+        str: A pergunta normalizada (usada como chave do cache e pela heurística).
+
+    """
+    sem_acentos = unicodedata.normalize("NFKD", question.lower())
+    sem_acentos = "".join(c for c in sem_acentos if not unicodedata.combining(c))
+    return " ".join(sem_acentos.split())
+
+
+def is_clear_question(question: str) -> bool:
+    """Heurística local (sem LLM) que decide se a pergunta dispensa reformulação.
+
+    A pergunta é considerada clara quando atende aos três critérios:
+    tamanho razoável (entre MIN_CLEAR_WORDS e MAX_CLEAR_WORDS palavras), tem
+    forma de pergunta (termina em "?", contém uma palavra interrogativa ou uma
+    locução como "o que"/"por que", ou começa com "como") e cita ao menos um
+    termo conhecido do domínio.
+
+    Args:
+        question (str): A pergunta do usuário.
+
+    Returns:
+        bool: True se a pergunta pode ir direto para o nó de resposta.
+
+    """
+    words = re.findall(r"\w+", normalize_question(question))
+    if not MIN_CLEAR_WORDS <= len(words) <= MAX_CLEAR_WORDS:
+        return False
+    unique_words = set(words)
+    joined = f" {' '.join(words)} "
+    is_question = (
+        question.rstrip().endswith("?")
+        or bool(unique_words & QUESTION_WORDS)
+        or any(f" {phrase} " in joined for phrase in QUESTION_PHRASES)
+        or words[0] in LEADING_QUESTION_WORDS
+    )
+    return is_question and bool(unique_words & DOMAIN_TERMS)
+
+
+class ReformulationCache:
+    """Cache LRU em memória das reformulações, indexado pela pergunta normalizada."""
+
+    def __init__(self, max_size: int = REFORMULATION_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, question: str) -> str | None:
+        """Busca a reformulação de uma pergunta já vista.
+
+        Args:
+            question (str): A pergunta do usuário.
+
+        Returns:
+            str | None: A reformulação guardada, ou None se não houver.
+
+        """
+        key = normalize_question(question)
+        with self._lock:
+            reformulated = self._entries.get(key)
+            if reformulated is not None:
+                self._entries.move_to_end(key)
+            return reformulated
+
+    def put(self, question: str, reformulated: str) -> None:
+        """Guarda a reformulação, descartando a entrada menos usada se cheio."""
+        key = normalize_question(question)
+        with self._lock:
+            self._entries[key] = reformulated
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class FastPathStats:
+    """Contadores do caminho rápido: atalhos, acertos de cache e latência poupada.
+
+    A latência poupada é estimada como (atalhos + acertos) vezes a latência
+    média das reformulações feitas de fato pelo LLM.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.questions = 0
+        self.heuristic_skips = 0
+        self.cache_hits = 0
+        self.reformulations = 0
+        self.reformulation_seconds = 0.0
+
+    def record_triage(self, *, skipped: bool, cache_hit: bool) -> None:
+        """Conta uma pergunta triada e o atalho que ela tomou (se algum)."""
+        with self._lock:
+            self.questions += 1
+            self.heuristic_skips += skipped
+            self.cache_hits += cache_hit
+
+    def record_reformulation(self, seconds: float) -> None:
+        """Conta uma reformulação feita pelo LLM e sua latência."""
+        with self._lock:
+            self.reformulations += 1
+            self.reformulation_seconds += seconds
+
+    def summary(self) -> dict[str, float]:
+        """Resume os contadores do caminho rápido.
+
+        Returns:
+            dict[str, float]: Contagens, taxa de atalho da heurística, taxa de
+                acerto do cache (entre as perguntas não claras) e latência poupada.
+
+        """
+        with self._lock:
+            avoided = self.heuristic_skips + self.cache_hits
+            cache_lookups = self.cache_hits + self.reformulations
+            mean_reformulation = (
+                self.reformulation_seconds / self.reformulations
+                if self.reformulations
+                else 0.0
+            )
+            skip_rate = self.heuristic_skips / self.questions if self.questions else 0.0
+            hit_rate = self.cache_hits / cache_lookups if cache_lookups else 0.0
+            return {
+                "questions": self.questions,
+                "heuristic_skips": self.heuristic_skips,
+                "cache_hits": self.cache_hits,
+                "reformulations": self.reformulations,
+                "skip_rate": round(skip_rate, 3),
+                "cache_hit_rate": round(hit_rate, 3),
+                "mean_reformulation_s": round(mean_reformulation, 3),
+                "saved_latency_s": round(avoided * mean_reformulation, 3),
+            }
+
+
+reformulation_cache = ReformulationCache()
+fast_path_stats = FastPathStats()
+
+
+# ! =============================================================================
+# ! 7. DEFINIÇÃO DOS NÓS (LÓGICA DO AGENTE)
+# ! =============================================================================
+def triage_node(state: AgentState) -> dict[str, str]:
+    """Nó de triagem: decide, sem LLM, se a reformulação pode ser pulada.
+
+    Perguntas claras (ver `is_clear_question`) seguem como estão, e perguntas
+    repetidas reaproveitam a reformulação guardada no cache. Nos dois casos a
+    chave 'question_clarified' é preenchida e o roteador pula o nó de reformulação.
 
     Args:
         state (AgentState): O estado compartilhado do workflow.
-        llm (ChatOpenAI): O modelo de linguagem configurado.
 
     Returns:
-        dict[str, str]: Um dicionário de atualização com a chave 'question_clarified'.
+        dict[str, str]: Atualização com 'question_clarified' quando a reformulação
+            é dispensada; vazio caso contrário.
 
     Raises:
         ValueError: Se a pergunta original no estado estiver vazia.
-        TypeError: Se o conteúdo da resposta do LLM não for uma string.
-        LangChainError: Se houver um erro na comunicação com o LLM.
 
-    """  # ! CORREÇÃO: Docstring completa
+    """
+    original_question = state.get("original_question", "").strip()
+    if not original_question:
+        raise ValueError(ERROR_EMPTY_QUESTION)
+
+    if is_clear_question(original_question):
+        fast_path_stats.record_triage(skipped=True, cache_hit=False)
+        logger.info("Pergunta já está clara, pulando a reformulação")
+        return {"question_clarified": original_question}
+
+    cached = reformulation_cache.get(original_question)
+    fast_path_stats.record_triage(skipped=False, cache_hit=cached is not None)
+    if cached is not None:
+        logger.info("Reformulação encontrada no cache")
+        return {"question_clarified": cached}
+    return {}
+
+
+def route_after_triage(state: AgentState) -> str:
+    """Roteador: vai direto à resposta se a triagem já definiu a pergunta clarificada.
+
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+
+    Returns:
+        str: ANSWER_NODE ou REFORMULATE_NODE.
+
+    """
+    return ANSWER_NODE if state.get("question_clarified") else REFORMULATE_NODE
+
+
+def reformulation_prompt(state: AgentState) -> tuple[str, list[BaseMessage]]:
+    """Valida a pergunta original e monta o prompt de reformulação.
+
+    Compartilhado por `reformulate_node` e `areformulate_node`.
+
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+
+    Returns:
+        tuple[str, list[BaseMessage]]: A pergunta original e as mensagens do prompt.
+
+    Raises:
+        ValueError: Se a pergunta original no estado estiver vazia.
+
+    """
     original_question = state.get("original_question", "").strip()
     if not original_question:
         raise ValueError(ERROR_EMPTY_QUESTION)
+    prompt = [SystemMessage(REFORMULATE_SYSTEM_PROMPT), HumanMessage(original_question)]
+    return original_question, prompt
+
+
+def reformulation_update(
+    original_question: str, response: BaseMessage, elapsed: float
+) -> dict[str, str]:
+    """Valida a resposta do LLM e monta a atualização do nó de reformulação.
+
+    Registra a latência da chamada e guarda a reformulação no cache.
+
+    Args:
+        original_question (str): A pergunta original do usuário.
+        response (BaseMessage): A resposta do LLM.
+        elapsed (float): Duração da chamada ao LLM, em segundos.
+
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'question_clarified'.
+
+    Raises:
+        TypeError: Se o conteúdo da resposta do LLM não for uma string.
+
+    """
+    fast_path_stats.record_reformulation(elapsed)
+
+    # ! CORREÇÃO: Substituído 'assert' por 'if/raise' para robustez
+    if not isinstance(response.content, str):
+        raise TypeError(ERROR_LLM_RESPONSE_NOT_STRING)
+
+    reformulated = response.content.strip()
+    if not reformulated:
+        logger.warning("Resposta vazia do LLM, usando pergunta original")
+        reformulated = original_question
+
+    logger.info("Pergunta reformulada com sucesso: %s...", reformulated[:100])
+    reformulation_cache.put(original_question, reformulated)
+    return {"question_clarified": reformulated}
+
+
+def reformulate_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
+    """Nó para reformular e clarificar a pergunta do usuário.
 
+    A validação da pergunta e da resposta fica em `reformulation_prompt` e
+    `reformulation_update` (ValueError/TypeError vêm de lá).
+
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+        llm (ChatOpenAI): O modelo de linguagem configurado.
+
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'question_clarified'.
+
+    Raises:
+        LangChainException: Se houver um erro na comunicação com o LLM.
+
+    """  # ! CORREÇÃO: Docstring completa
+    original_question, prompt = reformulation_prompt(state)
     logger.info("Iniciando reformulação da pergunta")
+    start = time.perf_counter()
     try:
-        prompt = [
-            SystemMessage(REFORMULATE_SYSTEM_PROMPT),
-            HumanMessage(original_question),
-        ]
         response = llm.invoke(prompt)
+    except LangChainException:
+        logger.exception("Erro na reformulação")
+        raise  # Re-lança a exceção original
+    return reformulation_update(
+        original_question, response, time.perf_counter() - start
+    )
+
 
-        # ! CORREÇÃO: Substituído 'assert' por 'if/raise' para robustez
-        if not isinstance(response.content, str):
-            raise TypeError(ERROR_LLM_RESPONSE_NOT_STRING)
+async def areformulate_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
+    """Versão assíncrona de `reformulate_node` (usa `llm.ainvoke`).
 
-        reformulated = response.content.strip()
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+        llm (ChatOpenAI): O modelo de linguagem configurado.
+
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'question_clarified'.
 
-        if not reformulated:
-            logger.warning("Resposta vazia do LLM, usando pergunta original")
-            reformulated = original_question
+    Raises:
+        LangChainException: Se houver um erro na comunicação com o LLM.
 
-    except LangChainError:
+    """
+    original_question, prompt = reformulation_prompt(state)
+    logger.info("Iniciando reformulação da pergunta")
+    start = time.perf_counter()
+    try:
+        response = await llm.ainvoke(prompt)
+    except LangChainException:
         logger.exception("Erro na reformulação")
-        raise  # Re-lança a exceção original
-    else:
-        logger.info("Pergunta reformulada com sucesso: %s...", reformulated[:100])
-        return {"question_clarified": reformulated}
+        raise
+    return reformulation_update(
+        original_question, response, time.perf_counter() - start
+    )
 
 
-def answer_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
-    """Nó para gerar uma resposta educativa baseada na pergunta clarificada.
+def answer_prompt(state: AgentState) -> list[BaseMessage]:
+    """Valida a pergunta clarificada e monta o prompt de resposta.
+
+    Compartilhado por `answer_node` e `aanswer_node`.
 
     Args:
         state (AgentState): O estado compartilhado do workflow.
-        llm (ChatOpenAI): O modelo de linguagem configurado.
 
     Returns:
-        dict[str, str]: Um dicionário de atualização com a chave 'answer'.
+        list[BaseMessage]: As mensagens do prompt.
 
     Raises:
         ValueError: Se a pergunta clarificada no estado estiver vazia.
-        TypeError: Se o conteúdo da resposta do LLM não for uma string.
-        LangChainError: Se houver um erro na comunicação com o LLM.
 
-    """  # ! CORREÇÃO: Docstring completa
+    """
     reformulated_question = state.get("question_clarified", "").strip()
     if not reformulated_question:
         raise ValueError(ERROR_EMPTY_CLARIFIED_QUESTION)
+    return [SystemMessage(ANSWER_SYSTEM_PROMPT), HumanMessage(reformulated_question)]
+
+
+def answer_update(response: BaseMessage) -> dict[str, str]:
+    """Valida a resposta do LLM e monta a atualização do nó de resposta.
+
+    Args:
+        response (BaseMessage): A resposta do LLM.
+
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'answer'.
+
+    Raises:
+        TypeError: Se o conteúdo da resposta do LLM não for uma string.
+
+    """
+    # ! CORREÇÃO: Substituído 'assert' por 'if/raise' para robustez
+    if not isinstance(response.content, str):
+        raise TypeError(ERROR_LLM_RESPONSE_NOT_STRING)
+
+    answer = response.content.strip()
+    if not answer:
+        logger.warning("Resposta vazia do LLM")
+        answer = "Desculpe, não foi possível gerar uma resposta adequada."
+
+    logger.info("Resposta gerada com sucesso")
+    return {"answer": answer}
+
+
+def answer_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
+    """Nó para gerar uma resposta educativa baseada na pergunta clarificada.
+
+    A validação da pergunta e da resposta fica em `answer_prompt` e
+    `answer_update` (ValueError/TypeError vêm de lá).
+
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+        llm (ChatOpenAI): O modelo de linguagem configurado.
 
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'answer'.
+
+    Raises:
+        LangChainException: Se houver um erro na comunicação com o LLM.
+
+    """  # ! CORREÇÃO: Docstring completa
+    prompt = answer_prompt(state)
     logger.info("Iniciando geração da resposta")
     try:
-        prompt = [
-            SystemMessage(ANSWER_SYSTEM_PROMPT),
-            HumanMessage(reformulated_question),
-        ]
         response = llm.invoke(prompt)
+    except LangChainException:
+        logger.exception("Erro na geração da resposta")
+        raise
+    return answer_update(response)
 
-        # ! CORREÇÃO: Substituído 'assert' por 'if/raise' para robustez
-        if not isinstance(response.content, str):
-            raise TypeError(ERROR_LLM_RESPONSE_NOT_STRING)
 
-        answer = response.content.strip()
+async def aanswer_node(state: AgentState, llm: ChatOpenAI) -> dict[str, str]:
+    """Versão assíncrona de `answer_node` (usa `llm.ainvoke`).
+
+    Args:
+        state (AgentState): O estado compartilhado do workflow.
+        llm (ChatOpenAI): O modelo de linguagem configurado.
+
+    Returns:
+        dict[str, str]: Um dicionário de atualização com a chave 'answer'.
 
-        if not answer:
-            logger.warning("Resposta vazia do LLM")
-            answer = "Desculpe, não foi possível gerar uma resposta adequada."
+    Raises:
+        LangChainException: Se houver um erro na comunicação com o LLM.
 
-    except LangChainError:
+    """
+    prompt = answer_prompt(state)
+    logger.info("Iniciando geração da resposta")
+    try:
+        response = await llm.ainvoke(prompt)
+    except LangChainException:
         logger.exception("Erro na geração da resposta")
         raise
-    else:
-        logger.info("Resposta gerada com sucesso")
-        return {"answer": answer}
+    return answer_update(response)
 
 
 # ==============================================================================
-# 7. FÁBRICA DE GRAFOS (GRAPH FACTORY)
+# 8. FÁBRICA DE GRAFOS (GRAPH FACTORY)
 # ==============================================================================
-def create_graph(llm: ChatOpenAI) -> CompiledGraph:
+def create_graph(llm: ChatOpenAI, *, fast_path: bool = True) -> CompiledStateGraph:
     """Cria e compila o workflow do LangGraph.
 
     Args:
         llm (ChatOpenAI): O modelo de linguagem configurado.
+        fast_path (bool): Se True, o nó de triagem manda perguntas claras ou já
+            reformuladas direto para a resposta. Se False, o fluxo é linear
+            (reformulação sempre antes da resposta).
 
     Returns:
-        CompiledGraph: Um grafo compilado representando o workflow.
+        CompiledStateGraph: Um grafo compilado representando o workflow.
 
     Raises:
         TypeError: Se o argumento 'llm' não for uma instância de ChatOpenAI.
@@ -220,27 +622,273 @@ def create_graph(llm: ChatOpenAI) -> CompiledGraph:
     logger.info("Criando workflow do LangGraph")
     workflow = StateGraph(AgentState)
 
-    workflow.add_node(REFORMULATE_NODE, lambda state: reformulate_node(state, llm))
-    workflow.add_node(ANSWER_NODE, lambda state: answer_node(state, llm))
+    # Cada nó tem as duas versões: `invoke`/`stream` usam a síncrona e
+    # `ainvoke`/`astream` a assíncrona (com `llm.ainvoke`)
+    workflow.add_node(
+        REFORMULATE_NODE,
+        RunnableLambda(
+            partial(reformulate_node, llm=llm),
+            afunc=partial(areformulate_node, llm=llm),
+        ),
+    )
+    workflow.add_node(
+        ANSWER_NODE,
+        RunnableLambda(
+            partial(answer_node, llm=llm), afunc=partial(aanswer_node, llm=llm)
+        ),
+    )
 
-    workflow.set_entry_point(REFORMULATE_NODE)
+    if fast_path:
+        workflow.add_node(TRIAGE_NODE, triage_node)
+        workflow.set_entry_point(TRIAGE_NODE)
+        workflow.add_conditional_edges(
+            TRIAGE_NODE,
+            route_after_triage,
+            {REFORMULATE_NODE: REFORMULATE_NODE, ANSWER_NODE: ANSWER_NODE},
+        )
+    else:
+        workflow.set_entry_point(REFORMULATE_NODE)
     workflow.add_edge(REFORMULATE_NODE, ANSWER_NODE)
     workflow.add_edge(ANSWER_NODE, END)
 
     return workflow.compile()
 
 
+def get_graph(
+    model: str = DEFAULT_MODEL,
+    temperature: float = DEFAULT_TEMPERATURE,
+    *,
+    fast_path: bool = True,
+) -> CompiledStateGraph:
+    """Devolve o workflow compilado para o modelo, criando-o só na primeira vez.
+
+    Cache de módulo por configuração: o LLM e o grafo são montados e compilados
+    uma única vez por processo. Em execuções "quentes" (workers, funções
+    serverless reaproveitadas) as chamadas seguintes não pagam esse custo.
+
+    Args:
+        model (str): Nome do modelo a ser usado.
+        temperature (float): Temperatura para controle de criatividade.
+        fast_path (bool): Pula a reformulação de perguntas claras ou repetidas.
+
+    Returns:
+        CompiledStateGraph: O grafo compilado (a mesma instância para a mesma
+            configuração, qualquer que seja a forma de passar os argumentos).
+
+    """
+    # O cache fica em `_build_graph`, com os argumentos já normalizados:
+    # `get_graph()`, `get_graph(DEFAULT_MODEL)` e `get_graph(model=DEFAULT_MODEL)`
+    # gerariam chaves distintas (e LLMs e grafos repetidos) em um `@cache` aqui.
+    return _build_graph(
+        model=model, temperature=float(temperature), fast_path=bool(fast_path)
+    )
+
+
+@cache
+def _build_graph(
+    *, model: str, temperature: float, fast_path: bool
+) -> CompiledStateGraph:
+    """Monta o LLM e compila o workflow (chamado só por `get_graph`).
+
+    Returns:
+        CompiledStateGraph: O grafo compilado, guardado em cache por configuração.
+
+    """
+    return create_graph(
+        setup_llm(model=model, temperature=temperature), fast_path=fast_path
+    )
+
+
+# ! ==============================================================================
+# ! 9. EXECUÇÃO EM LOTE (ASSÍNCRONA)
+# ! ==============================================================================
+def load_questions(path: Path) -> list[str]:
+    """Lê as perguntas de um arquivo texto (uma por linha) ou JSONL.
+
+    Em arquivos `.jsonl`, cada linha é um objeto com a chave "question".
+    Linhas em branco são ignoradas.
+
+    Args:
+        path (Path): Caminho do arquivo de perguntas.
+
+    Returns:
+        list[str]: As perguntas, na ordem do arquivo.
+
+    """
+    lines = [
+        line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()
+    ]
+    if path.suffix == ".jsonl":
+        return [json.loads(line)["question"] for line in lines]
+    return [line.strip() for line in lines]
+
+
+async def answer_question(
+    graph: CompiledStateGraph, index: int, question: str
+) -> dict[str, Any]:
+    """Responde uma pergunta pelo grafo compilado, medindo o tempo de cada nó.
+
+    Usa `astream` no modo "updates": cada evento marca o fim de um nó, então o
+    tempo de um nó é o intervalo desde o evento anterior. Erros não interrompem
+    o lote: viram um registro com status "error".
+
+    Args:
+        graph (CompiledStateGraph): O workflow compilado.
+        index (int): Posição da pergunta na entrada.
+        question (str): A pergunta do usuário.
+
+    Returns:
+        dict[str, Any]: O registro JSONL da pergunta.
+
+    """
+    record: dict[str, Any] = {
+        "index": index,
+        "question": question,
+        "question_clarified": None,
+        "answer": None,
+        "status": "ok",
+        "error": None,
+        "node_timings_s": {},
+    }
+    start = last = time.perf_counter()
+    try:
+        async for update in graph.astream(
+            {"original_question": question}, stream_mode="updates"
+        ):
+            now = time.perf_counter()
+            for node, values in update.items():
+                record["node_timings_s"][node] = round(now - last, 4)
+                record.update(values or {})
+            last = now
+    except Exception as e:
+        logger.exception("Erro ao processar a pergunta %d", index)
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["latency_s"] = round(time.perf_counter() - start, 4)
+    record.pop("original_question", None)
+    return record
+
+
+async def answer_questions(
+    questions: list[str],
+    graph: CompiledStateGraph | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    output: TextIO | None = None,
+) -> list[dict[str, Any]]:
+    """Responde uma lista de perguntas em paralelo, com concorrência limitada.
+
+    Até `max_concurrency` perguntas percorrem o grafo ao mesmo tempo (os nós
+    assíncronos liberam o loop de eventos enquanto esperam o LLM). Se `output`
+    for informado, cada registro é gravado como uma linha JSONL assim que a
+    pergunta termina (ordem de conclusão; use o campo "index" para reordenar).
+
+    Args:
+        questions (list[str]): As perguntas do lote.
+        graph (CompiledStateGraph | None): O workflow; por padrão, `get_graph()`.
+        max_concurrency (int): Máximo de perguntas em andamento ao mesmo tempo.
+        output (TextIO | None): Destino opcional das linhas JSONL.
+
+    Returns:
+        list[dict[str, Any]]: Um registro por pergunta, na ordem da entrada.
+
+    Raises:
+        ValueError: Se `max_concurrency` for menor que 1.
+
+    """
+    if max_concurrency < 1:
+        raise ValueError(ERROR_INVALID_CONCURRENCY)
+    graph = graph or get_graph()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(index: int, question: str) -> dict[str, Any]:
+        async with semaphore:
+            record = await answer_question(graph, index, question)
+        if output is not None:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+        return record
+
+    return await asyncio.gather(*starmap(run_one, enumerate(questions)))
+
+
 # ! ==============================================================================
-# ! 8. FUNÇÃO PRINCIPAL
+# ! 10. FUNÇÃO PRINCIPAL
 # ! ==============================================================================
+def parse_args() -> argparse.Namespace:
+    """Lê as opções de linha de comando (modo lote).
+
+    Returns:
+        argparse.Namespace: As opções `questions`, `output` e `max_concurrency`.
+
+    """
+    parser = argparse.ArgumentParser(description="Assistente de perguntas de Python.")
+    parser.add_argument(
+        "--questions",
+        type=Path,
+        help="Arquivo de perguntas (.txt, uma por linha, ou .jsonl com 'question'). "
+        "Sem esta opção, responde a pergunta de exemplo.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(DEFAULT_OUTPUT_PATH),
+        help="Arquivo JSONL de saída do modo lote.",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Máximo de perguntas processadas ao mesmo tempo.",
+    )
+    return parser.parse_args()
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Responde o arquivo de perguntas e grava os registros em JSONL."""
+    questions = load_questions(args.questions)
+    logger.info(
+        "Processando %d perguntas (concorrência máxima: %d)",
+        len(questions),
+        args.max_concurrency,
+    )
+    start = time.perf_counter()
+    with args.output.open("w", encoding="utf-8") as output:
+        records = asyncio.run(
+            answer_questions(
+                questions, max_concurrency=args.max_concurrency, output=output
+            )
+        )
+    elapsed = time.perf_counter() - start
+    errors = sum(record["status"] == "error" for record in records)
+    logger.info(
+        "Lote concluído: %d perguntas, %d erros, %.2fs (%.2f perguntas/s) -> %s",
+        len(records),
+        errors,
+        elapsed,
+        len(records) / elapsed if elapsed else 0.0,
+        args.output,
+    )
+    logger.info("Caminho rápido: %s", fast_path_stats.summary())
+    if errors:
+        sys.exit(1)
+
+
 def main() -> None:
     """Função principal que executa o assistente de perguntas.
 
+    Com `--questions`, responde um arquivo de perguntas em lote (assíncrono);
+    sem opções, responde a pergunta de exemplo.
+
     Raises:
         ValueError: Se a pergunta do usuário estiver vazia.
 
     """  # ! CORREÇÃO: Docstring completa
+    args = parse_args()
     logger.info("Inicializando o Agente Assistente de Perguntas...")
+    if args.questions is not None:
+        run_batch(args)
+        return
 
     pergunta_usuario = (
         "Como eu consigo medir o tempo de execução de um código em python, "
@@ -250,8 +898,7 @@ def main() -> None:
         raise ValueError(ERROR_USER_QUESTION_EMPTY)
 
     try:
-        language_model = setup_llm()
-        question_assistant_agent = create_graph(language_model)
+        question_assistant_agent = get_graph()
         initial_state = {"original_question": pergunta_usuario}
         logger.info("Processando pergunta: %s...", pergunta_usuario[:100])
         final_state = question_assistant_agent.invoke(initial_state)
@@ -265,7 +912,8 @@ def main() -> None:
         print("=" * 50)
 
         logger.info("Execução concluída com sucesso")
-    except (ValueError, TypeError, LangChainError) as e:
+        logger.info("Caminho rápido: %s", fast_path_stats.summary())
+    except (ValueError, TypeError, LangChainException) as e:
         logger.exception("Ocorreu um erro controlado durante a execução")
         print(f"\nERRO: {e}")
         sys.exit(1)
@@ -276,7 +924,7 @@ def main() -> None:
 
 
 # ! ==============================================================================
-# ! 9. BLOCO DE EXECUÇÃO
+# ! 11. BLOCO DE EXECUÇÃO
 # ! ==============================================================================
 if __name__ == "__main__":
     main()
@@ -0,0 +1,50 @@
+"""Fused Question Enhancer + Knowledge Boundary Agent
+==================================================
+
+Replaces the two sequential LLM calls (EnhancedQuestion, then ScopeDecision)
+with a single structured output call that returns both fields.
+"""
+
+from ..core.models import EnhancedScopedQuestion
+from ..core.node_cache import cached
+from ..core.prompts import enhance_and_scope_prompt
+from ..core.settings import get_llm_factory
+from ..core.state import AgentState
+
+
+def enhance_and_scope_node(state: AgentState) -> dict[str, str | bool]:
+    """Enhances the question and decides its scope in one structured output call."""
+    print("--- 🧠🚪 EXECUTANDO NÓ: Aprimorar Pergunta + Validar Domínio (Fundido) ---")
+
+    original_question = state["original_question"]
+    specialization = state["specialization"]
+
+    fused_chain = get_llm_factory().create_structured_chain(
+        enhance_and_scope_prompt, EnhancedScopedQuestion, temperature=0.0
+    )
+
+    result = cached(
+        "enhance_and_scope",
+        (original_question, specialization),
+        lambda: fused_chain.invoke(
+            {"question": original_question, "specialization": specialization}
+        ).model_dump(),
+    )
+
+    print(f"Original: '{original_question}'")
+    print(f"Aprimorada (Limpa): '{result['enhanced_question']}'")
+    print(
+        f"A pergunta está no escopo de '{specialization}'? -> {result['is_in_scope']}"
+    )
+
+    return {
+        "enhanced_question": result["enhanced_question"],
+        "is_in_scope": result["is_in_scope"],
+    }
+
+
+def route_on_scope(state: AgentState) -> str:
+    """Routes on the scope decision stored in the state by the node that made it."""
+    if state.get("is_in_scope"):
+        return "in_scope"
+    return "out_of_scope"
@@ -1,31 +1,90 @@
-"""Knowledge Boundary Agent using Structured Output"""
+"""Knowledge Boundary Agent using Structured Output
+
+Runs as a cascade: the local scope classifier decides the obvious cases and the
+LLM is consulted only when its score falls in the uncertain band (or when the
+specialization has no calibrated profile yet). Every LLM decision is logged as
+labeled data for the offline calibration command.
+"""
 
 from ..core.models import ScopeDecision
+from ..core.node_cache import cached
 from ..core.prompts import boundary_check_prompt
-from ..core.settings import get_llm_factory
+from ..core.scope_classifier import (
+    LabeledDecision,
+    append_decision,
+    get_scope_classifier,
+)
+from ..core.settings import get_llm_factory, get_settings
 from ..core.state import AgentState
 
 
-def boundary_check_node(state: AgentState) -> str:
-    """Checks if the enhanced question is within scope using structured output."""
-    print("--- 🚪 EXECUTANDO NÓ: Validador de Domínio (Estruturado) ---")
+def llm_scope_decision(question: str, specialization: str) -> bool:
+    """Asks the LLM whether the question is within scope and logs the decision."""
+    # Chain memoizada pela factory: o cliente e a chain são criados uma única vez
+    boundary_chain = get_llm_factory().create_structured_chain(
+        boundary_check_prompt, ScopeDecision, temperature=0.0
+    )
+
+    decision_result = boundary_chain.invoke(
+        {"question": question, "specialization": specialization}
+    )
 
-    enhanced_question = state["enhanced_question"]
-    specialization = state["specialization"]
+    decisions_path = get_settings().scope_decisions_path
+    if decisions_path:
+        append_decision(
+            decisions_path,
+            LabeledDecision(question, specialization, decision_result.is_in_scope),
+        )
+    return decision_result.is_in_scope
 
-    llm_factory = get_llm_factory()
-    boundary_llm = llm_factory.create_llm(temperature=0.0)
 
-    structured_llm = boundary_llm.with_structured_output(ScopeDecision)
-    boundary_chain = boundary_check_prompt | structured_llm
+def decide_scope(question: str, specialization: str) -> bool:
+    """Returns the scope decision, from the node cache or the scope cascade."""
+    cache_hit = True
 
-    decision_result = boundary_chain.invoke(
-        {"question": enhanced_question, "specialization": specialization}
+    def run_cascade() -> bool:
+        nonlocal cache_hit
+        cache_hit = False
+        return scope_cascade(question, specialization)
+
+    is_in_scope = cached("boundary_check", (question, specialization), run_cascade)
+    if cache_hit:
+        print(
+            f"A pergunta está no escopo de '{specialization}'? -> {is_in_scope} (cache)"
+        )
+    return is_in_scope
+
+
+def scope_cascade(question: str, specialization: str) -> bool:
+    """Runs the scope cascade (local classifier, then LLM) and returns the decision."""
+    classifier = get_scope_classifier()
+    score = classifier.score(question, specialization) if classifier else None
+    is_in_scope = classifier.decide(score) if classifier else None
+
+    if is_in_scope is None:
+        is_in_scope = llm_scope_decision(question, specialization)
+        if classifier:
+            classifier.record(score, None, is_in_scope)
+        source = "LLM"
+    else:
+        classifier.record(score, is_in_scope)
+        source = f"classificador local, score={score:.2f}"
+
+    print(
+        f"A pergunta está no escopo de '{specialization}'? -> {is_in_scope} ({source})"
     )
+    return is_in_scope
 
-    is_in_scope = decision_result.is_in_scope
-    print(f"A pergunta está no escopo de '{specialization}'? -> {is_in_scope}")
 
-    if is_in_scope:
-        return "in_scope"
-    return "out_of_scope"
+def boundary_check_node(state: AgentState) -> dict[str, bool]:
+    """Checks if the enhanced question is within scope using structured output.
+
+    A regular node (not a router): the decision is written to `is_in_scope` and
+    the graph routes on it with `route_on_scope`. Because it has its own
+    checkpointed task, a run that fails here is resumed by re-running the check.
+    """
+    print("--- 🚪 EXECUTANDO NÓ: Validador de Domínio (Estruturado) ---")
+
+    return {
+        "is_in_scope": decide_scope(state["enhanced_question"], state["specialization"])
+    }
@@ -8,6 +8,7 @@ This module contains the node for enhancing user questions.
 # from langchain_core.output_parsers import StrOutputParser
 
 from ..core.models import EnhancedQuestion  # <-- Importar nosso novo modelo
+from ..core.node_cache import cached
 from ..core.prompts import enhancer_prompt
 from ..core.settings import get_llm_factory
 from ..core.state import AgentState
@@ -20,26 +21,34 @@ def enhance_question_node(state: AgentState) -> dict[str, str]:
     original_question = state["original_question"]
     specialization = state["specialization"]
 
-    llm_factory = get_llm_factory()
-    # Usamos o create_llm normal e adicionamos a lógica de structured output
-    enhancer_llm = llm_factory.create_llm(temperature=0.1)
-
     # É AQUI QUE A MÁGICA ACONTECE
-    # Forçamos o LLM a preencher nosso modelo EnhancedQuestion
-    structured_llm = enhancer_llm.with_structured_output(EnhancedQuestion)
+    # Forçamos o LLM a preencher nosso modelo EnhancedQuestion.
+    # A chain (prompt | structured_llm) é memoizada pela factory, então só é
+    # construída na primeira pergunta; ela retorna um objeto EnhancedQuestion.
+    enhancer_chain = get_llm_factory().create_structured_chain(
+        enhancer_prompt, EnhancedQuestion, temperature=0.1
+    )
 
-    # A chain agora retorna um objeto EnhancedQuestion, não mais uma string
-    enhancer_chain = enhancer_prompt | structured_llm
+    # Executamos a chain e extraímos a string limpa do objeto de resultado.
+    # Perguntas repetidas (mesmo texto normalizado e especialização) vêm do cache.
+    cache_hit = True
 
-    # Executamos a chain
-    enhancement_result = enhancer_chain.invoke(
-        {"question": original_question, "specialization": specialization}
-    )
+    def enhance() -> str:
+        nonlocal cache_hit
+        cache_hit = False
+        enhancement_result = enhancer_chain.invoke(
+            {"question": original_question, "specialization": specialization}
+        )
+        return enhancement_result.enhanced_question
 
-    # Extraímos a string limpa do objeto de resultado
-    clean_enhanced_question = enhancement_result.enhanced_question
+    clean_enhanced_question = cached(
+        "enhancer", (original_question, specialization), enhance
+    )
 
     print(f"Original: '{original_question}'")
-    print(f"Aprimorada (Limpa): '{clean_enhanced_question}'")
+    print(
+        f"Aprimorada (Limpa): '{clean_enhanced_question}'"
+        + (" (cache)" if cache_hit else "")
+    )
 
     return {"enhanced_question": clean_enhanced_question}
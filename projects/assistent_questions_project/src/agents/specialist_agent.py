@@ -4,13 +4,43 @@ This module contains the node for generating an expert response.
 """
 
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable, RunnableConfig
 
 # A correção está aqui: importamos a variável correta de prompts.py
 from ..core.prompts import specialist_chat_prompt
-from ..core.settings import get_llm_factory
+from ..core.node_cache import cached
+from ..core.settings import get_llm_factory, get_settings
 from ..core.state import AgentState
 
 
+def get_specialist_chain() -> Runnable:
+    """Returns the memoized specialist chain (prompt | llm | StrOutputParser)."""
+    llm_factory = get_llm_factory()
+
+    # A chain usa o ChatPromptTemplate importado e é montada uma única vez
+    return llm_factory.get_or_build_runnable(
+        "specialist",
+        lambda: specialist_chat_prompt
+        | llm_factory.create_specialist_llm()
+        | StrOutputParser(),
+    )
+
+
+def answer_question(
+    question: str, specialization: str, config: RunnableConfig | None = None
+) -> str:
+    """Runs the specialist chain (served from the node cache when enabled)."""
+
+    def generate() -> str:
+        return get_specialist_chain().invoke(
+            {"question": question, "specialization": specialization}, config=config
+        )
+
+    if not get_settings().cache_specialist_answers:
+        return generate()
+    return cached("specialist", (question, specialization), generate)
+
+
 def specialist_node(state: AgentState) -> dict[str, str]:
     """Generates a final answer using a ChatPromptTemplate."""
     print("--- 🧑‍🏫 EXECUTANDO NÓ: Gerar Resposta do Especialista ---")
@@ -18,14 +48,6 @@ def specialist_node(state: AgentState) -> dict[str, str]:
     enhanced_question = state["enhanced_question"]
     specialization = state["specialization"]
 
-    llm_factory = get_llm_factory()
-    specialist_llm = llm_factory.create_specialist_llm()
-
-    # A chain agora usa o ChatPromptTemplate importado
-    chain = specialist_chat_prompt | specialist_llm | StrOutputParser()
-
-    final_answer = chain.invoke(
-        {"question": enhanced_question, "specialization": specialization}
-    )
+    final_answer = answer_question(enhanced_question, specialization)
 
     return {"answer": final_answer}
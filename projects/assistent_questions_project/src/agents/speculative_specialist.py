@@ -0,0 +1,150 @@
+"""Speculative Specialist Agent
+============================
+
+Most questions are in scope, so waiting for the scope check before starting the
+specialist wastes the whole scope-check latency. This node starts the specialist
+call concurrently with the scope check and commits its answer when the question
+is in scope; otherwise the specialist is cancelled (or, if its HTTP request is
+already in flight, its result is discarded) and the graph routes to
+`out_of_scope_node`.
+
+`get_speculation_stats()` reports the extra token spend of discarded
+speculations against the latency saved by committed ones.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from langchain_core.callbacks import get_usage_metadata_callback
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
+
+from ..core.state import AgentState
+from .knowledge_boundary import decide_scope
+from .specialist_agent import answer_question
+
+SpecialistResult = tuple[str, int, float]  # (answer, total tokens, seconds)
+
+
+class SpeculationStats:
+    """Thread-safe counters for speculative specialist executions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.speculations = 0
+        self.committed = 0
+        self.cancelled_before_start = 0
+        self.discarded = 0
+        self.committed_tokens = 0
+        self.wasted_tokens = 0
+        self.latency_saved_s = 0.0
+
+    def record_committed(self, tokens: int, latency_saved_s: float) -> None:
+        with self._lock:
+            self.speculations += 1
+            self.committed += 1
+            self.committed_tokens += tokens
+            self.latency_saved_s += latency_saved_s
+
+    def record_cancelled(self) -> None:
+        with self._lock:
+            self.speculations += 1
+            self.cancelled_before_start += 1
+
+    def record_discarded(self) -> None:
+        with self._lock:
+            self.speculations += 1
+            self.discarded += 1
+
+    def record_wasted_tokens(self, tokens: int) -> None:
+        with self._lock:
+            self.wasted_tokens += tokens
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of the counters, with commit rate and token overhead."""
+        with self._lock:
+            total_tokens = self.committed_tokens + self.wasted_tokens
+            return {
+                "speculations": self.speculations,
+                "committed": self.committed,
+                "cancelled_before_start": self.cancelled_before_start,
+                "discarded": self.discarded,
+                "commit_rate": (
+                    self.committed / self.speculations if self.speculations else 0.0
+                ),
+                "wasted_tokens": self.wasted_tokens,
+                "token_overhead": (
+                    self.wasted_tokens / total_tokens if total_tokens else 0.0
+                ),
+                "latency_saved_s": round(self.latency_saved_s, 3),
+                "mean_latency_saved_s": (
+                    self.latency_saved_s / self.committed if self.committed else 0.0
+                ),
+            }
+
+
+speculation_stats = SpeculationStats()
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="speculative")
+
+
+def get_speculation_stats() -> SpeculationStats:
+    """Get the global speculation counters."""
+    return speculation_stats
+
+
+def _run_specialist(
+    inputs: dict[str, str], config: RunnableConfig | None
+) -> SpecialistResult:
+    start = time.perf_counter()
+    with get_usage_metadata_callback() as usage:
+        answer = answer_question(
+            inputs["question"], inputs["specialization"], config=config
+        )
+    tokens = sum(u.get("total_tokens", 0) for u in usage.usage_metadata.values())
+    return answer, tokens, time.perf_counter() - start
+
+
+def _account_discarded(future: Future[SpecialistResult]) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, tokens, _ = future.result()
+    speculation_stats.record_wasted_tokens(tokens)
+
+
+def speculative_specialist_node(
+    state: AgentState, config: RunnableConfig | None = None
+) -> dict[str, str | bool]:
+    """Runs the scope check and the specialist concurrently."""
+    print(
+        "--- 🚪🧑‍🏫 EXECUTANDO NÓ: Validador de Domínio + Especialista (Especulativo) ---"
+    )
+
+    enhanced_question = state["enhanced_question"]
+    specialization = state["specialization"]
+    inputs = {"question": enhanced_question, "specialization": specialization}
+
+    start = time.perf_counter()
+    # The worker thread sees the caller's context (tracing, usage callbacks)
+    specialist = _executor.submit(
+        contextvars.copy_context().run, _run_specialist, inputs, config
+    )
+    is_in_scope = decide_scope(enhanced_question, specialization)
+    scope_check_s = time.perf_counter() - start
+    # Lets streaming consumers release (or drop) the specialist tokens held so far
+    get_stream_writer()({"speculative_scope": is_in_scope})
+
+    if not is_in_scope:
+        if specialist.cancel():
+            speculation_stats.record_cancelled()
+        else:
+            # Already in flight: let it finish in the background and count its tokens
+            speculation_stats.record_discarded()
+            specialist.add_done_callback(_account_discarded)
+        return {"is_in_scope": False}
+
+    answer, tokens, specialist_s = specialist.result()
+    # Sequential would be scope_check_s + specialist_s; the overlap is what we saved
+    speculation_stats.record_committed(tokens, min(scope_check_s, specialist_s))
+    return {"is_in_scope": True, "answer": answer}
@@ -0,0 +1 @@
+"""Benchmarks for the Assistant Questions Project."""
@@ -0,0 +1,111 @@
+"""A/B Comparison: Fused vs Two-Call Enhancement + Scope Check
+==========================================================
+
+Runs the same questions through both workflow variants and reports latency
+(p50/p95 per question) and routing agreement (how often both variants send the
+question to the same node).
+
+Run from the `projects` directory:
+
+    python -m assistent_questions_project.src.benchmarks.ab_fused_scope
+    python -m assistent_questions_project.src.benchmarks.ab_fused_scope --dataset questions.jsonl
+
+The dataset is a JSONL file with one {"question": ..., "specialization": ...}
+object per line. Without it, a small built-in sample is used.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import time
+from pathlib import Path
+
+from ..core.state import AgentState
+from ..graph.workflow import build_workflow
+
+SAMPLE_QUESTIONS = [
+    ("what is a dict?", "Python"),
+    ("how do I reverse a list?", "Python"),
+    ("what is the meaning of life?", "Python"),
+    ("how does a Kubernetes liveness probe work?", "DevOps"),
+    ("what's the best pizza in Naples?", "DevOps"),
+    ("explain p-values", "Data Science"),
+    ("how do I change my car's oil?", "Data Science"),
+    ("what is compound interest?", "Finance"),
+]
+
+
+def load_questions(dataset: str | None) -> list[tuple[str, str]]:
+    """Load (question, specialization) pairs from a JSONL file or the built-in sample."""
+    if dataset is None:
+        return SAMPLE_QUESTIONS
+    with Path(dataset).open(encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [(r["question"], r["specialization"]) for r in records]
+
+
+def run_question(app, question: str, specialization: str) -> tuple[float, str]:
+    """Run one question and return (latency in seconds, routed node)."""
+    initial_state: AgentState = {
+        "original_question": question,
+        "specialization": specialization,
+        "enhanced_question": "",
+        "answer": "",
+    }
+    route = "error"
+    start = time.perf_counter()
+    # The nodes print their progress; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        for event in app.stream(initial_state):
+            node_name = next(iter(event))
+            if node_name in ("specialist", "out_of_scope"):
+                route = node_name
+    return time.perf_counter() - start, route
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(pct / 100 * len(ordered)))
+    return ordered[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", help="JSONL file with question/specialization pairs")
+    args = parser.parse_args()
+
+    questions = load_questions(args.dataset)
+    variants = {"two_calls": build_workflow(fused=False), "fused": build_workflow(fused=True)}
+    latencies: dict[str, list[float]] = {name: [] for name in variants}
+    routes: dict[str, list[str]] = {name: [] for name in variants}
+
+    for question, specialization in questions:
+        # Alternate the order so neither variant always runs on a warm connection
+        order = list(variants) if len(routes["fused"]) % 2 == 0 else list(reversed(variants))
+        for name in order:
+            latency, route = run_question(variants[name], question, specialization)
+            latencies[name].append(latency)
+            routes[name].append(route)
+        print(
+            f"[{specialization}] {question!r}: "
+            f"two_calls -> {routes['two_calls'][-1]}, fused -> {routes['fused'][-1]}"
+        )
+
+    print("\n📊 Latency per question (s)")
+    for name, values in latencies.items():
+        print(
+            f"   {name:<10} p50={statistics.median(values):.2f}  "
+            f"p95={percentile(values, 95):.2f}  mean={statistics.fmean(values):.2f}"
+        )
+
+    agreements = sum(a == b for a, b in zip(routes["two_calls"], routes["fused"], strict=True))
+    print(
+        f"\n🔀 Routing agreement: {agreements}/{len(questions)} "
+        f"({agreements / len(questions):.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
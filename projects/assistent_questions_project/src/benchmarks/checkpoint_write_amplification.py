@@ -0,0 +1,145 @@
+"""Checkpoint Write Amplification: msgpack vs JSON
+==============================================
+
+Measures what persisting the workflow state costs per graph step with the SQLite
+checkpointer. The graph replays the real topology (enhancer -> specialist) with
+nodes that write texts of realistic size, so no LLM is called. It compares
+msgpack and JSON with a checkpoint per node, and msgpack with
+`checkpoint_during=False` (one checkpoint when the run ends). For each it reports:
+
+- state delta: bytes the input and the nodes actually produced per step (JSON)
+- serialized: checkpoint + pending-write bytes per step, and their ratio to the
+  delta (logical amplification)
+- disk: WAL bytes appended per step, i.e. whole SQLite pages (physical
+  amplification)
+- runs/s with checkpointing on
+
+Run from the `projects` directory:
+
+    python -m assistent_questions_project.src.benchmarks.checkpoint_write_amplification
+    python -m assistent_questions_project.src.benchmarks.checkpoint_write_amplification \\
+        --runs 2000 --answer-chars 4000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.graph import END, StateGraph
+
+from ..core.checkpointing import create_checkpointer, new_thread_config
+from ..core.state import AgentState
+
+
+class JsonSerializer:
+    """Plain JSON serde, the verbose baseline."""
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        return "json", json.dumps(obj, default=str).encode("utf-8")
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return json.loads(data[1])
+
+
+def build_replay_graph(checkpointer, answer_chars: int):
+    """Same nodes and state as the workflow, with fixed-size outputs."""
+
+    def enhancer(state: AgentState) -> dict[str, str]:
+        return {"enhanced_question": f"Explain {state['original_question']} " * 8}
+
+    def specialist(state: AgentState) -> dict[str, str]:
+        return {"answer": ("lorem ipsum " * answer_chars)[:answer_chars]}
+
+    workflow = StateGraph(AgentState)
+    workflow.add_node("enhancer", enhancer)
+    workflow.add_node("specialist", specialist)
+    workflow.set_entry_point("enhancer")
+    workflow.add_edge("enhancer", "specialist")
+    workflow.add_edge("specialist", END)
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def wal_size(db_path: Path) -> int:
+    wal = db_path.with_name(db_path.name + "-wal")
+    return wal.stat().st_size if wal.exists() else 0
+
+
+def measure(
+    name: str,
+    serde,
+    checkpoint_during: bool,
+    runs: int,
+    answer_chars: int,
+    workdir: Path,
+) -> None:
+    db_path = workdir / f"{name}.sqlite"
+    checkpointer = create_checkpointer(str(db_path), serde=serde)
+    # Keep every appended frame in the WAL so its growth is the bytes written
+    checkpointer.conn.execute("PRAGMA wal_autocheckpoint=0")
+    app = build_replay_graph(checkpointer, answer_chars)
+
+    delta_bytes = 0
+    steps = 0
+    wal_before = wal_size(db_path)
+    start = time.perf_counter()
+    for i in range(runs):
+        initial_state: AgentState = {
+            "original_question": f"what is a dict? #{i}",
+            "specialization": "Python",
+            "enhanced_question": "",
+            "answer": "",
+        }
+        # The input is a step too: it is written once per run
+        delta_bytes += len(json.dumps(initial_state).encode())
+        steps += 1
+        for update in app.stream(
+            initial_state, new_thread_config(), checkpoint_during=checkpoint_during
+        ):
+            delta_bytes += len(json.dumps(next(iter(update.values()))).encode())
+            steps += 1
+    elapsed = time.perf_counter() - start
+    wal_bytes = wal_size(db_path) - wal_before
+
+    stats = checkpointer.serde.stats()
+    serialized = stats["checkpoint_bytes"] + stats["write_bytes"]
+    print(
+        f"   {name:<12} delta={delta_bytes / steps:>8.0f} B/step  "
+        f"serialized={serialized / steps:>8.0f} B/step "
+        f"(x{serialized / delta_bytes:.2f})  "
+        f"disk={wal_bytes / steps:>8.0f} B/step (x{wal_bytes / delta_bytes:.2f})  "
+        f"{runs / elapsed:>7.0f} runs/s"
+    )
+    checkpointer.conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=500)
+    parser.add_argument(
+        "--answer-chars", type=int, default=2000, help="Size of the specialist answer"
+    )
+    args = parser.parse_args()
+
+    print(f"📦 {args.runs} runs, answer of {args.answer_chars} chars")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, serde, checkpoint_during in (
+            ("msgpack", JsonPlusSerializer(), True),
+            ("json", JsonSerializer(), True),
+            ("msgpack-exit", JsonPlusSerializer(), False),
+        ):
+            measure(
+                name,
+                serde,
+                checkpoint_during,
+                args.runs,
+                args.answer_chars,
+                Path(workdir),
+            )
+
+
+if __name__ == "__main__":
+    main()
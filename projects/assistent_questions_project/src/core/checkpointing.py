@@ -0,0 +1,156 @@
+"""Checkpointing for the Assistant Questions Project
+===============================================
+
+Optional SQLite checkpointer for the compiled workflow. With it, every completed
+node is persisted under the run's `thread_id`, so a run that fails mid-graph
+(e.g. the specialist call times out) resumes from the last completed node
+instead of paying for the enhancement again:
+
+    app.invoke(initial_state, config)  # raises after the enhancer finished
+    app.invoke(None, config)           # same thread_id: only the rest runs
+
+State is serialized with msgpack (LangGraph's `JsonPlusSerializer`), which is
+more compact and faster than JSON. `MeteredSerializer` counts the bytes of every
+checkpoint and pending write so the write amplification per step can be
+reported (`get_checkpointer().serde.stats()`).
+
+Keeping writes small for high QPS:
+- The database uses 1 KiB pages. Every commit rewrites whole pages in the WAL,
+  and the checkpoint rows are small, so smaller pages write less to disk per
+  step (about 2.3x less than 4 KiB pages in `checkpoint_write_amplification`).
+- `synchronous=NORMAL` skips the fsync on every commit, which WAL makes safe.
+- With `checkpoint_every_step=False`, runs use `checkpoint_during=False`: one
+  checkpoint is saved when the run ends or fails, instead of one per node plus
+  every pending write. A failed run still resumes from the last completed
+  node, but a killed process loses the run.
+
+Example:
+    ```python
+    checkpointer = get_checkpointer()
+    app = build_workflow(checkpointer=checkpointer)
+    config = new_thread_config()
+    app.invoke(initial_state, config)
+    print(checkpointer.serde.stats())
+    ```
+
+"""
+
+import sqlite3
+import threading
+import uuid
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from .settings import get_settings
+
+PAGE_SIZE = 1024
+
+
+class MeteredSerializer(SerializerProtocol):
+    """Wraps a serializer and counts the bytes it produces.
+
+    Each checkpoint (`put`) serializes the whole state once, and each node's
+    output (`put_writes`) is serialized once per written channel.
+    """
+
+    def __init__(self, inner: SerializerProtocol | None = None) -> None:
+        self.inner = inner or JsonPlusSerializer()
+        self._lock = threading.Lock()
+        self.checkpoints = 0
+        self.checkpoint_bytes = 0
+        self.writes = 0
+        self.write_bytes = 0
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.inner.dumps_typed(obj)
+        with self._lock:
+            # Checkpoints are the only dicts carrying channel_values
+            if isinstance(obj, dict) and "channel_values" in obj:
+                self.checkpoints += 1
+                self.checkpoint_bytes += len(data)
+            else:
+                self.writes += 1
+                self.write_bytes += len(data)
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.inner.loads_typed(data)
+
+    # SerializerProtocol also declares the untyped pair; keep them delegating
+    def dumps(self, obj: Any) -> bytes:
+        return self.inner.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.inner.loads(data)
+
+    def stats(self) -> dict[str, float]:
+        """Checkpoint and write counts and their serialized bytes."""
+        with self._lock:
+            total = self.checkpoint_bytes + self.write_bytes
+            return {
+                "checkpoints": self.checkpoints,
+                "writes": self.writes,
+                "checkpoint_bytes": self.checkpoint_bytes,
+                "write_bytes": self.write_bytes,
+                "bytes_per_checkpoint": (
+                    total / self.checkpoints if self.checkpoints else 0.0
+                ),
+            }
+
+
+def create_checkpointer(
+    path: str, serde: SerializerProtocol | None = None
+) -> SqliteSaver:
+    """Open a SQLite checkpointer tuned for many small writes.
+
+    Args:
+        path: SQLite database file (":memory:" for a throwaway one)
+        serde: Serializer for checkpoints and writes (metered msgpack by default)
+
+    Returns:
+        SqliteSaver: Checkpointer whose `serde` is a `MeteredSerializer`
+
+    """
+    conn = sqlite3.connect(path, check_same_thread=False)
+    # Only applies to a new database, and must come before WAL is enabled
+    conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+    checkpointer = SqliteSaver(conn, serde=MeteredSerializer(serde))
+    checkpointer.setup()  # Creates the tables and switches to WAL
+    # With WAL, NORMAL only fsyncs at checkpoints: one fewer fsync per commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return checkpointer
+
+
+def new_thread_config() -> RunnableConfig:
+    """Config for a new resumable run (one thread per question)."""
+    return {"configurable": {"thread_id": str(uuid.uuid4())}}
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+checkpointer: SqliteSaver | None = None
+_checkpointer_loaded = False
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> SqliteSaver | None:
+    """Get the checkpointer configured in settings (singleton).
+
+    Returns:
+        SqliteSaver | None: None when `checkpoint_path` is not set
+
+    """
+    global checkpointer, _checkpointer_loaded  # noqa: PLW0603
+    with _checkpointer_lock:
+        if not _checkpointer_loaded:
+            settings = get_settings()
+            if settings.checkpoint_path:
+                checkpointer = create_checkpointer(settings.checkpoint_path)
+            _checkpointer_loaded = True
+    return checkpointer
@@ -25,3 +25,16 @@ class ScopeDecision(BaseModel):
         ...,
         description="True if the question is within the specialist's scope, False otherwise.",
     )
+
+
+class EnhancedScopedQuestion(BaseModel):
+    """Data model for the fused enhancement + scope decision (single LLM call)."""
+
+    enhanced_question: str = Field(
+        ...,
+        description="The clear, specific, and enhanced version of the user's original question.",
+    )
+    is_in_scope: bool = Field(
+        ...,
+        description="True if the original question is within the specialist's scope, False otherwise.",
+    )
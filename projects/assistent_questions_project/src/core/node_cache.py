@@ -0,0 +1,175 @@
+"""Node-Level Cache for the Assistant Questions Project
+===================================================
+
+SQLite-backed memoization of node results with a TTL. Users often resubmit the
+same question under the same specialization; with the cache, the enhancement,
+the scope decision and (optionally) the specialist answer are served from disk
+without calling the LLM.
+
+Keys are built from normalized inputs (case, surrounding and repeated whitespace
+are ignored) plus the configured model name, so switching models never serves
+answers produced by another one. Hits and misses are counted per node.
+
+Example:
+    ```python
+    cache = get_node_cache()
+    enhanced = cache.cached(
+        "enhancer", (question, specialization), lambda: run_enhancer(question)
+    )
+    print(cache.stats())
+    ```
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .settings import get_settings
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+def normalize(text: str) -> str:
+    """Normalize a key component: lowercase with collapsed whitespace."""
+    return " ".join(text.lower().split())
+
+
+class NodeCache:
+    """Thread-safe SQLite cache of JSON-serializable node results with a TTL."""
+
+    def __init__(self, path: str | Path, ttl_seconds: float, salt: str = "") -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Lifetime of each entry
+            salt: Extra key component (e.g. the model name)
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.salt = salt
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS node_cache ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+
+    def _key(self, parts: Sequence[str]) -> str:
+        payload = json.dumps([self.salt, *(normalize(p) for p in parts)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, parts: Sequence[str]) -> Any:
+        """Return the cached value, or `_MISSING` (counting the hit or miss)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM node_cache"
+                " WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (namespace, self._key(parts), time.time()),
+            ).fetchone()
+            if row is None:
+                self._misses[namespace] += 1
+                return _MISSING
+            self._hits[namespace] += 1
+        return json.loads(row[0])
+
+    def set(self, namespace: str, parts: Sequence[str], value: Any) -> None:
+        """Store a JSON-serializable value for `ttl_seconds`."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO node_cache VALUES (?, ?, ?, ?)",
+                (
+                    namespace,
+                    self._key(parts),
+                    json.dumps(value, ensure_ascii=False),
+                    time.time() + self.ttl_seconds,
+                ),
+            )
+
+    def cached(
+        self, namespace: str, parts: Sequence[str], compute: Callable[[], T]
+    ) -> T:
+        """Return the cached value for `parts`, computing and storing it on a miss."""
+        value = self.get(namespace, parts)
+        if value is _MISSING:
+            value = compute()
+            self.set(namespace, parts, value)
+        return value
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM node_cache WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Hits, misses and hit rate per node namespace."""
+        with self._lock:
+            namespaces = sorted(set(self._hits) | set(self._misses))
+            return {
+                ns: {
+                    "hits": self._hits[ns],
+                    "misses": self._misses[ns],
+                    "hit_rate": self._hits[ns] / (self._hits[ns] + self._misses[ns]),
+                }
+                for ns in namespaces
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# GLOBAL INSTANCE
+# =============================================================================
+
+node_cache: NodeCache | None = None
+_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def get_node_cache() -> NodeCache | None:
+    """Get the node cache configured in settings (singleton).
+
+    Returns:
+        NodeCache | None: None when `node_cache_path` is not set
+
+    """
+    global node_cache, _cache_loaded  # noqa: PLW0603
+    with _cache_lock:
+        if not _cache_loaded:
+            settings = get_settings()
+            if settings.node_cache_path:
+                node_cache = NodeCache(
+                    settings.node_cache_path,
+                    settings.node_cache_ttl_seconds,
+                    salt=settings.llm_model,
+                )
+                node_cache.purge_expired()
+            _cache_loaded = True
+    return node_cache
+
+
+def cached(namespace: str, parts: Sequence[str], compute: Callable[[], T]) -> T:
+    """Memoize `compute()` in the global node cache (or just run it when disabled)."""
+    cache = get_node_cache()
+    if cache is None:
+        return compute()
+    return cache.cached(namespace, parts, compute)
@@ -0,0 +1,111 @@
+"""Prompt Cache Metrics for the Assistant Questions Project
+=======================================================
+
+A LangChain callback attached by `LLMFactory` to every client it creates. For
+each LLM call it reads `usage_metadata` from the response and records, per graph
+node, the prompt tokens and how many of them were served from the provider's
+prompt cache (`input_token_details.cache_read`). For streamed calls it also
+records the time-to-first-token, so the effect of prefix-stable prompts on
+latency can be confirmed.
+
+Example:
+    ```python
+    print(get_prompt_cache_metrics().stats())
+    # {"enhancer": {"calls": 12, "input_tokens": 4100, "cached_tokens": 3072,
+    #               "cached_ratio": 0.75, "ttft_p50_s": None}, ...}
+    ```
+"""
+
+import threading
+import time
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+
+class PromptCacheMetricsHandler(BaseCallbackHandler):
+    """Accumulates prompt/cached token counts and time-to-first-token per node."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._runs: dict[UUID, tuple[str, float]] = {}
+        self._first_token_seen: set[UUID] = set()
+        self.calls: dict[str, int] = defaultdict(int)
+        self.input_tokens: dict[str, int] = defaultdict(int)
+        self.cached_tokens: dict[str, int] = defaultdict(int)
+        self.ttft_s: dict[str, list[float]] = defaultdict(list)
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node", "outside_graph")
+        with self._lock:
+            self._runs[run_id] = (node, time.perf_counter())
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            if run_id in self._first_token_seen or run_id not in self._runs:
+                return
+            self._first_token_seen.add(run_id)
+            node, start = self._runs[run_id]
+            self.ttft_s[node].append(time.perf_counter() - start)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            node, _ = self._runs.pop(run_id, ("outside_graph", 0.0))
+            self._first_token_seen.discard(run_id)
+            self.calls[node] += 1
+            for generations in response.generations:
+                for generation in generations:
+                    usage = getattr(
+                        getattr(generation, "message", None), "usage_metadata", None
+                    )
+                    if not usage:
+                        continue
+                    details = usage.get("input_token_details") or {}
+                    self.input_tokens[node] += usage.get("input_tokens", 0)
+                    self.cached_tokens[node] += details.get("cache_read", 0)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
+            self._first_token_seen.discard(run_id)
+
+    def stats(self) -> dict[str, dict[str, float | None]]:
+        """Per-node calls, prompt tokens, cached tokens, cached ratio and TTFT p50."""
+        with self._lock:
+            report = {}
+            for node in sorted(self.calls):
+                ttfts = sorted(self.ttft_s.get(node, []))
+                report[node] = {
+                    "calls": self.calls[node],
+                    "input_tokens": self.input_tokens[node],
+                    "cached_tokens": self.cached_tokens[node],
+                    "cached_ratio": (
+                        self.cached_tokens[node] / self.input_tokens[node]
+                        if self.input_tokens[node]
+                        else 0.0
+                    ),
+                    "ttft_p50_s": ttfts[len(ttfts) // 2] if ttfts else None,
+                }
+            return report
+
+
+prompt_cache_metrics = PromptCacheMetricsHandler()
+
+
+def get_prompt_cache_metrics() -> PromptCacheMetricsHandler:
+    """Get the global prompt cache metrics handler (attached to every LLM client)."""
+    return prompt_cache_metrics
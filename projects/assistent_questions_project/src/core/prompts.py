@@ -2,10 +2,20 @@
 ===================================================
 
 This module centralizes all prompt templates used by the agents.
-Using LangChain's PromptTemplate for consistency and flexibility.
+Using LangChain's ChatPromptTemplate for consistency and flexibility.
+
+Prefix-stable layout: every prompt starts with a static system message (the long
+instructions, identical on every request) and puts the per-request variables
+(`{specialization}`, `{question}`) only in the final human message. The token
+prefix then stays the same across requests, which lets the provider reuse its
+prompt cache (OpenAI caches prefixes of 1024+ tokens) and lowers time-to-first-token.
+Do not interpolate variables into the system messages.
 """
 
-from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+from langchain_core.prompts import ChatPromptTemplate
+
+# Per-request part shared by all prompts: always the last message
+REQUEST_TEMPLATE = "Specialization: {specialization}\nQuestion: {question}"
 
 # =============================================================================
 # 1. Question Enhancement Agent Prompt
@@ -23,44 +33,49 @@ Rules:
 - The output MUST be only the reformulated question, without any preamble.
 """
 
-# ISTO ESTÁ FALTANDO: A criação do objeto PromptTemplate
-enhancer_prompt = PromptTemplate.from_template(
-    "Specialization: {specialization}\n"
-    "Original Question: {question}\n\n"
-    "Enhanced Question:"
+enhancer_prompt = ChatPromptTemplate(
+    [("system", ENHANCER_SYSTEM_PROMPT), ("human", REQUEST_TEMPLATE)]
 )
 
 # =============================================================================
 # 2. Specialist Agent Prompt (Refatorado)
 # =============================================================================
 
-SPECIALIST_SYSTEM_PROMPT = """You are a world-class expert in {specialization}.
-Your role is to provide clear, accurate, and detailed answers to user questions within your domain.
+SPECIALIST_SYSTEM_PROMPT = """You are a world-class expert in the specialization given with each question.
+Your role is to provide clear, accurate, and detailed answers to user questions within that domain.
+Based on your expertise, provide a comprehensive answer to the question.
 When appropriate, use examples, analogies, and code snippets to illustrate your points.
 Structure your answers in a readable format using markdown.
 """
 
 # Vamos combinar o prompt de sistema e o de usuário em um único template de chat
 specialist_chat_prompt = ChatPromptTemplate(
-    [
-        ("system", SPECIALIST_SYSTEM_PROMPT),
-        (
-            "human",
-            "Based on your expertise, please provide a comprehensive answer to the following question:\n\nQuestion: {question}",
-        ),
-    ]
+    [("system", SPECIALIST_SYSTEM_PROMPT), ("human", REQUEST_TEMPLATE)]
 )
 
 # =============================================================================
 # 3. Knowledge Boundary Agent Prompt
 # =============================================================================
 
-BOUNDARY_CHECK_PROMPT_TEXT = """You are a classification agent. Your task is to determine if a given question falls within the scope of a specific specialization.
+BOUNDARY_CHECK_SYSTEM_PROMPT = """You are a classification agent. Your task is to determine if a given question falls within the scope of a specific specialization.
 Respond with only 'true' if the question is within the scope, and 'false' otherwise. Do not provide any explanation.
+"""
+
+boundary_check_prompt = ChatPromptTemplate(
+    [("system", BOUNDARY_CHECK_SYSTEM_PROMPT), ("human", REQUEST_TEMPLATE)]
+)
 
-Specialization: {specialization}
-Question: {question}
+# =============================================================================
+# 4. Fused Enhancement + Knowledge Boundary Prompt
+# =============================================================================
 
-Is the question within the scope of the specialization? (true/false):"""
+ENHANCE_AND_SCOPE_SYSTEM_PROMPT = """You are an expert in reformulating questions for an AI assistant and in classifying whether they belong to a specialization.
 
-boundary_check_prompt = PromptTemplate.from_template(BOUNDARY_CHECK_PROMPT_TEXT)
+Tasks:
+1. Enhance the question to be more specific, clear, and comprehensive **strictly within the provided specialization**, without losing the original intent. Do NOT answer it.
+2. Decide if the original question falls within the scope of the specialization.
+"""
+
+enhance_and_scope_prompt = ChatPromptTemplate(
+    [("system", ENHANCE_AND_SCOPE_SYSTEM_PROMPT), ("human", REQUEST_TEMPLATE)]
+)
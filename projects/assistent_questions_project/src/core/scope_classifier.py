@@ -0,0 +1,402 @@
+"""Local Scope Classifier for the Assistant Questions Project
+=========================================================
+
+A cheap first stage in front of the LLM boundary check. Each specialization has
+two keyword profiles (centroids of normalized term-frequency vectors): one built
+from questions previously labeled as in scope, one from questions labeled as out
+of scope. A question is scored by how much closer it is to the in-scope profile:
+
+    score = cosine(question, in_scope_centroid) - cosine(question, out_of_scope_centroid)
+
+Scores at or above `upper_threshold` are decided locally as in scope, scores at
+or below `lower_threshold` as out of scope; anything in between (or an unknown
+specialization) falls back to the LLM.
+
+Labeled decisions come from the LLM itself: in a calibration run (with
+`scope_decisions_path` set) every fallback is appended to a JSONL file, and the
+offline calibration command turns that file into a classifier:
+
+    python -m assistent_questions_project.src.core.scope_classifier \\
+        --decisions scope_decisions.jsonl --output scope_classifier.json
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .settings import get_settings
+
+# =============================================================================
+# 1. CONSTANTS
+# =============================================================================
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+STOPWORDS = frozenset(
+    "the and for with that this what how why when which who are was were can could "
+    "does did its into from about your you please explain using use between their there "
+    "best practices examples example question specific provide give "
+    "que para com uma como por mais dos das nos nas sobre qual quais".split()
+)
+MAX_PROFILE_TERMS = 500
+MIN_EXAMPLES_PER_LABEL = 3
+DEFAULT_LOWER_THRESHOLD = -0.15
+DEFAULT_UPPER_THRESHOLD = 0.15
+DEFAULT_TARGET_PRECISION = 0.97
+# Questions sharing no vocabulary with either profile score 0: always ask the LLM
+MIN_BAND_HALF_WIDTH = 0.05
+
+Vector = dict[str, float]
+
+
+# =============================================================================
+# 2. TEXT VECTORS
+# =============================================================================
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens without stopwords, very short words or plural "s"."""
+    tokens = (t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS)
+    return [t[:-1] if len(t) > 4 and t.endswith("s") else t for t in tokens]
+
+
+def vectorize(text: str) -> Vector:
+    """L2-normalized term-frequency vector of a text."""
+    counts = Counter(tokenize(text))
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return {term: c / norm for term, c in counts.items()} if norm else {}
+
+
+def centroid(vectors: list[Vector]) -> Vector:
+    """Mean vector, pruned to the heaviest terms and re-normalized."""
+    total: Counter[str] = Counter()
+    for vector in vectors:
+        total.update(vector)
+    top = dict(total.most_common(MAX_PROFILE_TERMS))
+    norm = math.sqrt(sum(w * w for w in top.values()))
+    return {term: w / norm for term, w in top.items()} if norm else {}
+
+
+def cosine(vector: Vector, profile: Vector) -> float:
+    """Cosine similarity between two normalized vectors."""
+    if len(vector) > len(profile):
+        vector, profile = profile, vector
+    return sum(w * profile.get(term, 0.0) for term, w in vector.items())
+
+
+# =============================================================================
+# 3. CLASSIFIER
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class LabeledDecision:
+    """A question with the scope decision taken for it."""
+
+    question: str
+    specialization: str
+    is_in_scope: bool
+
+
+class ScopeClassifier:
+    """Keyword-profile scope classifier with an uncertainty band.
+
+    Attributes:
+        profiles: Specialization (lowercase) -> {"in": centroid, "out": centroid}
+        lower_threshold: Scores at or below this are decided as out of scope
+        upper_threshold: Scores at or above this are decided as in scope
+
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, dict[str, Vector]],
+        lower_threshold: float = DEFAULT_LOWER_THRESHOLD,
+        upper_threshold: float = DEFAULT_UPPER_THRESHOLD,
+    ) -> None:
+        if lower_threshold > upper_threshold:
+            msg = "lower_threshold cannot be greater than upper_threshold"
+            raise ValueError(msg)
+        self.profiles = profiles
+        self.lower_threshold = lower_threshold
+        self.upper_threshold = upper_threshold
+
+        # Runtime metrics
+        self._lock = threading.Lock()
+        self.local_in_scope = 0
+        self.local_out_of_scope = 0
+        self.llm_fallbacks = 0
+        self.fallback_agreements = 0
+        self.fallback_disagreements = 0
+
+    @classmethod
+    def fit(
+        cls,
+        decisions: Iterable[LabeledDecision],
+        lower_threshold: float = DEFAULT_LOWER_THRESHOLD,
+        upper_threshold: float = DEFAULT_UPPER_THRESHOLD,
+    ) -> "ScopeClassifier":
+        """Build the per-specialization profiles from labeled decisions.
+
+        Specializations with fewer than `MIN_EXAMPLES_PER_LABEL` examples of
+        either label get no profile, so their questions always go to the LLM.
+        """
+        grouped: dict[str, dict[bool, list[Vector]]] = {}
+        for decision in decisions:
+            by_label = grouped.setdefault(
+                decision.specialization.strip().lower(), {True: [], False: []}
+            )
+            by_label[decision.is_in_scope].append(vectorize(decision.question))
+
+        profiles = {
+            specialization: {
+                "in": centroid(by_label[True]),
+                "out": centroid(by_label[False]),
+            }
+            for specialization, by_label in grouped.items()
+            if min(len(by_label[True]), len(by_label[False])) >= MIN_EXAMPLES_PER_LABEL
+        }
+        return cls(profiles, lower_threshold, upper_threshold)
+
+    def score(self, question: str, specialization: str) -> float | None:
+        """Return the in-scope score in [-1, 1], or None for an unknown specialization."""
+        profile = self.profiles.get(specialization.strip().lower())
+        if profile is None:
+            return None
+        vector = vectorize(question)
+        return cosine(vector, profile["in"]) - cosine(vector, profile["out"])
+
+    def decide(self, score: float | None) -> bool | None:
+        """Map a score to a local decision, or None when the LLM must decide."""
+        if score is None or self.lower_threshold < score < self.upper_threshold:
+            return None
+        return score >= self.upper_threshold
+
+    def record(
+        self,
+        score: float | None,
+        local_decision: bool | None,
+        llm_decision: bool | None = None,
+    ) -> None:
+        """Update the runtime metrics for one classification.
+
+        When the LLM was consulted, the local *leaning* (sign of the score) is
+        compared against its decision, which shows how the band could be tightened.
+        """
+        with self._lock:
+            if local_decision is True:
+                self.local_in_scope += 1
+            elif local_decision is False:
+                self.local_out_of_scope += 1
+            else:
+                self.llm_fallbacks += 1
+                if score is not None and llm_decision is not None:
+                    if (score > 0) == llm_decision:
+                        self.fallback_agreements += 1
+                    else:
+                        self.fallback_disagreements += 1
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of the runtime metrics."""
+        with self._lock:
+            local = self.local_in_scope + self.local_out_of_scope
+            total = local + self.llm_fallbacks
+            compared = self.fallback_agreements + self.fallback_disagreements
+            return {
+                "total": total,
+                "local_in_scope": self.local_in_scope,
+                "local_out_of_scope": self.local_out_of_scope,
+                "llm_fallbacks": self.llm_fallbacks,
+                "local_rate": local / total if total else 0.0,
+                "fallback_agreement_rate": (
+                    self.fallback_agreements / compared if compared else float("nan")
+                ),
+            }
+
+    def save(self, path: str | Path) -> None:
+        """Persist profiles and thresholds as JSON."""
+        payload = {
+            "lower_threshold": self.lower_threshold,
+            "upper_threshold": self.upper_threshold,
+            "profiles": self.profiles,
+        }
+        Path(path).write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ScopeClassifier":
+        """Load a classifier saved with `save`."""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            payload["profiles"],
+            payload["lower_threshold"],
+            payload["upper_threshold"],
+        )
+
+
+# =============================================================================
+# 4. LABELED DECISIONS LOG
+# =============================================================================
+
+_decisions_lock = threading.Lock()
+
+
+def append_decision(path: str | Path, decision: LabeledDecision) -> None:
+    """Append one labeled decision to the JSONL log used for calibration."""
+    line = json.dumps(
+        {
+            "question": decision.question,
+            "specialization": decision.specialization,
+            "is_in_scope": decision.is_in_scope,
+        },
+        ensure_ascii=False,
+    )
+    with _decisions_lock, Path(path).open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def load_decisions(path: str | Path) -> list[LabeledDecision]:
+    """Read the labeled decisions JSONL log."""
+    with Path(path).open(encoding="utf-8") as f:
+        return [
+            LabeledDecision(r["question"], r["specialization"], bool(r["is_in_scope"]))
+            for r in (json.loads(line) for line in f if line.strip())
+        ]
+
+
+# =============================================================================
+# 5. GLOBAL INSTANCE
+# =============================================================================
+
+scope_classifier: ScopeClassifier | None = None
+_classifier_loaded = False
+
+
+def get_scope_classifier() -> ScopeClassifier | None:
+    """Get the classifier persisted at `settings.scope_classifier_path` (singleton).
+
+    Returns:
+        ScopeClassifier | None: None when disabled or not calibrated yet
+
+    """
+    global scope_classifier, _classifier_loaded  # noqa: PLW0603
+    if not _classifier_loaded:
+        path = get_settings().scope_classifier_path
+        if path and Path(path).exists():
+            scope_classifier = ScopeClassifier.load(path)
+        _classifier_loaded = True
+    return scope_classifier
+
+
+# =============================================================================
+# 6. OFFLINE CALIBRATION
+# =============================================================================
+
+
+def cross_validated_scores(
+    decisions: list[LabeledDecision], folds: int = 5, seed: int = 0
+) -> list[tuple[float, bool]]:
+    """Score each decision with a classifier that never saw it (k-fold)."""
+    shuffled = decisions[:]
+    random.Random(seed).shuffle(shuffled)
+    scored: list[tuple[float, bool]] = []
+    for fold in range(folds):
+        held_out = shuffled[fold::folds]
+        training = [d for i, d in enumerate(shuffled) if i % folds != fold]
+        classifier = ScopeClassifier.fit(training)
+        for decision in held_out:
+            score = classifier.score(decision.question, decision.specialization)
+            if score is not None:
+                scored.append((score, decision.is_in_scope))
+    return scored
+
+
+def calibrate_thresholds(
+    scored: list[tuple[float, bool]], target_precision: float
+) -> tuple[float, float]:
+    """Pick the widest local regions whose precision meets `target_precision`.
+
+    Returns:
+        tuple[float, float]: (lower_threshold, upper_threshold)
+
+    """
+    upper, lower = math.inf, -math.inf
+
+    hits = 0
+    for count, (score, label) in enumerate(sorted(scored, reverse=True), start=1):
+        hits += label
+        if hits / count >= target_precision:
+            upper = score
+
+    hits = 0
+    for count, (score, label) in enumerate(sorted(scored), start=1):
+        hits += not label
+        if hits / count >= target_precision:
+            lower = score
+
+    # Never decide locally around 0, where the question carries no evidence
+    return min(lower, -MIN_BAND_HALF_WIDTH), max(upper, MIN_BAND_HALF_WIDTH)
+
+
+def evaluate(
+    scored: list[tuple[float, bool]], lower: float, upper: float
+) -> dict[str, float]:
+    """Coverage and agreement with the labels of the local decisions."""
+    local = [
+        (score >= upper, label) for score, label in scored if not lower < score < upper
+    ]
+    agreements = sum(decision == label for decision, label in local)
+    return {
+        "scored": len(scored),
+        "decided_locally": len(local),
+        "coverage": len(local) / len(scored) if scored else 0.0,
+        "agreement": agreements / len(local) if local else float("nan"),
+    }
+
+
+def main() -> None:
+    """Calibrate thresholds on a labeled decisions log and save the classifier."""
+    parser = argparse.ArgumentParser(
+        description="Calibrate the local scope classifier."
+    )
+    parser.add_argument(
+        "--decisions", required=True, help="JSONL log of labeled decisions"
+    )
+    parser.add_argument(
+        "--output", required=True, help="Where to save the classifier JSON"
+    )
+    parser.add_argument(
+        "--target-precision",
+        type=float,
+        default=DEFAULT_TARGET_PRECISION,
+        help="Minimum agreement with the LLM required for local decisions",
+    )
+    parser.add_argument("--folds", type=int, default=5, help="Cross-validation folds")
+    args = parser.parse_args()
+
+    decisions = load_decisions(args.decisions)
+    scored = cross_validated_scores(decisions, folds=max(2, args.folds))
+    lower, upper = calibrate_thresholds(scored, args.target_precision)
+    report = evaluate(scored, lower, upper)
+
+    classifier = ScopeClassifier.fit(decisions, lower, upper)
+    classifier.save(args.output)
+
+    print(f"📚 Labeled decisions: {len(decisions)}")
+    print(f"🗂️  Specializations with a profile: {len(classifier.profiles)}")
+    print(f"🎚️  Thresholds: lower={lower:.3f} upper={upper:.3f}")
+    print(
+        f"📊 Cross-validated: {report['decided_locally']}/{report['scored']} "
+        f"decided locally ({report['coverage']:.0%}), "
+        f"agreement with LLM {report['agreement']:.1%}"
+    )
+    print(f"💾 Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
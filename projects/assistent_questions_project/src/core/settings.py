@@ -3,13 +3,25 @@
 
 Handles project configuration, API keys, and LLM settings.
 Following existing patterns with Pydantic for validation and security.
+
+LLM clients are memoized by (model, temperature, max_tokens) and share a single
+keep-alive HTTP connection pool, so graph nodes can ask the factory for a client
+on every invocation without paying for object construction or TLS handshakes.
 """
 
+import threading
+from collections.abc import Callable, Hashable
+
+import httpx
 from dotenv import load_dotenv
+from langchain_core.prompts import BasePromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings
 
+from .prompt_cache_metrics import get_prompt_cache_metrics
+
 # =============================================================================
 # 1. CONSTANTS (Following existing pattern)
 # =============================================================================
@@ -19,6 +31,8 @@ DEFAULT_TEMPERATURE = 0.5
 MIN_TEMPERATURE = 0.0
 MAX_TEMPERATURE = 2.0
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_HTTP_MAX_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 60.0
 
 
 # =============================================================================
@@ -62,6 +76,69 @@ class ProjectSettings(BaseSettings):
         default=None, gt=0, description="Maximum tokens in LLM response"
     )
 
+    # Workflow Configuration
+    fused_enhance_scope: bool = Field(
+        default=False,
+        description="Enhance the question and check its scope in a single LLM call",
+    )
+    speculative_specialist: bool = Field(
+        default=False,
+        description="Start the specialist answer while the scope check is running",
+    )
+
+    # Local scope classifier (cascade in front of the LLM boundary check)
+    scope_classifier_path: str | None = Field(
+        default="scope_classifier.json",
+        description="Calibrated local scope classifier; None disables the cascade",
+    )
+    scope_decisions_path: str | None = Field(
+        default=None,
+        description="JSONL log of LLM scope decisions (questions included) for "
+        "calibration runs; None (default) disables logging",
+    )
+
+    # Node-level cache (SQLite with TTL)
+    node_cache_path: str | None = Field(
+        default=None,
+        description="SQLite file caching node results; None (default) disables it",
+    )
+    node_cache_ttl_seconds: float = Field(
+        default=24 * 60 * 60, gt=0, description="Lifetime of each cached node result"
+    )
+    cache_specialist_answers: bool = Field(
+        default=False, description="Also cache the specialist's final answers"
+    )
+
+    # Resumable runs (SQLite checkpointer)
+    checkpoint_path: str | None = Field(
+        default=None,
+        description="SQLite file for per-node checkpoints; None disables resuming",
+    )
+    checkpoint_every_step: bool = Field(
+        default=True,
+        description="Checkpoint after every node; False saves only when a run "
+        "ends or fails (fewer writes, but a killed process loses the run)",
+    )
+    checkpoint_max_resumes: int = Field(
+        default=2, ge=0, description="Times a failed run is resumed from its checkpoint"
+    )
+    checkpoint_prune_completed: bool = Field(
+        default=True,
+        description="Delete a run's checkpoints once it completes successfully",
+    )
+
+    # HTTP connection pool shared by all LLM clients
+    http_max_connections: int = Field(
+        default=DEFAULT_HTTP_MAX_CONNECTIONS,
+        gt=0,
+        description="Maximum open connections to the LLM API",
+    )
+    http_keepalive_expiry: float = Field(
+        default=DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        gt=0,
+        description="Seconds an idle keep-alive connection is kept in the pool",
+    )
+
     # Logging Configuration
     log_level: str = Field(default=DEFAULT_LOG_LEVEL, description="Logging level")
     log_file: str = Field(
@@ -148,7 +225,13 @@ class ProjectSettings(BaseSettings):
 
 
 class LLMFactory:
-    """Factory class for creating configured LLM instances."""
+    """Factory class for creating configured LLM instances.
+
+    Clients are memoized by (model, temperature, max_tokens) and all of them
+    share one keep-alive HTTP connection pool. Prebuilt runnables (e.g.
+    `prompt | structured_llm`) are memoized as well, so the per-question path
+    only executes chains and never builds them.
+    """
 
     def __init__(self, settings: ProjectSettings) -> None:
         """Initialize LLM factory with project settings.
@@ -158,6 +241,16 @@ class LLMFactory:
 
         """
         self.settings = settings
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+        self._llms: dict[tuple[str, float, int | None], ChatOpenAI] = {}
+        self._runnables: dict[Hashable, Runnable] = {}
+        self._lock = threading.Lock()
 
     def create_llm(
         self,
@@ -165,7 +258,7 @@ class LLMFactory:
         model: str | None = None,
         max_tokens: int | None = None,
     ) -> ChatOpenAI:
-        """Create a configured ChatOpenAI instance.
+        """Return a configured ChatOpenAI instance (memoized).
 
         Args:
             temperature: Override default temperature
@@ -173,19 +266,88 @@ class LLMFactory:
             max_tokens: Override default max_tokens
 
         Returns:
-            ChatOpenAI: Configured LLM instance
+            ChatOpenAI: Configured LLM instance, shared by every caller that
+                asks for the same (model, temperature, max_tokens)
 
         """
-        return ChatOpenAI(
-            api_key=self.settings.get_openai_key(),
-            model=model or self.settings.llm_model,
-            temperature=(
-                temperature
-                if temperature is not None
-                else self.settings.llm_temperature
-            ),
-            max_tokens=max_tokens or self.settings.llm_max_tokens,
+        key = (
+            model or self.settings.llm_model,
+            temperature if temperature is not None else self.settings.llm_temperature,
+            max_tokens or self.settings.llm_max_tokens,
         )
+        with self._lock:
+            llm = self._llms.get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    api_key=self.settings.get_openai_key(),
+                    model=key[0],
+                    temperature=key[1],
+                    max_tokens=key[2],
+                    http_client=self._http_client,
+                    # Usage in streamed responses too, for the cached-token metrics
+                    stream_usage=True,
+                    callbacks=[get_prompt_cache_metrics()],
+                )
+                self._llms[key] = llm
+        return llm
+
+    def get_or_build_runnable(
+        self, key: Hashable, build: Callable[[], Runnable]
+    ) -> Runnable:
+        """Return the runnable cached under `key`, building it on first use.
+
+        Args:
+            key: Cache key identifying the runnable
+            build: Zero-argument callable that assembles the runnable
+
+        Returns:
+            Runnable: The cached runnable
+
+        """
+        with self._lock:
+            runnable = self._runnables.get(key)
+        if runnable is not None:
+            return runnable
+
+        # Built outside the lock: create_llm() takes it as well
+        runnable = build()
+        with self._lock:
+            return self._runnables.setdefault(key, runnable)
+
+    def create_structured_chain(
+        self,
+        prompt: BasePromptTemplate,
+        schema: type,
+        temperature: float | None = None,
+    ) -> Runnable:
+        """Return a memoized `prompt | llm.with_structured_output(schema)` runnable.
+
+        Args:
+            prompt: Prompt template feeding the LLM
+            schema: Pydantic model the LLM must fill
+            temperature: Override default temperature
+
+        Returns:
+            Runnable: Chain that returns an instance of `schema`
+
+        """
+        key = ("structured", id(prompt), schema, temperature)
+        return self.get_or_build_runnable(
+            key,
+            lambda: prompt
+            | self.create_llm(temperature=temperature).with_structured_output(schema),
+        )
+
+    def close(self) -> None:
+        """Close the shared HTTP connection pool and drop cached clients.
+
+        The factory must not be used afterwards; for the global instance call
+        `close_llm_factory()`, which also resets the singleton.
+        """
+        with self._lock:
+            self._llms.clear()
+            self._runnables.clear()
+        self._http_client.close()
 
     def create_enhancement_llm(self) -> ChatOpenAI:
         """Create LLM optimized for question enhancement (low temperature)."""
@@ -238,14 +400,38 @@ def get_settings() -> ProjectSettings:
     return settings
 
 
+# Global LLM factory instance (owns the shared HTTP pool and client caches)
+llm_factory: LLMFactory | None = None
+# Two threads must not each build a factory (the loser's pool would leak)
+_llm_factory_lock = threading.Lock()
+
+
 def get_llm_factory() -> LLMFactory:
-    """Get configured LLM factory.
+    """Get configured LLM factory (thread-safe singleton).
 
     Returns:
         LLMFactory: Factory for creating LLM instances
 
     """
-    return LLMFactory(get_settings())
+    global llm_factory  # noqa: PLW0603
+    with _llm_factory_lock:
+        if llm_factory is None:
+            llm_factory = LLMFactory(get_settings())
+        return llm_factory
+
+
+def close_llm_factory() -> None:
+    """Close the global LLM factory's HTTP pool and reset the singleton.
+
+    The next `get_llm_factory()` builds a fresh factory with a new pool, so no
+    caller is handed an LLM bound to the closed client.
+    """
+    global llm_factory  # noqa: PLW0603
+    with _llm_factory_lock:
+        factory = llm_factory
+        llm_factory = None
+    if factory is not None:
+        factory.close()
 
 
 # =============================================================================
@@ -6,7 +6,7 @@ Defines the shared state for the LangGraph workflow.
 This version is simplified for clarity and study purposes.
 """
 
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 # =============================================================================
 # Agent State Definition
@@ -24,6 +24,8 @@ class AgentState(TypedDict):
         enhanced_question: The question after being improved by the enhancer agent.
         answer: The final response from the specialist agent.
         specialization: The domain of expertise for the current session.
+        is_in_scope: Scope decision, written by the boundary check (or the fused
+            enhance-and-scope / speculative nodes).
 
     """
 
@@ -31,6 +33,7 @@ class AgentState(TypedDict):
     enhanced_question: str
     answer: str
     specialization: str
+    is_in_scope: NotRequired[bool]
 
 
 # =============================================================================
@@ -0,0 +1 @@
+"""Dataset evaluation tools for the Assistant Questions Project."""
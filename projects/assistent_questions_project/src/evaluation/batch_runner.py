@@ -0,0 +1,313 @@
+"""Concurrent Dataset Evaluation Runner
+===================================
+
+Runs a JSONL dataset of questions through the compiled workflow with bounded
+concurrency (`app.batch_as_completed` / `app.abatch_as_completed`), streaming one
+result per line to the output file as soon as each question finishes. At the end
+it reports throughput, latency percentiles, per-node timings and routing counts.
+
+Run from the `projects` directory:
+
+    python -m assistent_questions_project.src.evaluation.batch_runner \\
+        --dataset questions.jsonl --output results.jsonl --max-concurrency 16
+
+Each dataset line is {"question": ..., "specialization": ...}; any extra fields
+(e.g. an id or the expected route) are copied to the result record.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, TextIO
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import RunnableConfig
+
+from ..core.checkpointing import get_checkpointer, new_thread_config
+from ..core.node_cache import get_node_cache
+from ..core.prompt_cache_metrics import get_prompt_cache_metrics
+from ..core.state import AgentState
+from ..graph.workflow import build_workflow
+
+OUT_OF_SCOPE_NODE = "out_of_scope"
+
+
+# =============================================================================
+# 1. PER-QUESTION TIMING CALLBACK
+# =============================================================================
+
+
+class NodeTimingHandler(BaseCallbackHandler):
+    """Collects wall time of the whole run and of each graph node (one per question)."""
+
+    def __init__(self) -> None:
+        self.node_timings: dict[str, float] = defaultdict(float)
+        self.latency_s: float | None = None
+        self._starts: dict[UUID, tuple[str | None, float]] = {}
+        self._lock = threading.Lock()
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        name = kwargs.get("name")
+        is_node = name is not None and name == (metadata or {}).get("langgraph_node")
+        if parent_run_id is None:
+            label = None  # root run: the whole question
+        elif is_node and any(t.startswith("graph:step:") for t in tags or []):
+            label = name
+        else:
+            return
+        with self._lock:
+            self._starts[run_id] = (label, time.perf_counter())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._close(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._close(run_id)
+
+    def _close(self, run_id: UUID) -> None:
+        with self._lock:
+            started = self._starts.pop(run_id, None)
+            if started is None:
+                return
+            label, start = started
+            elapsed = time.perf_counter() - start
+            if label is None:
+                self.latency_s = elapsed
+                return
+            self.node_timings[label] += elapsed
+
+
+# =============================================================================
+# 2. DATASET AND RESULT RECORDS
+# =============================================================================
+
+
+def load_dataset(path: str) -> list[dict[str, Any]]:
+    """Read the JSONL dataset, skipping blank lines."""
+    with Path(path).open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def to_initial_state(row: dict[str, Any]) -> AgentState:
+    return {
+        "original_question": row["question"],
+        "specialization": row["specialization"],
+        "enhanced_question": "",
+        "answer": "",
+    }
+
+
+def build_record(
+    index: int, row: dict[str, Any], output: Any, handler: NodeTimingHandler
+) -> dict[str, Any]:
+    """Result line for one question (output is the final state or an exception)."""
+    record = {"index": index, **row}
+    if isinstance(output, BaseException):
+        record.update(status="error", error=f"{type(output).__name__}: {output}")
+    else:
+        record.update(
+            status="ok",
+            route=(
+                "out_of_scope"
+                if OUT_OF_SCOPE_NODE in handler.node_timings
+                else "in_scope"
+            ),
+            enhanced_question=output.get("enhanced_question"),
+            answer=output.get("answer"),
+        )
+    record["latency_s"] = round(handler.latency_s or 0.0, 4)
+    record["node_timings_s"] = {
+        node: round(seconds, 4) for node, seconds in handler.node_timings.items()
+    }
+    return record
+
+
+# =============================================================================
+# 3. RUNNERS
+# =============================================================================
+
+
+def make_configs(
+    n: int, max_concurrency: int
+) -> tuple[list[RunnableConfig], list[NodeTimingHandler]]:
+    handlers = [NodeTimingHandler() for _ in range(n)]
+    # With a checkpointer, every question is its own thread
+    checkpointed = get_checkpointer() is not None
+    configs: list[RunnableConfig] = [
+        {
+            "callbacks": [handler],
+            "max_concurrency": max_concurrency,
+            **(new_thread_config() if checkpointed else {}),
+        }
+        for handler in handlers
+    ]
+    return configs, handlers
+
+
+def run_sync(
+    app, rows: list[dict[str, Any]], max_concurrency: int, out: TextIO
+) -> list[dict[str, Any]]:
+    """Run with `app.batch_as_completed` (thread pool of `max_concurrency`)."""
+    configs, handlers = make_configs(len(rows), max_concurrency)
+    inputs = [to_initial_state(row) for row in rows]
+    records = []
+    for index, output in app.batch_as_completed(
+        inputs, configs, return_exceptions=True
+    ):
+        record = build_record(index, rows[index], output, handlers[index])
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        records.append(record)
+    return records
+
+
+async def run_async(
+    app, rows: list[dict[str, Any]], max_concurrency: int, out: TextIO
+) -> list[dict[str, Any]]:
+    """Run with `app.abatch_as_completed` (semaphore of `max_concurrency`)."""
+    configs, handlers = make_configs(len(rows), max_concurrency)
+    inputs = [to_initial_state(row) for row in rows]
+    records = []
+    async for index, output in app.abatch_as_completed(
+        inputs, configs, return_exceptions=True
+    ):
+        record = build_record(index, rows[index], output, handlers[index])
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        records.append(record)
+    return records
+
+
+# =============================================================================
+# 4. REPORT
+# =============================================================================
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(pct / 100 * len(ordered)))
+    return ordered[index]
+
+
+def print_report(records: list[dict[str, Any]], wall_s: float) -> None:
+    ok = [r for r in records if r["status"] == "ok"]
+    latencies = [r["latency_s"] for r in ok]
+
+    print(f"\n📦 Questions: {len(records)} ({len(records) - len(ok)} errors)")
+    print(
+        f"⚡ Throughput: {len(records) / wall_s:.2f} questions/s ({wall_s:.1f}s wall)"
+    )
+    if latencies:
+        print(
+            "⏱️  Latency (s): "
+            + "  ".join(
+                f"p{p}={percentile(latencies, p):.2f}" for p in (50, 90, 95, 99)
+            )
+            + f"  mean={statistics.fmean(latencies):.2f}"
+        )
+
+    per_node: dict[str, list[float]] = defaultdict(list)
+    for record in ok:
+        for node, seconds in record["node_timings_s"].items():
+            per_node[node].append(seconds)
+    if per_node:
+        print("🧩 Per-node timings (s):")
+        for node, values in sorted(per_node.items()):
+            print(
+                f"   {node:<24} n={len(values):<6} "
+                f"p50={percentile(values, 50):.2f}  p95={percentile(values, 95):.2f}"
+            )
+
+    routes = Counter(r["route"] for r in ok)
+    print("🔀 Routing: " + ", ".join(f"{k}={v}" for k, v in routes.most_common()))
+
+    prompt_cache = get_prompt_cache_metrics().stats()
+    if prompt_cache:
+        print("🧠 Provider prompt cache (cached / prompt tokens):")
+        for node, counts in prompt_cache.items():
+            ttft = counts["ttft_p50_s"]
+            print(
+                f"   {node:<24} {counts['cached_ratio']:.0%} "
+                f"({counts['cached_tokens']}/{counts['input_tokens']})"
+                + (f"  ttft_p50={ttft:.2f}s" if ttft is not None else "")
+            )
+
+    checkpointer = get_checkpointer()
+    if checkpointer is not None:
+        stats = checkpointer.serde.stats()
+        print(
+            f"💾 Checkpoints: {stats['checkpoints']} "
+            f"({stats['bytes_per_checkpoint']:.0f} B each incl. writes), "
+            f"{stats['writes']} pending writes"
+        )
+
+    cache = get_node_cache()
+    if cache is not None:
+        print("🗄️  Node cache hit rates:")
+        for node, counts in cache.stats().items():
+            print(
+                f"   {node:<24} {counts['hit_rate']:.0%} "
+                f"({counts['hits']} hits / {counts['misses']} misses)"
+            )
+
+
+def main() -> None:
+    """Evaluate a JSONL dataset against the workflow and print a summary."""
+    parser = argparse.ArgumentParser(description="Run a dataset through the workflow.")
+    parser.add_argument("--dataset", required=True, help="Input JSONL file")
+    parser.add_argument("--output", required=True, help="Output JSONL file")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true", help="Use abatch"
+    )
+    parser.add_argument("--fused", action="store_true", help="Fused enhancer variant")
+    parser.add_argument(
+        "--speculative", action="store_true", help="Speculative specialist variant"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Keep the nodes' progress prints"
+    )
+    args = parser.parse_args()
+
+    rows = load_dataset(args.dataset)
+    app = build_workflow(
+        fused=args.fused, speculative=args.speculative, checkpointer=get_checkpointer()
+    )
+    max_concurrency = max(1, args.max_concurrency)
+
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(Path(args.output).open("w", encoding="utf-8"))
+        if not args.verbose:
+            # The nodes print progress for every question; silence them by default
+            devnull = stack.enter_context(Path(os.devnull).open("w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        if args.use_async:
+            records = asyncio.run(run_async(app, rows, max_concurrency, out))
+        else:
+            records = run_sync(app, rows, max_concurrency, out)
+    print_report(records, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,22 @@
 ============================================================
 
 This module defines and compiles the LangGraph, exporting the final 'app' object.
-It acts as the "factory" for our workflow.
+It acts as the "factory" for our workflow: `build_workflow(fused=True)` builds the
+variant where enhancement and scope check share a single LLM call, and
+`build_workflow(speculative=True)` the one where the specialist starts while the
+scope check is still running. Passing a `checkpointer` makes runs resumable from
+the last completed node (see `core/checkpointing.py`).
 """
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
+from ..agents.enhance_and_scope import enhance_and_scope_node, route_on_scope
 from ..agents.knowledge_boundary import boundary_check_node
 from ..agents.question_enhancer import enhance_question_node
 from ..agents.specialist_agent import specialist_node
+from ..agents.speculative_specialist import speculative_specialist_node
 from ..core.state import AgentState
 
 
@@ -20,19 +28,76 @@ def out_of_scope_node(state: AgentState) -> dict[str, str]:
     return {"answer": answer}
 
 
-workflow = StateGraph(AgentState)
+def build_workflow(
+    fused: bool = False,
+    speculative: bool = False,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> CompiledStateGraph:
+    """Build and compile the assistant workflow.
 
-workflow.add_node("enhancer", enhance_question_node)
-workflow.add_node("specialist", specialist_node)
-workflow.add_node("out_of_scope", out_of_scope_node)
+    Args:
+        fused: When True, a single node enhances the question and decides its
+            scope in one structured output call. When False (default), the
+            enhancer and the boundary check run as two sequential nodes.
+            Both variants route on the `is_in_scope` state with conditional edges.
+        speculative: When True, the specialist answer is generated concurrently
+            with the scope check and committed only if the question is in scope.
+            Not combinable with `fused`, whose enhancer already decides the scope.
+        checkpointer: When given, each completed node is checkpointed and runs
+            need a `thread_id` in their config; invoking again with `None` as
+            input and the same config resumes a failed run.
 
-workflow.set_entry_point("enhancer")
-workflow.add_conditional_edges(
-    "enhancer",
-    boundary_check_node,
-    {"in_scope": "specialist", "out_of_scope": "out_of_scope"},
-)
-workflow.add_edge("specialist", END)
-workflow.add_edge("out_of_scope", END)
+    Returns:
+        CompiledStateGraph: The compiled workflow
 
-app = workflow.compile()
+    Raises:
+        ValueError: If both `fused` and `speculative` are requested
+
+    """
+    if fused and speculative:
+        msg = "The fused and speculative variants cannot be combined"
+        raise ValueError(msg)
+
+    workflow = StateGraph(AgentState)
+
+    if speculative:
+        workflow.add_node("enhancer", enhance_question_node)
+        workflow.add_node("speculative_specialist", speculative_specialist_node)
+        workflow.add_node("out_of_scope", out_of_scope_node)
+
+        workflow.set_entry_point("enhancer")
+        workflow.add_edge("enhancer", "speculative_specialist")
+        workflow.add_conditional_edges(
+            "speculative_specialist",
+            route_on_scope,
+            {"in_scope": END, "out_of_scope": "out_of_scope"},
+        )
+        workflow.add_edge("out_of_scope", END)
+        return workflow.compile(checkpointer=checkpointer)
+
+    if fused:
+        workflow.add_node("enhancer", enhance_and_scope_node)
+        scope_source = "enhancer"
+    else:
+        workflow.add_node("enhancer", enhance_question_node)
+        workflow.add_node("boundary_check", boundary_check_node)
+        workflow.add_edge("enhancer", "boundary_check")
+        scope_source = "boundary_check"
+    workflow.add_node("specialist", specialist_node)
+    workflow.add_node("out_of_scope", out_of_scope_node)
+
+    workflow.set_entry_point("enhancer")
+    # The scope decision is always state (`is_in_scope`) written by a node, so
+    # a resumed run never skips it
+    workflow.add_conditional_edges(
+        scope_source,
+        route_on_scope,
+        {"in_scope": "specialist", "out_of_scope": "out_of_scope"},
+    )
+    workflow.add_edge("specialist", END)
+    workflow.add_edge("out_of_scope", END)
+
+    return workflow.compile(checkpointer=checkpointer)
+
+
+app = build_workflow()
@@ -2,14 +2,152 @@
 ==================================
 
 Provides a polished CLI to interact with the compiled workflow,
-showing real-time progress and a clean final answer.
+showing real-time progress and streaming the specialist answer token by token.
+When a checkpointer is configured, a run that fails mid-graph is resumed from the
+last completed node instead of starting over.
 """
 
+from langchain_core.runnables import RunnableConfig
+
+from .agents.speculative_specialist import get_speculation_stats
+from .core.checkpointing import get_checkpointer, new_thread_config
+from .core.node_cache import get_node_cache
+from .core.prompt_cache_metrics import get_prompt_cache_metrics
+from .core.scope_classifier import get_scope_classifier
+from .core.settings import get_settings
 from .core.state import AgentState
-from .graph.workflow import app
+from .graph.workflow import build_workflow
+
+# Nós cujos tokens são repassados ao terminal assim que o LLM os gera
+SPECIALIST_NODES = ("specialist", "speculative_specialist")
+
+
+def stream_answer(
+    app,
+    initial_state: AgentState | None,
+    config: RunnableConfig | None = None,
+    checkpoint_during: bool | None = None,
+) -> None:
+    """Runs the workflow, printing progress and the specialist answer token by token.
+
+    Uses the `updates` stream mode for node progress and the `messages` mode for
+    the specialist tokens. Tokens from the speculative node are held back until
+    the node signals (via the `custom` mode) that the question is in scope, so a
+    discarded speculation never reaches the terminal. With `initial_state=None`
+    the run identified by `config` resumes from its last checkpoint.
+    """
+    final_answer = "Ocorreu um erro ao processar sua pergunta."  # Resposta padrão
+    streamed = False
+    speculative_scope: bool | None = None
+    speculative_buffer: list[str] = []
+
+    def print_tokens(text: str) -> None:
+        nonlocal streamed
+        if not streamed:
+            print("\n--- Resposta Final ---")
+            streamed = True
+        print(text, end="", flush=True)
+
+    for mode, payload in app.stream(
+        initial_state,
+        config,
+        stream_mode=["updates", "messages", "custom"],
+        checkpoint_during=checkpoint_during,
+    ):
+        if mode == "messages":
+            chunk, metadata = payload
+            node_name = metadata.get("langgraph_node")
+            if node_name not in SPECIALIST_NODES or not chunk.content:
+                continue
+            if node_name == "speculative_specialist" and speculative_scope is not True:
+                if speculative_scope is None:
+                    speculative_buffer.append(chunk.content)
+                continue
+            print_tokens(chunk.content)
+
+        elif mode == "custom" and "speculative_scope" in payload:
+            speculative_scope = payload["speculative_scope"]
+            if speculative_scope and speculative_buffer:
+                print_tokens("".join(speculative_buffer))
+            speculative_buffer.clear()
+
+        elif mode == "updates":
+            node_name = next(iter(payload))
+
+            if node_name == "enhancer":
+                print("🧠  Aprimorando sua pergunta...")
+
+            if node_name == "specialist":
+                final_answer = payload[node_name]["answer"]
+
+            if node_name == "speculative_specialist" and "answer" in payload[node_name]:
+                final_answer = payload[node_name]["answer"]
+
+            if node_name == "out_of_scope":
+                print("🚫  A pergunta parece estar fora do escopo definido...")
+                final_answer = payload[node_name]["answer"]
+
+    if streamed:
+        print()
+    else:
+        # Sem tokens (ex.: fora de escopo ou modelo sem streaming): resposta inteira
+        print("\n--- Resposta Final ---")
+        print(final_answer)
+
+
+def run_completed(app, config: RunnableConfig) -> bool:
+    """Whether the checkpointed run reached the end of the graph with an answer."""
+    snapshot = app.get_state(config)
+    return not snapshot.next and bool(snapshot.values.get("answer"))
+
+
+def answer_with_resume(
+    app,
+    initial_state: AgentState,
+    config: RunnableConfig | None,
+    max_resumes: int,
+    checkpoint_during: bool | None = None,
+) -> bool:
+    """Runs one question, resuming from the last checkpoint if the run fails.
+
+    Without a checkpointer (`config is None`) errors propagate as before. With
+    one, a run only counts as completed if its final checkpoint has no pending
+    nodes and holds an answer; anything else is reported as a failure, so the
+    thread is kept instead of being pruned as done.
+
+    Returns:
+        bool: True if the run completed
+
+    """
+    graph_input: AgentState | None = initial_state
+    for attempt in range(max_resumes + 1):
+        try:
+            stream_answer(app, graph_input, config, checkpoint_during)
+            if config is None or run_completed(app, config):
+                return True
+            print("\n⚠️  A execução terminou sem produzir uma resposta.")
+            break
+        except Exception as e:
+            if config is None:
+                raise
+            print(f"\n⚠️  Falha na execução: {e}")
+            if attempt < max_resumes:
+                print("🔁  Retomando a partir do último nó concluído...")
+                graph_input = None  # None + mesmo thread_id = continuar do checkpoint
+    thread_id = config["configurable"]["thread_id"]
+    print(f"❌  Não foi possível concluir. Checkpoint salvo no thread '{thread_id}'.")
+    return False
 
 
 def main():
+    settings = get_settings()
+    checkpointer = get_checkpointer()
+    app = build_workflow(
+        fused=settings.fused_enhance_scope,
+        speculative=settings.speculative_specialist,
+        checkpointer=checkpointer,
+    )
+
     print("🤖 Bem-vindo ao Assistente de Perguntas Inteligentes!")
     print("Para cada pergunta, forneça também o contexto/domínio.")
     print("Para sair, digite 'sair' na pergunta.")
@@ -17,6 +155,19 @@ def main():
     while True:
         original_question = input("\nSua pergunta: ")
         if original_question.lower() in ["sair", "exit"]:
+            classifier = get_scope_classifier()
+            if classifier is not None:
+                print(f"📊 Classificador de escopo local: {classifier.stats()}")
+            print(
+                f"📊 Cache de prompt do provedor: {get_prompt_cache_metrics().stats()}"
+            )
+            cache = get_node_cache()
+            if cache is not None:
+                print(f"📊 Cache por nó: {cache.stats()}")
+            if checkpointer is not None:
+                print(f"📊 Checkpoints (bytes): {checkpointer.serde.stats()}")
+            if settings.speculative_specialist:
+                print(f"📊 Execução especulativa: {get_speculation_stats().stats()}")
             print("👋 Até logo!")
             break
 
@@ -30,25 +181,17 @@ def main():
         }
 
         print("\n---  Procesando... ---")
-        final_answer = "Ocorreu um erro ao processar sua pergunta."  # Resposta padrão
-
-        # Usamos o stream para dar feedback em tempo real
-        for event in app.stream(initial_state):
-            node_name = list(event.keys())[0]
-
-            if node_name == "enhancer":
-                print("🧠  Aprimorando sua pergunta...")
-
-            if node_name == "specialist":
-                print(f"🧑‍🏫  Consultando especialista em {specialization}...")
-                final_answer = event[node_name]["answer"]
-
-            if node_name == "out_of_scope":
-                print("🚫  A pergunta parece estar fora do escopo definido...")
-                final_answer = event[node_name]["answer"]
-
-        print("\n--- Resposta Final ---")
-        print(final_answer)
+        config = new_thread_config() if checkpointer is not None else None
+        completed = answer_with_resume(
+            app,
+            initial_state,
+            config,
+            settings.checkpoint_max_resumes,
+            settings.checkpoint_every_step,
+        )
+        if completed and config is not None and settings.checkpoint_prune_completed:
+            # Concluído: os checkpoints deste thread não serão mais retomados
+            checkpointer.delete_thread(config["configurable"]["thread_id"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+# benchmark_bulk.py
+"""Benchmark: grafo (um `app.invoke` por registro) vs. caminho em lote.
+
+Gera registros aleatórios (`user_string`, `action_type`), confere que
+`process_bulk` produz exatamente os mesmos resultados que o grafo e mede
+registros/segundo de cada caminho. O grafo é medido em uma amostra menor
+(`--graph-records`), pois processar milhões de registros por ele levaria minutos.
+
+Uso (a partir do diretório que contém a pasta `lg_router_exercise/`):
+
+    python -m lg_router_exercise.benchmark_bulk
+    python -m lg_router_exercise.benchmark_bulk --records 5000000 --graph-records 5000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from .bulk import DEFAULT_CHUNK_SIZE, process_bulk
+from .graph_builder import build_graph
+
+console = Console()
+
+
+def gerar_registros(quantidade: int, seed: int = 42) -> list[tuple[str, str]]:
+    """Gera pares (`user_string`, `action_type`) com ações misturadas."""
+    rng = random.Random(seed)
+    alfabeto = string.ascii_letters + string.digits + " àéõçß"
+    return [
+        (
+            "".join(rng.choices(alfabeto, k=rng.randint(5, 60))),
+            rng.choice(("reverse", "upper")),
+        )
+        for _ in range(quantidade)
+    ]
+
+
+def process_via_graph(app, records: list[tuple[str, str]]) -> list[str]:
+    """Caminho de referência: um `app.invoke` por registro."""
+    return [
+        app.invoke({"user_string": s, "action_type": a})["processed_string"]
+        for s, a in records
+    ]
+
+
+def medir(funcao, *args) -> tuple[list[str], float]:
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a tabela de registros/segundo."""
+    parser = argparse.ArgumentParser(description="Grafo vs. processamento em lote.")
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--graph-records", type=int, default=2_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    # Sem sinks: o custo de I/O do log não deve dominar a medição do grafo
+    logger.remove()
+
+    registros = gerar_registros(args.records)
+    amostra = registros[: args.graph_records]
+    app = build_graph()
+
+    resultado_grafo, tempo_grafo = medir(process_via_graph, app, amostra)
+    resultado_lote, tempo_lote = medir(process_bulk, registros, args.chunk_size)
+
+    if resultado_lote[: len(amostra)] != resultado_grafo:
+        console.print("[bold red]❌ Resultados divergentes do grafo![/bold red]")
+        raise SystemExit(1)
+    console.print(
+        f"[bold green]✅ {len(amostra)} resultados idênticos ao grafo.[/bold green]"
+    )
+
+    tabela = Table(title="Registros por segundo")
+    tabela.add_column("Caminho")
+    tabela.add_column("Registros", justify="right")
+    tabela.add_column("Tempo (s)", justify="right")
+    tabela.add_column("Registros/s", justify="right")
+    taxa_grafo = len(amostra) / tempo_grafo
+    taxa_lote = len(registros) / tempo_lote
+    tabela.add_row(
+        "grafo (invoke)",
+        f"{len(amostra):,}",
+        f"{tempo_grafo:.2f}",
+        f"{taxa_grafo:,.0f}",
+    )
+    tabela.add_row(
+        "lote (process_bulk)",
+        f"{len(registros):,}",
+        f"{tempo_lote:.2f}",
+        f"{taxa_lote:,.0f}",
+    )
+    console.print(tabela)
+    console.print(f"Aceleração: [bold]{taxa_lote / taxa_grafo:,.0f}x[/bold]")
+
+
+if __name__ == "__main__":
+    main()
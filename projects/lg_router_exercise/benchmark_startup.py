@@ -0,0 +1,128 @@
+# benchmark_startup.py
+"""Benchmark de inicialização: custo de montar o grafo a cada processo.
+
+CLIs de vida curta e funções serverless pagam, a cada requisição fria, a
+importação dos módulos, a montagem/compilação do `StateGraph` e, se ligado, o
+desenho ASCII do grafo. Este benchmark mede cada etapa em processos Python novos
+(partida fria) e o custo de pedir o grafo de novo no mesmo processo, que com o
+cache de módulo é só uma consulta (partida quente).
+
+Alvos medidos:
+
+- `lg_router`: `build_graph()` deste exercício.
+- `linear_flow`: `get_graph()` de `agentstate_langgraph_linear_flow` (o LLM é só
+  instanciado, nenhuma chamada é feita; uma chave fictícia é usada se faltar).
+
+Uso (a partir do diretório que contém a pasta `lg_router_exercise/`):
+
+    python -m lg_router_exercise.benchmark_startup
+    python -m lg_router_exercise.benchmark_startup --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+# Alvo -> (módulo, função que devolve o grafo compilado)
+ALVOS = {
+    "lg_router": ("lg_router_exercise.graph_builder", "build_graph"),
+    "linear_flow": ("agentstate_langgraph_linear_flow.question_assistant", "get_graph"),
+}
+
+# Executado em um processo novo; imprime as medições em JSON na última linha
+SCRIPT = """
+import json, time
+t0 = time.perf_counter()
+import {modulo} as m
+t1 = time.perf_counter()
+app = m.{builder}()
+t2 = time.perf_counter()
+assert m.{builder}() is app
+t3 = time.perf_counter()
+try:
+    app.get_graph().draw_ascii()
+    ascii_s = time.perf_counter() - t3
+except ImportError:
+    ascii_s = None
+print(json.dumps({{"import": t1 - t0, "build": t2 - t1, "cached": t3 - t2,
+                  "ascii": ascii_s}}))
+"""
+
+
+def medir_alvo(modulo: str, builder: str, runs: int) -> dict[str, list[float]]:
+    """Roda o script `runs` vezes em processos novos e junta as medições."""
+    raiz = Path(__file__).resolve().parent.parent
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(raiz), os.getenv("PYTHONPATH")])
+        ),
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "sk-benchmark"),
+    }
+    medidas: dict[str, list[float]] = {"process": []}
+    # Diretório temporário: alguns módulos criam arquivos de log ao importar
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(runs):
+            inicio = time.perf_counter()
+            saida = subprocess.run(
+                [sys.executable, "-c", SCRIPT.format(modulo=modulo, builder=builder)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=cwd,
+                env=env,
+            )
+            medidas["process"].append(time.perf_counter() - inicio)
+            for etapa, valor in json.loads(saida.stdout.splitlines()[-1]).items():
+                if valor is not None:
+                    medidas.setdefault(etapa, []).append(valor)
+    return medidas
+
+
+def _ms(valores: list[float] | None) -> str:
+    return f"{statistics.median(valores) * 1e3:.1f}" if valores else "n/d"
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a mediana de cada etapa por alvo."""
+    parser = argparse.ArgumentParser(description="Custo de inicialização do grafo.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--targets", nargs="+", choices=list(ALVOS), default=list(ALVOS)
+    )
+    args = parser.parse_args()
+
+    tabela = Table(title=f"Inicialização (mediana de {args.runs} processos, ms)")
+    tabela.add_column("Alvo")
+    for coluna in ("Processo", "Import", "Build (frio)", "Build (cache)", "ASCII"):
+        tabela.add_column(coluna, justify="right")
+    for nome in args.targets:
+        medidas = medir_alvo(*ALVOS[nome], args.runs)
+        tabela.add_row(
+            nome,
+            _ms(medidas["process"]),
+            _ms(medidas["import"]),
+            _ms(medidas["build"]),
+            f"{statistics.median(medidas['cached']) * 1e6:.1f} µs",
+            _ms(medidas.get("ascii")),
+        )
+    console.print(tabela)
+    console.print(
+        "Processo = interpretador + import + build + ASCII. "
+        "ASCII 'n/d' = `grandalf` não instalado."
+    )
+
+
+if __name__ == "__main__":
+    main()
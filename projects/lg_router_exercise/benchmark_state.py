@@ -0,0 +1,200 @@
+# benchmark_state.py
+"""Microbenchmark do custo da representação do estado no grafo.
+
+Monta grafos equivalentes (roteador + `reverse_node`/`upper_node`) com três
+representações do estado e mede, para cada uma:
+
+- **Overhead por invoke:** mediana de várias repetições, em microssegundos.
+- **Alocações:** pico de memória rastreado pelo `tracemalloc` durante um invoke.
+- **Escala com o lote:** tempo por registro em `app.batch` com lotes crescentes.
+- **Construção do estado:** custo isolado de criar/validar o estado de entrada.
+
+As representações comparadas são:
+
+- `pydantic`: o `State` atual (`BaseModel` com `Literal`, validado a cada passo).
+- `typeddict`: um `TypedDict` (sem validação; os nós leem chaves).
+- `dataclass`: `LightweightState`, um `@dataclass(slots=True)` (sem validação;
+  os nós leem atributos). É o que `build_graph(lightweight_state=True)` usa.
+
+Os nós do benchmark não fazem log, para que só o custo do estado e do
+agendamento do LangGraph apareça. Por fim, o próprio `build_graph` é medido com
+e sem `lightweight_state` (nós reais, com o log sem destino).
+
+Uso (a partir do diretório que contém a pasta `lg_router_exercise/`):
+
+    python -m lg_router_exercise.benchmark_state
+    python -m lg_router_exercise.benchmark_state --invokes 5000 --repeats 7
+"""
+
+import argparse
+import statistics
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from operator import attrgetter, itemgetter
+from typing import Any, Literal, TypedDict
+
+from langgraph.graph import END, StateGraph
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from .graph_builder import build_graph
+from .state import LightweightState, State
+
+console = Console()
+
+
+class EstadoTypedDict(TypedDict, total=False):
+    """Mesmos campos de `State`, como `TypedDict`."""
+
+    user_string: str
+    action_type: Literal["reverse", "upper"]
+    processed_string: str
+
+
+# Esquema do estado -> como os nós leem um campo dele
+REPRESENTACOES: dict[str, tuple[type, Callable[[str], Callable[[Any], str]]]] = {
+    "pydantic": (State, attrgetter),
+    "typeddict": (EstadoTypedDict, itemgetter),
+    "dataclass": (LightweightState, attrgetter),
+}
+
+
+def build_benchmark_graph(schema: type, getter: Callable[[str], Callable]):
+    """Constrói o grafo do exercício para um esquema de estado qualquer."""
+    user_string = getter("user_string")
+    action_type = getter("action_type")
+
+    def reverse(state: Any) -> dict[str, str]:
+        return {"processed_string": user_string(state)[::-1]}
+
+    def upper(state: Any) -> dict[str, str]:
+        return {"processed_string": user_string(state).upper()}
+
+    def route(state: Any) -> str:
+        return "reverse_node" if action_type(state) == "reverse" else "upper_node"
+
+    grafo = StateGraph(schema)
+    grafo.add_node("reverse_node", reverse)
+    grafo.add_node("upper_node", upper)
+    grafo.set_conditional_entry_point(
+        route, {"reverse_node": "reverse_node", "upper_node": "upper_node"}
+    )
+    grafo.add_edge("reverse_node", END)
+    grafo.add_edge("upper_node", END)
+    return grafo.compile()
+
+
+def entradas(quantidade: int) -> list[dict[str, str]]:
+    return [
+        {
+            "user_string": f"Hello LangGraph #{i}",
+            "action_type": "reverse" if i % 2 else "upper",
+        }
+        for i in range(quantidade)
+    ]
+
+
+def medir_invoke(app, invokes: int, repeats: int) -> float:
+    """Mediana, entre `repeats` rodadas, do tempo médio por invoke (µs)."""
+    dados = entradas(invokes)
+    rodadas = []
+    for _ in range(repeats):
+        inicio = time.perf_counter()
+        for entrada in dados:
+            app.invoke(entrada)
+        rodadas.append((time.perf_counter() - inicio) / invokes * 1e6)
+    return statistics.median(rodadas)
+
+
+def medir_alocacao(app, invokes: int = 200) -> float:
+    """Pico médio de memória rastreada durante um invoke (KiB)."""
+    picos = []
+    tracemalloc.start()
+    try:
+        for entrada in entradas(invokes):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            app.invoke(entrada)
+            _, pico = tracemalloc.get_traced_memory()
+            picos.append(pico - base)
+    finally:
+        tracemalloc.stop()
+    return statistics.fmean(picos) / 1024
+
+
+def medir_lote(app, tamanho: int) -> float:
+    """Tempo por registro (µs) em um `app.batch` do tamanho dado."""
+    dados = entradas(tamanho)
+    inicio = time.perf_counter()
+    app.batch(dados)
+    return (time.perf_counter() - inicio) / tamanho * 1e6
+
+
+def medir_construcao(schema: type, repeticoes: int = 100_000) -> float:
+    """Custo de criar o estado de entrada (µs), validando quando é Pydantic."""
+    entrada = {"user_string": "Hello LangGraph!", "action_type": "reverse"}
+    if issubclass(schema, State):
+        criar = lambda: schema.model_validate(entrada)  # noqa: E731
+    else:
+        criar = lambda: schema(**entrada)  # noqa: E731
+    return timeit.timeit(criar, number=repeticoes) / repeticoes * 1e6
+
+
+def main() -> None:
+    """Executa a suíte e imprime uma tabela por métrica."""
+    parser = argparse.ArgumentParser(description="Custo do estado por passo.")
+    parser.add_argument("--invokes", type=int, default=2_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1_000]
+    )
+    args = parser.parse_args()
+
+    apps = {
+        nome: build_benchmark_graph(schema, getter)
+        for nome, (schema, getter) in REPRESENTACOES.items()
+    }
+    for app in apps.values():  # Aquecimento (imports tardios, caches)
+        for entrada in entradas(100):
+            app.invoke(entrada)
+
+    tabela = Table(title="Custo por invoke")
+    tabela.add_column("Estado")
+    tabela.add_column("Invoke (µs)", justify="right")
+    tabela.add_column("Pico de memória (KiB)", justify="right")
+    tabela.add_column("Construção (µs)", justify="right")
+    for nome, app in apps.items():
+        tabela.add_row(
+            nome,
+            f"{medir_invoke(app, args.invokes, args.repeats):.1f}",
+            f"{medir_alocacao(app):.1f}",
+            f"{medir_construcao(REPRESENTACOES[nome][0]):.2f}",
+        )
+    console.print(tabela)
+
+    tabela = Table(title="Escala com o lote (µs por registro em app.batch)")
+    tabela.add_column("Estado")
+    for tamanho in args.batch_sizes:
+        tabela.add_column(f"lote={tamanho}", justify="right")
+    for nome, app in apps.items():
+        tabela.add_row(nome, *(f"{medir_lote(app, t):.1f}" for t in args.batch_sizes))
+    console.print(tabela)
+
+    logger.remove()  # Os nós reais logam a cada passo; sem destino, só a chamada
+    tabela = Table(title="build_graph (nós reais)")
+    tabela.add_column("Opção")
+    tabela.add_column("Invoke (µs)", justify="right")
+    for lightweight_state in (False, True):
+        app = build_graph(lightweight_state=lightweight_state)
+        tabela.add_row(
+            f"lightweight_state={lightweight_state}",
+            f"{medir_invoke(app, args.invokes, args.repeats):.1f}",
+        )
+    console.print(tabela)
+
+
+if __name__ == "__main__":
+    main()
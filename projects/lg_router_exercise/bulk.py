@@ -0,0 +1,119 @@
+# bulk.py
+"""Módulo de processamento em lote (caminho rápido sem o grafo).
+
+Cada `app.invoke` do grafo paga validação Pydantic, agendamento do LangGraph e
+várias chamadas ao loguru por registro. Para milhões de registros
+(`user_string`, `action_type`) isso domina o tempo total. Este módulo aplica as
+mesmas transformações de `reverse_node` e `upper_node`, mas por lotes: os
+registros são lidos em blocos (`chunk_size`), agrupados por ação e cada grupo é
+transformado de uma vez com uma compreensão de lista / `map`.
+
+O resultado é idêntico ao do grafo, na mesma ordem da entrada. NumPy não é
+usado de propósito: `np.strings` trabalha com largura fixa (UTF-32), o que
+trunca casos como `"straße".upper() == "STRASSE"` e descarta `\\x00` finais,
+além de ser mais lento que `map(str.upper, ...)` por causa da conversão.
+
+Exemplo:
+    >>> process_bulk([("Hello", "reverse"), ("Python", "upper")])
+    ['olleH', 'PYTHON']
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+
+# * Mesmas operações dos nós, aplicadas a uma lista inteira de uma só vez
+TRANSFORMACOES: dict[str, Callable[[list[str]], list[str]]] = {
+    "reverse": lambda strings: [s[::-1] for s in strings],
+    "upper": lambda strings: list(map(str.upper, strings)),
+}
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _processar_bloco(bloco: list[tuple[str, str]], inicio: int) -> list[str]:
+    """Agrupa um bloco por ação, transforma cada grupo e restaura a ordem."""
+    strings, acoes = zip(*bloco, strict=True)
+
+    # * 1. Índices de cada ação dentro do bloco
+    grupos: dict[str, list[int]] = {}
+    for i, acao in enumerate(acoes):
+        grupos.setdefault(acao, []).append(i)
+
+    # * 2. Ações inválidas falham como no grafo (o Literal de `State` as rejeita)
+    for acao, indices in grupos.items():
+        if acao not in TRANSFORMACOES:
+            error_message = "Ação desconhecida"
+            raise ValueError(error_message, acao, inicio + indices[0])
+
+    # * 3. Caminho rápido: bloco com uma única ação não precisa de reordenação
+    if len(grupos) == 1:
+        return TRANSFORMACOES[acoes[0]](list(strings))
+
+    resultado: list[str] = [""] * len(bloco)
+    for acao, indices in grupos.items():
+        transformadas = TRANSFORMACOES[acao]([strings[i] for i in indices])
+        for i, valor in zip(indices, transformadas, strict=True):
+            resultado[i] = valor
+    return resultado
+
+
+def iter_process_bulk(
+    records: Iterable[tuple[str, str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[str]]:
+    """Processa os registros em blocos, devolvendo um bloco de resultados por vez.
+
+    Mantém em memória apenas `chunk_size` registros, o que permite processar
+    arquivos ou geradores com milhões de linhas.
+
+    Args:
+        records: Pares (`user_string`, `action_type`).
+        chunk_size: Quantidade de registros processados por bloco (>= 1).
+
+    Returns:
+        Iterator[list[str]]: As `processed_string` de cada bloco, na ordem da
+            entrada.
+
+    Raises:
+        ValueError: Se `chunk_size` for menor que 1 (na chamada) ou se algum
+            `action_type` não for "reverse" ou "upper" (ao consumir o bloco).
+
+    """
+    # Validado na chamada: com `islice(..., 0)` todos os registros sumiriam
+    if chunk_size < 1:
+        error_message = "chunk_size deve ser pelo menos 1"
+        raise ValueError(error_message, chunk_size)
+    return _iter_blocos(iter(records), chunk_size)
+
+
+def _iter_blocos(
+    iterador: Iterator[tuple[str, str]], chunk_size: int
+) -> Iterator[list[str]]:
+    inicio = 0
+    while bloco := list(islice(iterador, chunk_size)):
+        yield _processar_bloco(bloco, inicio)
+        inicio += len(bloco)
+
+
+def process_bulk(
+    records: Iterable[tuple[str, str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> list[str]:
+    """Processa todos os registros e devolve a lista de `processed_string`.
+
+    Equivale a `[app.invoke(...)["processed_string"] for ...]`, sem o grafo.
+
+    Args:
+        records: Pares (`user_string`, `action_type`).
+        chunk_size: Quantidade de registros processados por bloco (>= 1).
+
+    Returns:
+        list[str]: Um resultado por registro, na ordem da entrada.
+
+    Raises:
+        ValueError: Se `chunk_size` for menor que 1 ou se algum `action_type`
+            não for "reverse" ou "upper".
+
+    """
+    resultados: list[str] = []
+    for bloco in iter_process_bulk(records, chunk_size):
+        resultados.extend(bloco)
+    return resultados
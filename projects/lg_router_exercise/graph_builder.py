@@ -6,22 +6,50 @@ nós definidos em outros módulos e os conecta para criar um grafo executável.
 
 A lógica é encapsulada na função `build_graph` para evitar efeitos colaterais
 na importação e permitir a instanciação controlada do grafo.
+
+O grafo compilado é guardado em cache no módulo, por tipo de estado: só a
+primeira chamada de `build_graph(...)` no processo paga a montagem e a
+compilação. Em execuções "quentes" (workers, funções serverless reaproveitadas)
+as chamadas seguintes devolvem a mesma instância. O grafo compilado não guarda
+estado entre execuções, então compartilhá-lo é seguro.
 """
 
+from functools import lru_cache
+
 from langgraph.graph import END, StateGraph
 
-from .nodes import reverse_node, upper_node
-from .state import State
+from .nodes import reverse_node, router, upper_node
+from .state import LightweightState, State
+
+
+def build_graph(lightweight_state: bool = False) -> StateGraph:
+    """Constrói, conecta e compila o grafo de processamento de strings (com cache).
+
+    Args:
+        lightweight_state: Se True, usa `LightweightState` (dataclass sem
+            validação) no lugar do `State` Pydantic, reduzindo o custo por passo.
+
+    Returns:
+        Um grafo LangGraph compilado e pronto para ser executado. Chamadas com o
+        mesmo tipo de estado devolvem a mesma instância, qualquer que seja a forma
+        de passar o argumento (`_build.cache_clear()` força uma nova compilação).
+
+    """
+    # O cache fica em `_build`, com o argumento já normalizado: `build_graph()`,
+    # `build_graph(False)` e `build_graph(lightweight_state=False)` gerariam três
+    # chaves distintas (e três compilações) em um `lru_cache` aplicado aqui.
+    return _build(lightweight=bool(lightweight_state))
 
 
-def build_graph() -> StateGraph:
-    """Constrói, conecta e compila o grafo de processamento de strings.
+@lru_cache(maxsize=None)
+def _build(*, lightweight: bool) -> StateGraph:
+    """Monta e compila o grafo (chamado só por `build_graph`).
 
     Returns:
-        Um grafo LangGraph compilado e pronto para ser executado.
+        O grafo compilado, guardado em cache por tipo de estado.
 
     """
-    grafo = StateGraph(State)
+    grafo = StateGraph(LightweightState if lightweight else State)
 
     # * 1. Adiciona os nós que realmente fazem o trabalho (modificam o estado)
     grafo.add_node("reverse_node", reverse_node)
@@ -29,7 +57,8 @@ def build_graph() -> StateGraph:
 
     # * 2. Define o ponto de entrada como sendo a própria função de roteamento
     grafo.set_conditional_entry_point(
-        # A função que toma a decisão router,
+        # A função que toma a decisão
+        router,
         # O mapeamento de "resultado" -> "nó de destino"
         {
             "reverse_node": "reverse_node",
@@ -1,5 +1,16 @@
 # main.py (Versão Melhorada com Rich)
-"""Ponto de entrada principal para a aplicação de processamento de strings."""
+"""Ponto de entrada principal para a aplicação de processamento de strings.
+
+Uso:
+    python -m lg_router_exercise.main [--profile] [--show-graph]
+
+Com `--show-graph`, a estrutura do grafo é desenhada em ASCII (requer `grandalf`;
+desligado por padrão, pois o layout custa mais que a própria compilação). Com
+`--profile`, o grafo é instrumentado e, após os casos de teste, é impressa
+uma tabela com chamadas, erros e percentis de tempo por nó e por roteador.
+"""
+
+import argparse
 
 from loguru import logger
 from pydantic import ValidationError
@@ -8,6 +19,7 @@ from rich.panel import Panel
 from rich.text import Text
 
 from .graph_builder import build_graph
+from .profiling import profile_graph
 from .settings import get_settings
 from .state import State
 
@@ -21,8 +33,27 @@ def setup_logger() -> None:
     logger.add(lambda msg: print(msg, end=""), format="{message}")
 
 
+def parse_args() -> argparse.Namespace:
+    """Lê os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Processador de strings com LangGraph."
+    )
+    parser.add_argument(
+        "--show-graph",
+        action="store_true",
+        help="Desenha a estrutura do grafo em ASCII antes dos casos de teste",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Mede tempo, chamadas e erros por nó/roteador e imprime um resumo",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """Função principal que constrói e executa o grafo."""
+    args = parse_args()
     setup_logger()
     logger.info("🚀 Iniciando a aplicação e carregando configurações...")
     settings = get_settings()
@@ -36,9 +67,15 @@ def main() -> None:
         "[bold green]✅ Grafo construído e compilado com sucesso![/bold green]"
     )
 
-    console.print("\n[bold]--- ESTRUTURA DO GRAFO ---[/bold]")
-    app.get_graph().print_ascii()
-    console.print("[bold]--------------------------[/bold]\n")
+    if args.show_graph:
+        console.print("\n[bold]--- ESTRUTURA DO GRAFO ---[/bold]")
+        app.get_graph().print_ascii()
+        console.print("[bold]--------------------------[/bold]")
+    print()
+
+    profiler = None
+    if args.profile:
+        app, profiler = profile_graph(app)
 
     test_cases = [
         {"user_string": "Hello LangGraph!", "action_type": "reverse"},
@@ -100,6 +137,10 @@ def main() -> None:
  com falha de validação."
     )
 
+    if profiler is not None:
+        print()
+        profiler.print_summary(console)
+
 
 if __name__ == "__main__":
     main()
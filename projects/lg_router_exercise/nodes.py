@@ -12,14 +12,18 @@ para o nó apropriado com base no `action_type` definido no estado.
 
 from loguru import logger
 
-from .state import State
+from .state import LightweightState, State
 
+# * União (e não uma classe) de propósito: com uma classe na anotação, o LangGraph
+# * converteria o estado para ela, anulando `build_graph(lightweight_state=True)`
+AnyState = State | LightweightState
 
-def reverse_node(state: State) -> dict[str, str]:
+
+def reverse_node(state: AnyState) -> dict[str, str]:
     """Inverte a string contida em `state.user_string`.
 
     Args:
-        state: A instância Pydantic atual do estado do grafo.
+        state: A instância atual do estado do grafo (`State` ou `LightweightState`).
 
     Returns:
         Um dicionário contendo a chave `processed_string` com o
@@ -47,11 +51,11 @@ def reverse_node(state: State) -> dict[str, str]:
     return {"processed_string": reversed_string}
 
 
-def upper_node(state: State) -> dict[str, str]:
+def upper_node(state: AnyState) -> dict[str, str]:
     """Converta a string em `state.user_string` para maiúsculas.
 
     Args:
-        state: A instância Pydantic atual do estado do grafo.
+        state: A instância atual do estado do grafo (`State` ou `LightweightState`).
 
     Returns:
         Um dicionário contendo a chave `processed_string` com o
@@ -82,7 +86,7 @@ def upper_node(state: State) -> dict[str, str]:
 # Em nodes.py
 
 
-def router(state: State) -> str:
+def router(state: AnyState) -> str:
     """Determine o próximo nó a ser executado com base na ação definida no estado.
 
     Esta função atua como a aresta condicional principal do grafo. Ela lê
@@ -90,7 +94,7 @@ def router(state: State) -> str:
     para a próxima etapa do fluxo de trabalho.
 
     Args:
-        state (State): A instância Pydantic atual do estado do grafo,
+        state (AnyState): A instância atual do estado do grafo,
             contendo o `action_type` para roteamento.
 
     Returns:
@@ -0,0 +1,202 @@
+# profiling.py
+"""Módulo de instrumentação de grafos LangGraph compilados.
+
+Hoje o único sinal de tempo do grafo é a saída do loguru. Este módulo mede, por
+nó e por roteador condicional, o tempo de parede, o número de chamadas e o
+número de erros, guardando as durações em histogramas de baixo custo (buckets
+logarítmicos fixos: registrar uma duração é um `log2` e um incremento).
+
+A instrumentação usa callbacks do LangChain, então funciona com qualquer grafo
+compilado de um `StateGraph` (este exercício, o assistente de perguntas ou o
+fluxo linear), sem alterar os nós:
+
+    >>> app, profiler = profile_graph(build_graph())
+    >>> app.invoke({"user_string": "Hello", "action_type": "reverse"})
+    >>> profiler.print_summary()
+
+O tempo de um roteador é contado à parte e descontado do nó em que ele roda
+(a entrada condicional roda dentro de `__start__`).
+"""
+
+import math
+import threading
+import time
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
+from rich.console import Console
+from rich.table import Table
+
+BUCKETS_POR_OITAVA = 4  # Resolução: cada bucket cobre um fator de 2**(1/4) ≈ 1.19
+NUM_BUCKETS = 32 * BUCKETS_POR_OITAVA  # De 1 µs a 2**32 µs (~71 minutos)
+
+TIPO_NO = "nó"
+TIPO_ROTEADOR = "roteador"
+
+
+class LatencyHistogram:
+    """Histograma de durações com buckets logarítmicos em microssegundos.
+
+    Guarda apenas contadores (não as amostras), então a memória é constante e
+    os percentis têm erro relativo de até ~19% (a largura de um bucket).
+    """
+
+    __slots__ = ("buckets", "count", "errors", "max_s", "min_s", "total_s")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * NUM_BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.min_s = math.inf
+        self.max_s = 0.0
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        """Registra uma duração (e, se for o caso, um erro)."""
+        micros = seconds * 1e6
+        indice = int(math.log2(micros) * BUCKETS_POR_OITAVA) if micros > 1 else 0
+        self.buckets[min(indice, NUM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.errors += error
+        self.total_s += seconds
+        self.min_s = min(self.min_s, seconds)
+        self.max_s = max(self.max_s, seconds)
+
+    def percentile(self, pct: float) -> float:
+        """Percentil aproximado (limite superior do bucket), em segundos."""
+        if not self.count:
+            return 0.0
+        alvo = math.ceil(pct / 100 * self.count)
+        acumulado = 0
+        for indice, quantidade in enumerate(self.buckets):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                limite = 2 ** ((indice + 1) / BUCKETS_POR_OITAVA) / 1e6
+                return min(limite, self.max_s)
+        return self.max_s
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+
+class GraphProfiler(BaseCallbackHandler):
+    """Callback que alimenta um histograma por nó e por roteador do grafo."""
+
+    def __init__(self, app: Any) -> None:
+        """Lê os nomes dos nós e roteadores do grafo compilado.
+
+        Args:
+            app: Grafo compilado (`CompiledStateGraph`).
+
+        """
+        self.nodes = set(app.builder.nodes) | {"__start__"}
+        self.routers = {
+            nome for ramos in app.builder.branches.values() for nome in ramos
+        }
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        # run_id -> (tipo, nome, início, run_id do nó pai)
+        self._ativos: dict[UUID, tuple[str, str, float, UUID | None]] = {}
+        self._lock = threading.Lock()
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        nome = kwargs.get("name")
+        if nome in self.nodes and any(t.startswith("graph:step:") for t in tags or []):
+            tipo = TIPO_NO
+        elif nome in self.routers and parent_run_id in self._ativos:
+            tipo = TIPO_ROTEADOR
+        else:
+            return
+        with self._lock:
+            self._ativos[run_id] = (tipo, nome, time.perf_counter(), parent_run_id)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._fechar(run_id, error=False)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._fechar(run_id, error=True)
+
+    def _fechar(self, run_id: UUID, error: bool) -> None:
+        fim = time.perf_counter()
+        with self._lock:
+            ativo = self._ativos.pop(run_id, None)
+            if ativo is None:
+                return
+            tipo, nome, inicio, pai = ativo
+            duracao = fim - inicio
+            if tipo == TIPO_ROTEADOR and pai in self._ativos:
+                # O roteador roda dentro do nó pai: desconta para não contar duas vezes
+                tipo_pai, nome_pai, inicio_pai, avo = self._ativos[pai]
+                self._ativos[pai] = (tipo_pai, nome_pai, inicio_pai + duracao, avo)
+            chave = (tipo, nome)
+            if chave not in self.histograms:
+                self.histograms[chave] = LatencyHistogram()
+            self.histograms[chave].record(duracao, error)
+
+    def summary_table(self) -> Table:
+        """Tabela Rich com chamadas, erros e percentis por nó/roteador."""
+        tabela = Table(title="⏱️  Perfil do grafo (por nó e roteador)")
+        tabela.add_column("Tipo")
+        tabela.add_column("Nome")
+        for coluna in ("Chamadas", "Erros", "Média", "p50", "p95", "p99", "Máx"):
+            tabela.add_column(coluna, justify="right")
+        with self._lock:
+            itens = sorted(self.histograms.items())
+        for (tipo, nome), hist in itens:
+            tabela.add_row(
+                tipo,
+                nome,
+                str(hist.count),
+                str(hist.errors),
+                *(
+                    _formatar(s)
+                    for s in (
+                        hist.mean_s,
+                        hist.percentile(50),
+                        hist.percentile(95),
+                        hist.percentile(99),
+                        hist.max_s,
+                    )
+                ),
+            )
+        return tabela
+
+    def print_summary(self, console: Console | None = None) -> None:
+        """Imprime a tabela de resumo."""
+        (console or Console()).print(self.summary_table())
+
+
+def _formatar(segundos: float) -> str:
+    if segundos >= 1:
+        return f"{segundos:.2f} s"
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.2f} ms"
+    return f"{segundos * 1e6:.0f} µs"
+
+
+def profile_graph(app: Any) -> tuple[Runnable, GraphProfiler]:
+    """Envolve um grafo compilado com o `GraphProfiler`.
+
+    Args:
+        app: Grafo compilado (`CompiledStateGraph`).
+
+    Returns:
+        Uma tupla com o grafo instrumentado (aceita `invoke`, `stream`, `batch`
+        e suas versões assíncronas) e o profiler que acumula os histogramas.
+
+    """
+    profiler = GraphProfiler(app)
+    return app.with_config(callbacks=[profiler]), profiler
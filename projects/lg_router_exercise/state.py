@@ -8,6 +8,7 @@ A classe `State` serve como o contêiner central de dados que é passado
 entre os nós do fluxo de trabalho de processamento de texto.
 """
 
+from dataclasses import dataclass
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -54,3 +55,23 @@ class State(BaseModel):
     processed_string: str = Field(
         default="", description="A string resultante após o processamento."
     )
+
+
+@dataclass(slots=True)
+class LightweightState:
+    """Versão leve de `State`: mesmos campos, como dataclass com `__slots__`.
+
+    O LangGraph não valida dataclasses, então cada passo do grafo evita a
+    validação Pydantic: de 3% a 10% a menos por invoke em `benchmark_state.py`,
+    onde o agendamento do LangGraph domina o custo. Os nós continuam lendo os
+    campos como atributos.
+
+    Nota:
+        Sem validação, um `action_type` inválido só é detectado pelo `router`,
+        que lança `ValueError`. Valide a entrada com `State.model_validate`
+        antes do `invoke` quando ela vier de fora.
+    """
+
+    user_string: str
+    action_type: Literal["reverse", "upper"]
+    processed_string: str = ""
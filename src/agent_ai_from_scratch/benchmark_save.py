@@ -0,0 +1,179 @@
+"""Benchmark de `save_to_txt` com vários agentes gravando ao mesmo tempo.
+
+Cada "agente" é uma thread que grava `--records` registros de `--size` bytes no
+mesmo arquivo. São comparados:
+
+- `direto`: a implementação antiga (abre em append, escreve e fecha a cada
+  registro), com e sem `fsync` por registro.
+- `buffer (fsync=...)`: o `BufferedWriter` com cada política de fsync.
+
+Para cada caminho são medidos registros/s e a latência média de uma chamada. O
+arquivo final é conferido: todos os registros presentes, inteiros e sem
+intercalação.
+
+Uso (a partir de `src/agent_ai_from_scratch/`):
+
+    python benchmark_save.py
+    python benchmark_save.py --agents 32 --records 200 --size 4096
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from buffered_writer import BufferedWriter
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+CABECALHO = "--- Research Output ---\n"
+REGISTRO = re.compile(r"agent=(\d+) seq=(\d+)\n(x+)\n\n")
+
+
+def formatar(agente: int, seq: int, tamanho: int) -> str:
+    """Registro no formato de `save_to_txt`, identificado por agente e sequência."""
+    return f"{CABECALHO}agent={agente} seq={seq}\n{'x' * tamanho}\n\n"
+
+
+def escrita_direta(*, fsync: bool) -> Callable[[Path, str], None]:
+    """Implementação antiga de `save_to_txt` (opcionalmente com fsync).
+
+    Returns:
+        Callable[[Path, str], None]: Função que grava um registro no arquivo.
+
+    """
+
+    def escrever(path: Path, texto: str) -> None:
+        with path.open("a", encoding="utf-8") as f:
+            f.write(texto)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    return escrever
+
+
+def executar(
+    escrever: Callable[[Path, str], None],
+    path: Path,
+    agentes: int,
+    registros: int,
+    tamanho: int,
+) -> tuple[float, float]:
+    """Roda os agentes em paralelo.
+
+    Os registros são montados antes da largada, para medir só a gravação.
+
+    Returns:
+        tuple[float, float]: Tempo total e tempo médio de uma chamada (s).
+
+    """
+    latencias = [0.0] * agentes
+    barreira = threading.Barrier(agentes + 1)
+
+    def agente(indice: int) -> None:
+        textos = [formatar(indice, seq, tamanho) for seq in range(registros)]
+        barreira.wait()
+        inicio = time.perf_counter()
+        for texto in textos:
+            escrever(path, texto)
+        latencias[indice] = (time.perf_counter() - inicio) / registros
+
+    threads = [threading.Thread(target=agente, args=(i,)) for i in range(agentes)]
+    for t in threads:
+        t.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - inicio, sum(latencias) / agentes
+
+
+def verificar(path: Path, agentes: int, registros: int, tamanho: int) -> bool:
+    """Confere o arquivo gravado pelos agentes.
+
+    Returns:
+        bool: True se cada registro aparece uma vez, inteiro e na ordem do agente.
+
+    """
+    blocos = path.read_text(encoding="utf-8").split(CABECALHO)
+    if blocos[0] or len(blocos) - 1 != agentes * registros:
+        return False
+    ultimo = [-1] * agentes
+    for bloco in blocos[1:]:
+        casamento = REGISTRO.fullmatch(bloco)
+        if casamento is None or len(casamento.group(3)) != tamanho:
+            return False
+        agente, seq = int(casamento.group(1)), int(casamento.group(2))
+        if seq != ultimo[agente] + 1:
+            return False
+        ultimo[agente] = seq
+    return True
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a tabela de vazão por caminho."""
+    parser = argparse.ArgumentParser(description="Vazão de save_to_txt.")
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--flush-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    total = args.agents * args.records
+    tabela = Table(
+        title=f"save_to_txt: {args.agents} agentes x {args.records} registros "
+        f"de {args.size} B"
+    )
+    tabela.add_column("Caminho")
+    for coluna in ("Registros/s", "Tempo por chamada (µs)", "Lotes", "Íntegro"):
+        tabela.add_column(coluna, justify="right")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome, fsync in (("direto", False), ("direto + fsync", True)):
+            path = Path(pasta) / f"{nome}.txt"
+            tempo, latencia = executar(
+                escrita_direta(fsync=fsync), path, args.agents, args.records, args.size
+            )
+            tabela.add_row(
+                nome,
+                f"{total / tempo:,.0f}",
+                f"{latencia * 1e6:,.1f}",
+                f"{total:,}",
+                "✅" if verificar(path, args.agents, args.records, args.size) else "❌",
+            )
+
+        for politica in ("none", "batch", "always"):
+            path = Path(pasta) / f"buffer-{politica}.txt"
+            writer = BufferedWriter(
+                flush_interval_s=args.flush_interval, fsync=politica
+            )
+            inicio = time.perf_counter()
+            _, latencia = executar(
+                writer.write, path, args.agents, args.records, args.size
+            )
+            writer.close()  # Conta o tempo até o último registro chegar ao arquivo
+            tempo = time.perf_counter() - inicio
+            tabela.add_row(
+                f"buffer (fsync={politica})",
+                f"{total / tempo:,.0f}",
+                f"{latencia * 1e6:,.1f}",
+                f"{writer.stats()['flushes']:,}",
+                "✅" if verificar(path, args.agents, args.records, args.size) else "❌",
+            )
+
+    console.print(tabela)
+    console.print(
+        "Lotes = gravações no arquivo (no caminho direto, uma por registro). "
+        "No buffer, o tempo inclui o flush final."
+    )
+
+
+if __name__ == "__main__":
+    main()
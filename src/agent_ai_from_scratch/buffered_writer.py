@@ -0,0 +1,270 @@
+"""Escritor em buffer, compartilhado pelo processo, para `save_to_txt`.
+
+Antes, cada chamada da ferramenta abria o arquivo em modo append, escrevia e
+fechava: com vários agentes ao mesmo tempo são muitas escritas pequenas e sem
+sincronização. Aqui as chamadas só enfileiram o registro já formatado; uma
+thread em segundo plano grava os registros em lote:
+
+- **Política de flush:** grava quando o buffer passa de `max_buffer_bytes` ou a
+  cada `flush_interval_s` segundos, o que acontecer primeiro.
+- **Política de fsync:** `"none"` (o sistema operacional decide quando ir ao
+  disco), `"batch"` (um `fsync` por arquivo a cada lote) ou `"always"` (a
+  chamada só retorna depois do `fsync`; chamadas simultâneas dividem o mesmo
+  lote).
+- **Erros visíveis:** a primeira escrita para um arquivo o abre na hora, e uma
+  falha em segundo plano é levantada na próxima escrita para o mesmo arquivo
+  (ou, com `"always"`, na própria chamada).
+- **Sem intercalação:** cada registro é escrito inteiro e só uma thread grava
+  por vez, na ordem em que os registros chegaram.
+
+O que estiver no buffer é gravado ao chamar `flush()`/`close()` e na saída do
+processo (`atexit`).
+
+Exemplo:
+    >>> writer = BufferedWriter(flush_interval_s=0.5, fsync="batch")
+    >>> writer.write("research_output.txt", "--- Research Output ---")
+    >>> writer.close()
+"""
+
+import atexit
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["none", "batch", "always"]
+FSYNC_POLICIES: tuple[str, ...] = ("none", "batch", "always")
+
+DEFAULT_FLUSH_INTERVAL_S = 1.0
+DEFAULT_MAX_BUFFER_BYTES = 64 * 1024
+
+
+class BufferedWriter:
+    """Agrupa escritas em append por arquivo e as grava em uma thread de fundo."""
+
+    def __init__(
+        self,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        fsync: FsyncPolicy = "batch",
+    ) -> None:
+        """Inicia a thread de flush.
+
+        Args:
+            flush_interval_s (float): Tempo máximo que um registro fica no buffer.
+            max_buffer_bytes (int): Tamanho do buffer (em caracteres) que dispara
+                um flush imediato.
+            fsync (FsyncPolicy): "none", "batch" ou "always".
+
+        Raises:
+            ValueError: Se a política de fsync for desconhecida.
+
+        """
+        if fsync not in FSYNC_POLICIES:
+            error_message = f"Política de fsync inválida: {fsync!r}"
+            raise ValueError(error_message)
+        self.flush_interval_s = flush_interval_s
+        self.max_buffer_bytes = max_buffer_bytes
+        self.fsync = fsync
+
+        # Arquivo -> registros pendentes, como (número do registro, texto)
+        self._buffers: dict[str | Path, list[tuple[int, str]]] = {}
+        self._buffered_bytes = 0
+        self._seq = 0  # Número do último registro recebido
+        self._flushed_seq = 0  # Número do último registro já processado
+        # Arquivos que já abriram com sucesso (os demais são testados na chamada)
+        self._verificados: set[str | Path] = set()
+        # Falha de um lote, entregue na próxima escrita para o mesmo arquivo
+        self._erros_pendentes: dict[str | Path, OSError] = {}
+        # Com fsync "always": falha de cada registro, entregue a quem o escreveu
+        self._falhas: dict[int, OSError] = {}
+        self._lock = threading.Lock()  # Protege os buffers e os contadores
+        self._flush_lock = threading.Lock()  # Uma gravação em disco por vez
+        self._wake = threading.Event()
+        self._closed = False
+        self._stats = {"records": 0, "bytes": 0, "flushes": 0, "fsyncs": 0, "errors": 0}
+
+        self._thread = threading.Thread(
+            target=self._run, name="buffered-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, filename: str | Path, text: str) -> None:
+        """Enfileira um registro para ser acrescentado ao arquivo.
+
+        Erros de gravação nunca são engolidos: a primeira escrita para um
+        arquivo novo o abre na hora (como a implementação sem buffer), uma falha
+        de um lote em segundo plano é levantada na próxima escrita para o mesmo
+        arquivo e, com fsync "always", cada chamada recebe a falha do próprio
+        registro.
+
+        Args:
+            filename (str | Path): Arquivo de destino (modo append).
+            text (str): Registro já formatado, gravado sem alterações.
+
+        Raises:
+            RuntimeError: Se o escritor já foi fechado.
+            OSError: Se o arquivo não pode ser aberto, se registros anteriores
+                para ele foram perdidos ou (fsync "always") se este registro
+                não foi gravado.
+
+        """
+        if filename not in self._verificados:
+            with Path(filename).open("a", encoding="utf-8"):
+                pass
+            self._verificados.add(filename)
+        with self._lock:
+            if self._closed:
+                error_message = "BufferedWriter já foi fechado."
+                raise RuntimeError(error_message)
+            erro = self._erros_pendentes.pop(filename, None)
+            if erro is not None:
+                self._verificados.discard(filename)
+                error_message = (
+                    f"Registros anteriores para {filename} não foram gravados: {erro}"
+                )
+                raise OSError(error_message) from erro
+            self._seq += 1
+            seq = self._seq
+            self._buffers.setdefault(filename, []).append((seq, text))
+            self._buffered_bytes += len(text)  # Aproximação: caracteres
+            self._stats["records"] += 1
+            cheio = self._buffered_bytes >= self.max_buffer_bytes
+        if self.fsync == "always":
+            self._flush(ate_seq=seq)
+            with self._lock:
+                erro = self._falhas.pop(seq, None)
+            if erro is not None:
+                raise erro
+        elif cheio:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Grava tudo o que está no buffer (e faz fsync, conforme a política).
+
+        Os registros de um arquivo que falhar são descartados e logados; a
+        falha é entregue a quem os escreveu (ver `write`) e o primeiro `OSError`
+        também é repassado a quem chamou `flush`.
+
+        """
+        erro = self._flush()
+        if erro is not None:
+            raise erro
+
+    def _flush(self, ate_seq: int | None = None) -> OSError | None:
+        """Grava o buffer; com `ate_seq`, só se esse registro ainda não foi gravado.
+
+        Com fsync "always", quem espera a vez de gravar normalmente encontra o
+        próprio registro já gravado pelo lote anterior (group commit): um único
+        fsync atende todas as chamadas que chegaram enquanto o anterior rodava.
+
+        Returns:
+            OSError | None: A primeira falha de gravação do lote, se houver.
+
+        """
+        with self._flush_lock:
+            if ate_seq is not None and self._flushed_seq >= ate_seq:
+                return None
+            with self._lock:
+                buffers, self._buffers = self._buffers, {}
+                self._buffered_bytes = 0
+                ultimo_seq = self._seq
+            if not buffers:
+                return None
+            primeiro_erro: OSError | None = None
+            for path, registros in buffers.items():
+                dados = "".join(texto for _, texto in registros)
+                try:
+                    with Path(path).open("a", encoding="utf-8") as f:
+                        f.write(dados)
+                        if self.fsync != "none":
+                            f.flush()
+                            os.fsync(f.fileno())
+                except OSError as e:
+                    # Um arquivo com problema não impede a gravação dos demais
+                    logger.exception("Falha ao gravar %s", path)
+                    primeiro_erro = primeiro_erro or e
+                    with self._lock:
+                        self._stats["errors"] += 1
+                        if self.fsync == "always":
+                            self._falhas.update(
+                                dict.fromkeys((seq for seq, _ in registros), e)
+                            )
+                        else:
+                            self._erros_pendentes[path] = e
+                    continue
+                with self._lock:
+                    self._stats["bytes"] += len(dados.encode("utf-8"))
+                    self._stats["fsyncs"] += self.fsync != "none"
+            with self._lock:
+                self._stats["flushes"] += 1
+            # Processados: gravados ou com a falha registrada para o dono
+            self._flushed_seq = ultimo_seq
+        return primeiro_erro
+
+    def _run(self) -> None:
+        """Laço da thread de fundo: flush por tempo ou quando o buffer enche."""
+        while not self._closed:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            self._flush()  # Falhas ficam registradas para os donos dos registros
+
+    def close(self) -> None:
+        """Para a thread de fundo e grava o que restou no buffer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._thread.join()
+        erro = self._flush()
+        if erro is not None:
+            # Na saída do processo não há mais quem escreva no arquivo
+            logger.error("Registros perdidos ao fechar o BufferedWriter: %s", erro)
+
+    def stats(self) -> dict[str, int]:
+        """Resume a atividade do escritor.
+
+        Returns:
+            dict[str, int]: Registros recebidos, bytes gravados, lotes gravados,
+                fsyncs feitos e gravações que falharam.
+
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+# ---------------------------------------------------------------------------- #
+# Instância global (uma por processo)
+# ---------------------------------------------------------------------------- #
+_writer: BufferedWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> BufferedWriter:
+    """Devolve o escritor do processo, criado na primeira chamada.
+
+    Configurado pelas variáveis `SAVE_FLUSH_INTERVAL` (segundos),
+    `SAVE_MAX_BUFFER_BYTES` e `SAVE_FSYNC` ("none", "batch" ou "always").
+
+    Returns:
+        BufferedWriter: O escritor compartilhado, fechado na saída do processo.
+
+    """
+    global _writer  # noqa: PLW0603
+    with _writer_lock:
+        if _writer is None:
+            _writer = BufferedWriter(
+                flush_interval_s=float(
+                    os.getenv("SAVE_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL_S))
+                ),
+                max_buffer_bytes=int(
+                    os.getenv("SAVE_MAX_BUFFER_BYTES", str(DEFAULT_MAX_BUFFER_BYTES))
+                ),
+                fsync=os.getenv("SAVE_FSYNC", "batch"),
+            )
+            atexit.register(_writer.close)
+    return _writer
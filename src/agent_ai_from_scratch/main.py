@@ -1,9 +1,15 @@
+import asyncio
+import os
+import time
+
 from dotenv import load_dotenv
-from langchain.agents import AgentExecutor, create_openai_functions_agent
+from langchain.agents import AgentExecutor, create_openai_tools_agent
+from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
+from parallel_tools import with_timeout
 from pydantic import BaseModel
-from tools import save_tool, search_tool, wiki_tool
+from tool import save_to_txt, search_tool, wiki_tool
 
 # ---------------------------------------------------------------------------- #
 # Carrega variáveis de ambiente (ex.: OPENAI_API_KEY)
@@ -30,9 +36,10 @@ class ResearchResponse(BaseModel):
 # - pode trocar para "gpt-4o" se quiser maior qualidade em tarefas complexas
 llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
 
-# Vincula diretamente o schema Pydantic ao LLM
-# Isso garante que o retorno já será uma instância de ResearchResponse
-llm_with_structured_output = llm.with_structured_output(ResearchResponse)
+# O agente usa tool calling, então o schema vai no prompt e a resposta final é
+# convertida em ResearchResponse pelo parser (`with_structured_output` não
+# aceita ferramentas vinculadas ao mesmo tempo)
+parser = PydanticOutputParser(pydantic_object=ResearchResponse)
 
 
 # ---------------------------------------------------------------------------- #
@@ -44,31 +51,44 @@ prompt = ChatPromptTemplate.from_messages(
             "system",
             """
             You are a research assistant that will help generate a research paper.
-            Use the available tools when needed.
-            Return the final result strictly following the structured schema.
+            Use the available tools when needed. When you need several independent
+            lookups, request all of them in the same turn so they run in parallel.
+            Return the final result strictly following the structured schema and
+            provide no other text.
+            {format_instructions}
             """,
         ),
         ("placeholder", "{chat_history}"),
         ("human", "{query}"),
         ("placeholder", "{agent_scratchpad}"),
     ]
-)
+).partial(format_instructions=parser.get_format_instructions())
 
 
 # ---------------------------------------------------------------------------- #
 # Ferramentas disponíveis para o agente
 # ---------------------------------------------------------------------------- #
-tools = [search_tool, wiki_tool, save_tool]
+# Limite de tempo (s) por ferramenta: uma ferramenta lenta vira uma observação de
+# erro em vez de segurar o passo inteiro
+TOOL_TIMEOUTS = {
+    search_tool.name: float(os.getenv("SEARCH_TOOL_TIMEOUT", "15")),
+    wiki_tool.name: float(os.getenv("WIKI_TOOL_TIMEOUT", "10")),
+    save_to_txt.name: float(os.getenv("SAVE_TOOL_TIMEOUT", "5")),
+}
+
+tools = [
+    with_timeout(t, TOOL_TIMEOUTS[t.name])
+    for t in (search_tool, wiki_tool, save_to_txt)
+]
 
 
 # ---------------------------------------------------------------------------- #
 # Criação do agente e executor
 # ---------------------------------------------------------------------------- #
-agent = create_openai_functions_agent(
-    llm=llm_with_structured_output,  # já garante saída no formato ResearchResponse
-    tools=tools,
-    prompt=prompt,
-)
+# Agente de *tools* (não de *functions*): o modelo pode pedir várias ferramentas
+# no mesmo turno. Com `ainvoke`, o AgentExecutor executa essas chamadas ao mesmo
+# tempo (asyncio.gather) e devolve todos os resultados ao modelo em um só passo.
+agent = create_openai_tools_agent(llm=llm, tools=tools, prompt=prompt)
 
 agent_executor = AgentExecutor(
     agent=agent,
@@ -85,16 +105,19 @@ def main() -> None:
     """Executa o agente de pesquisa interativo no terminal."""
     query: str = input("🔎 What can I help you research? ")
 
-    # O AgentExecutor retorna {"output": ResearchResponse(...)}
-    result = agent_executor.invoke({"query": query})
+    # O AgentExecutor retorna {"output": "<JSON no formato ResearchResponse>"}
+    start = time.perf_counter()
+    result = asyncio.run(agent_executor.ainvoke({"query": query}))
+    elapsed = time.perf_counter() - start
 
-    structured_response: ResearchResponse = result["output"]
+    structured_response = parser.parse(result["output"])
 
     print("\n📌 Research Result:")
     print(f"Topic: {structured_response.topic}")
     print(f"Summary: {structured_response.summary}")
     print(f"Sources: {', '.join(structured_response.sources)}")
     print(f"Tools Used: {', '.join(structured_response.tools_used)}")
+    print(f"⏱️  Tempo total: {elapsed:.2f}s")
 
 
 if __name__ == "__main__":
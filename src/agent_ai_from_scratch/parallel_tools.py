@@ -0,0 +1,111 @@
+"""Limite de tempo por ferramenta para a execução paralela de tool calls.
+
+Com um agente de *tools* da OpenAI, o modelo pode pedir várias ferramentas no
+mesmo turno (ex.: uma busca e uma consulta ao Wikipedia). No modo assíncrono
+(`AgentExecutor.ainvoke`) todas as chamadas do turno rodam ao mesmo tempo e os
+resultados voltam ao modelo juntos, no passo seguinte. A latência do passo passa
+a ser a da ferramenta mais lenta, e não a soma de todas.
+
+Para que uma ferramenta travada não segure o passo inteiro, cada uma é envolvida
+por `TimeoutTool`: ao estourar o limite, a chamada vira uma observação de erro
+(`ToolException`) e o agente segue com os demais resultados.
+
+Exemplo:
+    >>> tools = [with_timeout(search_tool, 15), with_timeout(wiki_tool, 10)]
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.tools import BaseTool, ToolException
+
+# Threads para o modo síncrono (o modo assíncrono usa o loop de eventos). Uma
+# thread não pode ser interrompida: após o timeout, a chamada estourada continua
+# ocupando a sua thread até a ferramenta responder. O pool é limitado para que
+# ferramentas travadas não acumulem threads sem fim; com todas ocupadas, novas
+# chamadas esperam na fila (e o tempo de espera conta no limite de cada uma).
+MAX_TIMEOUT_THREADS = int(os.getenv("TOOL_TIMEOUT_THREADS", "8"))
+_executor = ThreadPoolExecutor(
+    max_workers=MAX_TIMEOUT_THREADS, thread_name_prefix="tool-timeout"
+)
+
+
+def _timeout_message(name: str, timeout_s: float) -> str:
+    return f"A ferramenta '{name}' excedeu o limite de {timeout_s:g}s sem responder."
+
+
+class TimeoutTool(BaseTool):
+    """Envolve uma ferramenta com um limite de tempo por chamada."""
+
+    inner: BaseTool
+    timeout_s: float
+    handle_tool_error: bool = True  # Timeout vira observação, não aborta o agente
+
+    @staticmethod
+    def _tool_input(args: tuple[object, ...], kwargs: dict[str, object]) -> object:
+        """Reconstrói a entrada recebida pela ferramenta, para repassá-la à original.
+
+        Returns:
+            object: A string de `.invoke("consulta")` ou o dicionário de argumentos.
+
+        """
+        if len(args) == 1 and not kwargs:
+            return args[0]
+        return kwargs
+
+    def _run(
+        self,
+        *args: object,
+        run_manager: CallbackManagerForToolRun | None = None,
+        **kwargs: object,
+    ) -> str:
+        config = {"callbacks": run_manager.get_child()} if run_manager else None
+        tool_input = self._tool_input(args, kwargs)
+        futuro = _executor.submit(self.inner.invoke, tool_input, config)
+        try:
+            return futuro.result(timeout=self.timeout_s)
+        except FutureTimeoutError as e:
+            futuro.cancel()  # Só tem efeito se a chamada ainda estava na fila
+            raise ToolException(_timeout_message(self.name, self.timeout_s)) from e
+
+    async def _arun(
+        self,
+        *args: object,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+        **kwargs: object,
+    ) -> str:
+        config = {"callbacks": run_manager.get_child()} if run_manager else None
+        tool_input = self._tool_input(args, kwargs)
+        try:
+            return await asyncio.wait_for(
+                self.inner.ainvoke(tool_input, config), timeout=self.timeout_s
+            )
+        except TimeoutError as e:
+            raise ToolException(_timeout_message(self.name, self.timeout_s)) from e
+
+
+def with_timeout(tool: BaseTool, timeout_s: float) -> TimeoutTool:
+    """Cria a versão com limite de tempo de uma ferramenta.
+
+    Args:
+        tool (BaseTool): Ferramenta original.
+        timeout_s (float): Tempo máximo, em segundos, de cada chamada.
+
+    Returns:
+        TimeoutTool: Ferramenta com o mesmo nome, descrição e argumentos.
+
+    """
+    return TimeoutTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.get_input_schema(),
+        return_direct=tool.return_direct,
+        inner=tool,
+        timeout_s=timeout_s,
+    )
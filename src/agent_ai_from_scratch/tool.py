@@ -1,17 +1,63 @@
-"""Ferramentas customizadas e externas utilizadas pelo agente de pesquisa."""
+"""Ferramentas customizadas e externas utilizadas pelo agente de pesquisa.
 
+As ferramentas de consulta (busca e Wikipedia) passam por um cache em disco
+(ver `tool_cache.py`), configurado por variáveis de ambiente:
+
+- `TOOL_CACHE_PATH`: arquivo SQLite do cache (vazio desativa o cache).
+- `SEARCH_CACHE_TTL` / `WIKI_CACHE_TTL`: validade, em segundos, por ferramenta.
+- `AGENT_TOOLS_OFFLINE=1`: troca DuckDuckGo/Wikipedia pelo backend local.
+
+`save_to_txt` grava pelo escritor em buffer do processo (ver
+`buffered_writer.py`: `SAVE_FLUSH_INTERVAL`, `SAVE_MAX_BUFFER_BYTES`,
+`SAVE_FSYNC`). Com `SAVE_FORMAT=jsonl`, cada chamada vira uma linha JSON com os
+campos `timestamp` e `data`.
+"""
+
+import json
+import os
 from datetime import datetime
 
+from buffered_writer import get_writer
 from langchain.tools import tool
 from langchain_community.tools import DuckDuckGoSearchRun, WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
+from langchain_core.tools import BaseTool
+from tool_cache import LocalBackendTool, ToolCache, cache_tool
+
+# ---------------------------------------------------------------------------- #
+# Configuração do cache das ferramentas de consulta
+# ---------------------------------------------------------------------------- #
+TOOL_CACHE_PATH = os.getenv("TOOL_CACHE_PATH", ".tool_cache.sqlite")
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "3600"))  # 1 hora
+WIKI_CACHE_TTL = float(os.getenv("WIKI_CACHE_TTL", str(7 * 24 * 3600)))  # 7 dias
+OFFLINE = os.getenv("AGENT_TOOLS_OFFLINE", "") == "1"
+
+tool_cache = ToolCache(TOOL_CACHE_PATH) if TOOL_CACHE_PATH else None
+if tool_cache is not None:
+    tool_cache.purge_expired()
+
+
+def _with_cache(tool: BaseTool, ttl_seconds: float) -> BaseTool:
+    """Envolve a ferramenta com o cache em disco, se ele estiver ativo.
+
+    Returns:
+        BaseTool: A ferramenta com cache, ou a original se o cache estiver desligado.
+
+    """
+    if tool_cache is None:
+        return tool
+    return cache_tool(tool, tool_cache, ttl_seconds)
 
 
 # ---------------------------------------------------------------------------- #
 # Função customizada para salvar resultados em arquivo
 # ---------------------------------------------------------------------------- #
+DEFAULT_OUTPUT_FILE = "research_output.txt"
+SAVE_FORMAT = os.getenv("SAVE_FORMAT", "text")  # "text" ou "jsonl"
+
+
 @tool("save_text_to_file", return_direct=False)
-def save_to_txt(data: str, filename: str | None = "research_output.txt") -> str:
+def save_to_txt(data: str, filename: str | None = DEFAULT_OUTPUT_FILE) -> str:
     """Salva dados estruturados em um arquivo .txt com timestamp.
 
     Args:
@@ -23,10 +69,20 @@ def save_to_txt(data: str, filename: str | None = "research_output.txt") -> str:
 
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    formatted_text = f"--- Research Output ---\nTimestamp: {timestamp}\n\n{data}\n\n"
+    filename = filename or DEFAULT_OUTPUT_FILE
+    if SAVE_FORMAT == "jsonl":
+        formatted_text = (
+            json.dumps({"timestamp": timestamp, "data": data}, ensure_ascii=False)
+            + "\n"
+        )
+    else:
+        formatted_text = (
+            f"--- Research Output ---\nTimestamp: {timestamp}\n\n{data}\n\n"
+        )
 
-    with open(filename, "a", encoding="utf-8") as f:
-        f.write(formatted_text)
+    # Enfileira no escritor do processo; a gravação em disco é feita em lote.
+    # Falhas de gravação sobem como OSError (nunca confirmamos um registro perdido)
+    get_writer().write(filename, formatted_text)
 
     return f"✅ Data successfully saved to {filename}"
 
@@ -34,11 +90,25 @@ def save_to_txt(data: str, filename: str | None = "research_output.txt") -> str:
 # ---------------------------------------------------------------------------- #
 # Ferramenta de busca na web (DuckDuckGo)
 # ---------------------------------------------------------------------------- #
-search_tool = DuckDuckGoSearchRun(name="search")
+if OFFLINE:
+    search_backend = LocalBackendTool(
+        name="search",
+        description=DuckDuckGoSearchRun.model_fields["description"].default,
+    )
+else:
+    search_backend = DuckDuckGoSearchRun(name="search")
+search_tool = _with_cache(search_backend, SEARCH_CACHE_TTL)
 
 
 # ---------------------------------------------------------------------------- #
 # Ferramenta de consulta ao Wikipedia
 # ---------------------------------------------------------------------------- #
-wiki_api = WikipediaAPIWrapper(top_k_results=1, doc_content_chars_max=1000)
-wiki_tool = WikipediaQueryRun(api_wrapper=wiki_api, name="wikipedia")
+if OFFLINE:
+    wiki_backend = LocalBackendTool(
+        name="wikipedia",
+        description=WikipediaQueryRun.model_fields["description"].default,
+    )
+else:
+    wiki_api = WikipediaAPIWrapper(top_k_results=1, doc_content_chars_max=1000)
+    wiki_backend = WikipediaQueryRun(api_wrapper=wiki_api, name="wikipedia")
+wiki_tool = _with_cache(wiki_backend, WIKI_CACHE_TTL)
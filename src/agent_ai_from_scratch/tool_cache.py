@@ -0,0 +1,351 @@
+"""Cache em disco dos resultados das ferramentas de pesquisa do agente.
+
+`search_tool` (DuckDuckGo) e `wiki_tool` (Wikipedia) vão à rede a cada passo do
+agente, mesmo quando a consulta se repete no mesmo run ou entre runs. Este
+módulo envolve essas ferramentas com um cache persistente em SQLite:
+
+- **TTL por ferramenta:** resultados de busca envelhecem rápido; artigos do
+  Wikipedia podem ficar dias em cache.
+- **Normalização da consulta:** maiúsculas, acentos compostos (NFKC), espaços
+  repetidos e pontuação final não geram chaves diferentes.
+- **Coalescência de requisições:** chamadas simultâneas com a mesma consulta
+  esperam uma única busca em andamento, em threads ou em corrotinas.
+- **Backend local:** `LocalBackendTool` responde a partir de um dicionário, sem
+  rede, para exercitar o agente e o cache offline.
+
+Exemplo:
+    >>> cache = ToolCache(".tool_cache.sqlite")
+    >>> search = cache_tool(DuckDuckGoSearchRun(name="search"), cache, 3600)
+    >>> search.invoke("LangChain agents")  # rede
+    >>> search.invoke("  langchain AGENTS? ")  # cache
+    >>> cache.stats()
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from pathlib import Path
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
+    CallbackManagerForToolRun,
+)
+from langchain_core.tools import BaseTool
+from pydantic import Field
+
+# ---------------------------------------------------------------------------- #
+# Normalização das consultas
+# ---------------------------------------------------------------------------- #
+PONTUACAO_FINAL = "?!.;:,"
+
+
+def normalize_query(query: str) -> str:
+    """Normaliza a consulta para uso como chave do cache.
+
+    Args:
+        query (str): Consulta enviada pelo agente.
+
+    Returns:
+        str: Consulta em NFKC, sem diferença de caixa, com espaços colapsados e
+            sem pontuação no fim.
+
+    """
+    texto = unicodedata.normalize("NFKC", query).casefold()
+    return " ".join(texto.split()).rstrip(PONTUACAO_FINAL).rstrip()
+
+
+# ---------------------------------------------------------------------------- #
+# Armazenamento persistente (SQLite) com coalescência de requisições
+# ---------------------------------------------------------------------------- #
+class ToolCache:
+    """Cache SQLite de resultados de ferramentas, seguro para threads e asyncio."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Abre (ou cria) o banco do cache.
+
+        Args:
+            path (str | Path): Arquivo SQLite (":memory:" para um cache volátil).
+
+        """
+        self._lock = threading.Lock()
+        # Buscas assíncronas em andamento (referência forte até terminarem)
+        self._tarefas: set[asyncio.Task] = set()
+        self._em_andamento: dict[tuple[str, str], Future] = {}
+        self._contadores: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "coalesced": 0}
+        )
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tool_cache ("
+                " tool TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, PRIMARY KEY (tool, key))"
+            )
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+
+    def _consultar(self, tool: str, key: str) -> tuple[str | None, Future | None, bool]:
+        """Procura a consulta no banco e nas buscas em andamento.
+
+        Deve ser chamada com `_lock` adquirido: a leitura do banco e o registro
+        da busca em andamento são atômicos, então só um chamador vira o líder.
+
+        Returns:
+            tuple[str | None, Future | None, bool]: O valor em cache, a busca a
+                aguardar e se quem chamou é o líder (quem deve fazer a busca).
+
+        """
+        contadores = self._contadores[tool]
+        row = self._conn.execute(
+            "SELECT value FROM tool_cache"
+            " WHERE tool = ? AND key = ? AND expires_at > ?",
+            (tool, key, time.time()),
+        ).fetchone()
+        if row is not None:
+            contadores["hits"] += 1
+            return row[0], None, False
+        futuro = self._em_andamento.get((tool, key))
+        if futuro is not None:
+            contadores["coalesced"] += 1
+            return None, futuro, False
+        contadores["misses"] += 1
+        futuro = Future()
+        self._em_andamento[tool, key] = futuro
+        return None, futuro, True
+
+    def _concluir(
+        self,
+        tool: str,
+        key: str,
+        ttl_seconds: float,
+        valor: str | None = None,
+        erro: BaseException | None = None,
+    ) -> None:
+        """Grava o resultado do líder (erros não são cacheados) e acorda os demais."""
+        with self._lock:
+            futuro = self._em_andamento.pop((tool, key))
+            if erro is None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO tool_cache VALUES (?, ?, ?, ?)",
+                        (tool, key, valor, time.time() + ttl_seconds),
+                    )
+        if erro is None:
+            futuro.set_result(valor)
+        else:
+            futuro.set_exception(erro)
+
+    def get_or_fetch(
+        self, tool: str, query: str, ttl_seconds: float, fetch: Callable[[], str]
+    ) -> str:
+        """Devolve o resultado em cache ou executa `fetch` (uma vez por consulta).
+
+        Args:
+            tool (str): Nome da ferramenta (namespace do cache).
+            query (str): Consulta original.
+            ttl_seconds (float): Validade do resultado, se for buscado agora.
+            fetch (Callable[[], str]): Busca o resultado no backend.
+
+        Returns:
+            str: O resultado da ferramenta.
+
+        """
+        key = self._key(query)
+        with self._lock:
+            valor, futuro, lider = self._consultar(tool, key)
+        if futuro is None:
+            return valor
+        if not lider:
+            return futuro.result()
+        try:
+            valor = fetch()
+        except BaseException as erro:
+            self._concluir(tool, key, ttl_seconds, erro=erro)
+            raise
+        self._concluir(tool, key, ttl_seconds, valor)
+        return valor
+
+    async def aget_or_fetch(
+        self,
+        tool: str,
+        query: str,
+        ttl_seconds: float,
+        afetch: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Versão assíncrona de `get_or_fetch` (aguarda sem bloquear o loop).
+
+        A busca do líder roda em uma tarefa própria, protegida por
+        `asyncio.shield`, assim como a espera dos demais: se quem chamou for
+        cancelado (ex.: o timeout de `TimeoutTool`), só ele recebe o
+        `CancelledError`; a busca continua e as outras chamadas recebem o
+        resultado normalmente.
+
+        Args:
+            tool (str): Nome da ferramenta (namespace do cache).
+            query (str): Consulta original.
+            ttl_seconds (float): Validade do resultado, se for buscado agora.
+            afetch (Callable[[], Awaitable[str]]): Busca o resultado no backend.
+
+        Returns:
+            str: O resultado da ferramenta.
+
+        """
+        key = self._key(query)
+        with self._lock:
+            valor, futuro, lider = self._consultar(tool, key)
+        if futuro is None:
+            return valor
+        if lider:
+            tarefa = asyncio.ensure_future(
+                self._abuscar(tool, key, ttl_seconds, afetch)
+            )
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+        # Sem o shield, cancelar a espera cancelaria o Future compartilhado
+        return await asyncio.shield(asyncio.wrap_future(futuro))
+
+    async def _abuscar(
+        self,
+        tool: str,
+        key: str,
+        ttl_seconds: float,
+        afetch: Callable[[], Awaitable[str]],
+    ) -> None:
+        """Executa a busca do líder e entrega o resultado (ou o erro) ao Future."""
+        try:
+            valor = await afetch()
+        except BaseException as erro:
+            self._concluir(tool, key, ttl_seconds, erro=erro)
+            if not isinstance(erro, Exception):
+                raise
+            return
+        self._concluir(tool, key, ttl_seconds, valor)
+
+    def purge_expired(self) -> int:
+        """Remove as entradas vencidas do banco.
+
+        Returns:
+            int: Quantidade de entradas apagadas.
+
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM tool_cache WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Resume o uso do cache por ferramenta.
+
+        Returns:
+            dict[str, dict[str, float]]: Acertos (`hits`), buscas no backend
+                (`misses`), chamadas que esperaram uma busca em andamento
+                (`coalesced`) e a fração de chamadas que não foi ao backend.
+
+        """
+        with self._lock:
+            resumo = {}
+            for tool, c in sorted(self._contadores.items()):
+                total = c["hits"] + c["misses"] + c["coalesced"]
+                evitadas = c["hits"] + c["coalesced"]
+                resumo[tool] = {**c, "hit_rate": evitadas / total if total else 0.0}
+            return resumo
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
+
+
+# ---------------------------------------------------------------------------- #
+# Ferramenta com cache (mesmo nome, descrição e schema da original)
+# ---------------------------------------------------------------------------- #
+class CachedTool(BaseTool):
+    """Envolve uma ferramenta de consulta textual com o `ToolCache`."""
+
+    inner: BaseTool
+    cache: ToolCache
+    ttl_seconds: float
+
+    def _run(
+        self, query: str, run_manager: CallbackManagerForToolRun | None = None
+    ) -> str:
+        config = {"callbacks": run_manager.get_child()} if run_manager else None
+        return self.cache.get_or_fetch(
+            self.name,
+            query,
+            self.ttl_seconds,
+            lambda: self.inner.invoke(query, config),
+        )
+
+    async def _arun(
+        self, query: str, run_manager: AsyncCallbackManagerForToolRun | None = None
+    ) -> str:
+        config = {"callbacks": run_manager.get_child()} if run_manager else None
+        return await self.cache.aget_or_fetch(
+            self.name,
+            query,
+            self.ttl_seconds,
+            lambda: self.inner.ainvoke(query, config),
+        )
+
+
+def cache_tool(tool: BaseTool, cache: ToolCache, ttl_seconds: float) -> CachedTool:
+    """Cria a versão com cache de uma ferramenta que recebe uma consulta (`query`).
+
+    Args:
+        tool (BaseTool): Ferramenta original (ex.: `DuckDuckGoSearchRun`).
+        cache (ToolCache): Cache compartilhado entre as ferramentas.
+        ttl_seconds (float): Validade dos resultados desta ferramenta.
+
+    Returns:
+        CachedTool: Ferramenta com o mesmo nome, descrição e argumentos.
+
+    """
+    return CachedTool(
+        name=tool.name,
+        description=tool.description,
+        args_schema=tool.args_schema,
+        inner=tool,
+        cache=cache,
+        ttl_seconds=ttl_seconds,
+    )
+
+
+# ---------------------------------------------------------------------------- #
+# Backend local (offline) para substituir DuckDuckGo/Wikipedia
+# ---------------------------------------------------------------------------- #
+class LocalBackendTool(BaseTool):
+    """Ferramenta offline: responde a partir de um dicionário, com latência simulada.
+
+    Conta as chamadas recebidas (`calls`), o que permite verificar quantas
+    consultas chegaram de fato ao "backend" depois do cache.
+    """
+
+    responses: dict[str, str] = Field(default_factory=dict)
+    latency_s: float = 0.0
+    calls: int = 0
+
+    def _resposta(self, query: str) -> str:
+        self.calls += 1
+        respostas = {normalize_query(k): v for k, v in self.responses.items()}
+        return respostas.get(
+            normalize_query(query), f"Nenhum resultado local para: {query}"
+        )
+
+    def _run(self, query: str) -> str:
+        time.sleep(self.latency_s)
+        return self._resposta(query)
+
+    async def _arun(self, query: str) -> str:
+        await asyncio.sleep(self.latency_s)
+        return self._resposta(query)
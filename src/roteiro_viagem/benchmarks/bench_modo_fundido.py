@@ -0,0 +1,111 @@
+"""Benchmark - modo encadeado vs. modo fundido
+Compara latência, consumo de tokens e taxa de falha entre o pipeline de três
+chamadas (destino -> restaurantes & passeios) e a chain fundida de uma chamada.
+
+Execute a partir do diretório `roteiro_viagem`:
+
+    python -m benchmarks.bench_modo_fundido --repeticoes 3
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+from chains.orchestrador import MODOS_DISPONIVEIS, create_main_chain
+from langchain_core.callbacks import get_usage_metadata_callback
+from utils.llm_setup import create_model, load_environment_variables
+
+INTERESSES_PADRAO = [
+    "trekking na montanha",
+    "praias históricas no nordeste",
+    "gastronomia de rua",
+    "museus de arte moderna",
+]
+
+
+def _roteiro_incompleto(resultado: dict[str, Any]) -> bool:
+    """Considera falha um roteiro sem cidade ou com alguma seção vazia
+    (o modo encadeado aplica fallback vazio em vez de levantar exceção).
+    """
+    sugestoes = resultado["sugestoes"]
+    return (
+        not resultado["destino_info"].get("cidade")
+        or not sugestoes["restaurantes"].restaurantes
+        or not sugestoes["passeios_culturais"].atracoes
+    )
+
+
+def _percentil(valores: list[float], p: float) -> float:
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, round(p / 100 * (len(ordenados) - 1)))
+    return ordenados[indice]
+
+
+def executar_benchmark(interesses: list[str], repeticoes: int) -> dict[str, dict[str, float]]:
+    """Executa cada interesse `repeticoes` vezes em cada modo e agrega as métricas."""
+    model = create_model(load_environment_variables())
+    roteiro_chain = create_main_chain(model)
+
+    relatorio: dict[str, dict[str, float]] = {}
+    for modo in MODOS_DISPONIVEIS:
+        latencias: list[float] = []
+        tokens_entrada: list[int] = []
+        tokens_saida: list[int] = []
+        falhas = 0
+
+        for _ in range(repeticoes):
+            for interesse in interesses:
+                inicio = time.perf_counter()
+                with get_usage_metadata_callback() as cb:
+                    try:
+                        resultado = roteiro_chain({"interesse": interesse, "modo": modo})
+                        falhou = _roteiro_incompleto(resultado)
+                    except Exception:  # noqa: BLE001 - toda exceção conta como falha
+                        falhou = True
+                latencias.append(time.perf_counter() - inicio)
+                falhas += falhou
+
+                uso = cb.usage_metadata.values()
+                tokens_entrada.append(sum(u["input_tokens"] for u in uso))
+                tokens_saida.append(sum(u["output_tokens"] for u in uso))
+
+        total = len(latencias)
+        relatorio[modo] = {
+            "execucoes": total,
+            "latencia_p50_s": statistics.median(latencias),
+            "latencia_p95_s": _percentil(latencias, 95),
+            "tokens_entrada_medio": statistics.fmean(tokens_entrada),
+            "tokens_saida_medio": statistics.fmean(tokens_saida),
+            "taxa_falha": falhas / total,
+        }
+
+    return relatorio
+
+
+def imprimir_relatorio(relatorio: dict[str, dict[str, float]]) -> None:
+    colunas = list(next(iter(relatorio.values())).keys())
+    print(f"\n{'métrica':<22}" + "".join(f"{modo:>14}" for modo in relatorio))
+    print("-" * (22 + 14 * len(relatorio)))
+    for coluna in colunas:
+        linha = "".join(f"{relatorio[modo][coluna]:>14.3f}" for modo in relatorio)
+        print(f"{coluna:<22}{linha}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dos modos encadeado e fundido.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções por interesse e modo.")
+    parser.add_argument(
+        "--interesse",
+        action="append",
+        dest="interesses",
+        help="Interesse a testar (pode ser repetido). Padrão: lista interna.",
+    )
+    args = parser.parse_args()
+
+    relatorio = executar_benchmark(args.interesses or INTERESSES_PADRAO, args.repeticoes)
+    imprimir_relatorio(relatorio)
+
+
+if __name__ == "__main__":
+    main()
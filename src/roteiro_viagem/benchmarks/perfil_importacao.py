@@ -0,0 +1,154 @@
+"""Perfil de importação e orçamento de startup das CLIs
+Executa cada CLI em um subprocesso com `python -X importtime`, mede o tempo de
+parede até o processo terminar e relata o custo cumulativo de importação por
+módulo. Se algum alvo passar do seu orçamento, o comando termina com código 1,
+o que permite usá-lo como verificação de regressão no CI.
+
+Execute a partir do diretório `roteiro_viagem`:
+
+    python -m benchmarks.perfil_importacao
+    python -m benchmarks.perfil_importacao --top 15 --execucoes 7
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+RAIZ_ROTEIRO = Path(__file__).resolve().parents[1]
+RAIZ_PROJECTS = Path(__file__).resolve().parents[3] / "projects"
+
+
+@dataclass(frozen=True)
+class Alvo:
+    """Um comando de startup a ser medido.
+
+    Attributes:
+        nome: Identificador do alvo no relatório.
+        argumentos: Argumentos passados ao interpretador (após `-X importtime`).
+        cwd: Diretório de execução.
+        orcamento_ms: Tempo de parede máximo (mediana); None apenas relata.
+        codigo_esperado: Código de saída esperado; um processo que quebra na
+            importação também termina rápido, então o código é conferido.
+
+    """
+
+    nome: str
+    argumentos: tuple[str, ...]
+    cwd: Path
+    orcamento_ms: float | None = None
+    codigo_esperado: int = 0
+
+
+ALVOS_PADRAO = (
+    Alvo("roteiro_viagem --help", ("main.py", "--help"), RAIZ_ROTEIRO, orcamento_ms=300),
+    Alvo(
+        "roteiro_viagem (erro de uso)",
+        ("main.py",),
+        RAIZ_ROTEIRO,
+        orcamento_ms=300,
+        codigo_esperado=2,  # argparse: argumento obrigatório ausente
+    ),
+    Alvo("import lg_router_exercise.main", ("-c", "import lg_router_exercise.main"), RAIZ_PROJECTS),
+    Alvo(
+        "import assistent_questions_project.src.main",
+        ("-c", "import assistent_questions_project.src.main"),
+        RAIZ_PROJECTS,
+    ),
+)
+
+
+@dataclass
+class Perfil:
+    """Resultado de um alvo: tempos de parede e custo cumulativo por módulo (µs)."""
+
+    alvo: Alvo
+    tempos_ms: list[float]
+    cumulativo_us: dict[str, int]
+    codigo_saida: int
+
+    @property
+    def mediana_ms(self) -> float:
+        return statistics.median(self.tempos_ms)
+
+    @property
+    def estourou(self) -> bool:
+        return self.alvo.orcamento_ms is not None and self.mediana_ms > self.alvo.orcamento_ms
+
+    @property
+    def codigo_inesperado(self) -> bool:
+        return self.codigo_saida != self.alvo.codigo_esperado
+
+
+def parse_importtime(saida_stderr: str) -> dict[str, int]:
+    """Extrai `{módulo: custo cumulativo em µs}` da saída de `-X importtime`."""
+    cumulativo: dict[str, int] = {}
+    for linha in saida_stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, _, resto = linha.partition(":")
+        _self_us, cumul_us, modulo = (parte.strip() for parte in resto.split("|"))
+        cumulativo[modulo] = max(cumulativo.get(modulo, 0), int(cumul_us))
+    return cumulativo
+
+
+def perfilar(alvo: Alvo, execucoes: int) -> Perfil:
+    """Executa o alvo `execucoes` vezes e guarda o perfil de importação da última."""
+    tempos_ms: list[float] = []
+    processo: subprocess.CompletedProcess[str] | None = None
+    for _ in range(execucoes):
+        inicio = time.perf_counter()
+        processo = subprocess.run(  # noqa: S603 - comando montado a partir de alvos fixos
+            [sys.executable, "-X", "importtime", *alvo.argumentos],
+            cwd=alvo.cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        tempos_ms.append((time.perf_counter() - inicio) * 1000)
+
+    assert processo is not None  # noqa: S101 - execucoes >= 1
+    return Perfil(alvo, tempos_ms, parse_importtime(processo.stderr), processo.returncode)
+
+
+def imprimir_perfil(perfil: Perfil, top: int) -> None:
+    orcamento = f"{perfil.alvo.orcamento_ms:.0f} ms" if perfil.alvo.orcamento_ms else "—"
+    if perfil.codigo_inesperado:
+        situacao = f"❌ CÓDIGO DE SAÍDA (esperado {perfil.alvo.codigo_esperado})"
+    else:
+        situacao = "❌ ESTOUROU" if perfil.estourou else "✅"
+    print(f"\n{situacao} {perfil.alvo.nome}")
+    print(
+        f"   startup (mediana de {len(perfil.tempos_ms)}): {perfil.mediana_ms:.1f} ms"
+        f" | orçamento: {orcamento} | código de saída: {perfil.codigo_saida}"
+    )
+    mais_caros = sorted(perfil.cumulativo_us.items(), key=lambda item: item[1], reverse=True)
+    for modulo, custo_us in mais_caros[:top]:
+        print(f"   {custo_us / 1000:>9.1f} ms  {modulo}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Perfil de importação e orçamento de startup.")
+    parser.add_argument("--execucoes", type=int, default=5, help="Execuções por alvo (usa a mediana).")
+    parser.add_argument("--top", type=int, default=10, help="Módulos mais caros exibidos por alvo.")
+    args = parser.parse_args()
+
+    perfis = [perfilar(alvo, max(1, args.execucoes)) for alvo in ALVOS_PADRAO]
+    for perfil in perfis:
+        imprimir_perfil(perfil, args.top)
+
+    estouros = [perfil.alvo.nome for perfil in perfis if perfil.estourou]
+    quebrados = [perfil.alvo.nome for perfil in perfis if perfil.codigo_inesperado]
+    if estouros:
+        print(f"\nOrçamento de startup excedido: {', '.join(estouros)}")
+    if quebrados:
+        print(f"\nCódigo de saída inesperado: {', '.join(quebrados)}")
+    if estouros or quebrados:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
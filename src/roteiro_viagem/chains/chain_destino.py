@@ -1,24 +1,21 @@
 """Chain - Destino
 A partir do interesse do usuário, a chain retorna uma cidade recomendada.
 """
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from models.pydantic_models import Destino
-from utils.logger_setup import project_logger  # Loguru
+from utils.logger_setup import debug_payload  # Loguru (preguiçoso e amostrado)
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
 
 
-def create_chain_destino(model: ChatOpenAI) -> Callable[[dict[str, Any]], Destino]:
-    """Cria uma chain que, a partir do interesse de atividade do usuário,
-    recomenda uma cidade ou região no Brasil ou no mundo onde essa atividade
-    seja especialmente atrativa, justificando a escolha.
-    """
+def _build_chain_destino(model: ChatOpenAI) -> "Runnable[dict[str, Any], Destino]":
+    """Monta prompt | model | parser da chain de destino."""
     parser = JsonOutputParser(pydantic_object=Destino)
 
     prompt = ChatPromptTemplate.from_template(
@@ -43,13 +40,41 @@ def create_chain_destino(model: ChatOpenAI) -> Callable[[dict[str, Any]], Destin
     )
 
     # Cria a chain usando o operador pipe
-    chain: Runnable[dict[str, Any], Destino] = prompt | model | parser
+    return prompt | model | parser
+
+
+def create_chain_destino(model: ChatOpenAI) -> Callable[[dict[str, Any]], Destino]:
+    """Cria uma chain que, a partir do interesse de atividade do usuário,
+    recomenda uma cidade ou região no Brasil ou no mundo onde essa atividade
+    seja especialmente atrativa, justificando a escolha.
+    """
+    chain = _build_chain_destino(model)
 
     # Função que intercepta entrada e saída para log
     def run_with_logging(inputs: dict[str, Any]) -> Destino:
-        project_logger.debug(f"[Chain Destino] Entrada recebida: {inputs}")
+        debug_payload("[Chain Destino] Entrada recebida: {}", inputs)
         output = chain.invoke(inputs)
-        project_logger.debug(f"[Chain Destino] Saída gerada: {output}")
+        debug_payload("[Chain Destino] Saída gerada: {}", output)
         return output
 
     return run_with_logging
+
+
+def create_chain_destino_stream(model: ChatOpenAI) -> Callable[[dict[str, Any]], Iterator[dict[str, Any]]]:
+    """Versão em streaming da chain de destino.
+
+    O JsonOutputParser consegue interpretar JSON incompleto, então cada chunk do
+    modelo produz um dict parcial e cumulativo (ex.: {"cidade": "Flo"}, depois
+    {"cidade": "Florianópolis", "motivo": "A ilha"}...). Isso permite exibir o
+    `motivo` token a token enquanto ele é gerado.
+    """
+    chain = _build_chain_destino(model)
+
+    def stream_with_logging(inputs: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        debug_payload("[Chain Destino] Entrada recebida (stream): {}", inputs)
+        parcial: dict[str, Any] = {}
+        for parcial in chain.stream(inputs):
+            yield parcial
+        debug_payload("[Chain Destino] Saída gerada (stream): {}", parcial)
+
+    return stream_with_logging
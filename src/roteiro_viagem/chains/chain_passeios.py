@@ -8,7 +8,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from models.pydantic_models import ListaAtracoes
-from utils.logger_setup import project_logger  # Loguru
+from utils.logger_setup import debug_payload  # Loguru (preguiçoso e amostrado)
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
@@ -35,9 +35,9 @@ def create_chain_passeios_culturais(model: ChatOpenAI) -> Callable[[dict[str, An
     chain: Runnable[dict[str, Any], ListaAtracoes] = prompt | model | parser
 
     def run_with_logging(inputs: dict[str, Any]) -> ListaAtracoes:
-        project_logger.debug(f"[Chain Passeios] Entrada recebida: {inputs}")
+        debug_payload("[Chain Passeios] Entrada recebida: {}", inputs)
         output = chain.invoke(inputs)
-        project_logger.debug(f"[Chain Passeios] Saída gerada: {output}")
+        debug_payload("[Chain Passeios] Saída gerada: {}", output)
         return output
 
     return run_with_logging
@@ -8,7 +8,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from models.pydantic_models import ListaRestaurantes
-from utils.logger_setup import project_logger  # Loguru
+from utils.logger_setup import debug_payload  # Loguru (preguiçoso e amostrado)
 
 if TYPE_CHECKING:
     from langchain_core.runnables import Runnable
@@ -38,9 +38,9 @@ def create_chain_restaurantes(model: ChatOpenAI) -> Callable[[dict[str, Any]], L
     chain: Runnable[dict[str, Any], ListaRestaurantes] = prompt | model | parser
 
     def run_with_logging(inputs: dict[str, Any]) -> ListaRestaurantes:
-        project_logger.debug(f"[Chain Restaurantes] Entrada recebida: {inputs}")
+        debug_payload("[Chain Restaurantes] Entrada recebida: {}", inputs)
         output = chain.invoke(inputs)
-        project_logger.debug(f"[Chain Restaurantes] Saída gerada: {output}")
+        debug_payload("[Chain Restaurantes] Saída gerada: {}", output)
         return output
 
     return run_with_logging
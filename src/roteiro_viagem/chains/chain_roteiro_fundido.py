@@ -0,0 +1,57 @@
+"""Chain - Roteiro Fundido
+A partir do interesse do usuário, a chain retorna destino, restaurantes e
+passeios culturais em uma única chamada ao modelo.
+"""
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_openai import ChatOpenAI
+from models.pydantic_models import RoteiroCompleto
+from utils.logger_setup import debug_payload  # Loguru (preguiçoso e amostrado)
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
+
+def create_chain_roteiro_fundido(model: ChatOpenAI) -> Callable[[dict[str, Any]], RoteiroCompleto]:
+    """Cria uma chain que, a partir do interesse de atividade do usuário,
+    recomenda um destino e, para essa mesma cidade, sugere restaurantes e
+    passeios culturais, tudo formatado de acordo com o modelo RoteiroCompleto.
+
+    Substitui as três chamadas do pipeline encadeado (destino -> restaurantes
+    e passeios) por uma só, enviando as format_instructions uma única vez.
+    """
+    parser = PydanticOutputParser(pydantic_object=RoteiroCompleto)
+
+    prompt = ChatPromptTemplate.from_template(
+        """
+        Você é um assistente especialista em turismo e gastronomia e trabalha
+        para uma agência de viagens.
+
+        O usuário informou um interesse principal de atividade: "{interesse}".
+
+        1. Recomende uma cidade ou região onde essa atividade seja muito popular
+           e bem estruturada, levando em conta condições ideais para a prática,
+           infraestrutura turística, segurança, facilidade de acesso e
+           atratividade geral. Justifique a escolha em 2-4 frases ("motivo").
+        2. Para essa mesma cidade, sugira 3 restaurantes de comida caseira de boa
+           qualidade e 3 restaurantes mais sofisticados.
+        3. Para essa mesma cidade, sugira 3 passeios culturais com nome e
+           descrição detalhada.
+
+        {format_instructions}
+        """,
+        partial_variables={"format_instructions": parser.get_format_instructions()},
+    )
+
+    chain: Runnable[dict[str, Any], RoteiroCompleto] = prompt | model | parser
+
+    def run_with_logging(inputs: dict[str, Any]) -> RoteiroCompleto:
+        debug_payload("[Chain Roteiro Fundido] Entrada recebida: {}", inputs)
+        output = chain.invoke(inputs)
+        debug_payload("[Chain Roteiro Fundido] Saída gerada: {}", output)
+        return output
+
+    return run_with_logging
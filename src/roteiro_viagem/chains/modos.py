@@ -0,0 +1,9 @@
+"""Modos de execução do orquestrador.
+
+Ficam em um módulo próprio, sem dependências, para que a CLI possa validar
+argumentos sem importar LangChain.
+"""
+
+MODO_ENCADEADO = "encadeado"  # 3 chamadas: destino -> restaurantes & passeios
+MODO_FUNDIDO = "fundido"  # 1 chamada com saída estruturada composta
+MODOS_DISPONIVEIS = (MODO_ENCADEADO, MODO_FUNDIDO)
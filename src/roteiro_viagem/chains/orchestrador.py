@@ -3,19 +3,152 @@
 Este orquestrador executa as chains em sequência (destino -> restaurantes & passeios),
 normaliza os modelos Pydantic para `dict`, valida valores essenciais (ex.: cidade)
 e aplica fallbacks em caso de erro nas subchains.
+
+Também oferece um modo "fundido", em que destino, restaurantes e passeios são
+gerados por uma única chamada ao LLM. O modo é escolhido por requisição através
+da chave opcional `"modo"` nos inputs.
+
+Para interfaces interativas, `create_main_stream` devolve as seções como um
+fluxo de eventos (cidade, tokens do motivo, destino, restaurantes, passeios)
+à medida que ficam prontas.
 """
 
-from collections.abc import Callable
-from typing import Any
+import contextvars
+import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
-from chains.chain_destino import create_chain_destino
+from chains.chain_destino import create_chain_destino, create_chain_destino_stream
 from chains.chain_passeios import create_chain_passeios_culturais
 from chains.chain_restaurante import create_chain_restaurantes
+from chains.chain_roteiro_fundido import create_chain_roteiro_fundido
+from chains.modos import MODO_ENCADEADO, MODO_FUNDIDO, MODOS_DISPONIVEIS
 from models.pydantic_models import ListaAtracoes, ListaRestaurantes
-from utils.logger_setup import project_logger  # Loguru
+from utils.hedging import Hedger
+from utils.logger_setup import debug_payload, project_logger  # Loguru
+from utils.telemetria import Telemetria
+
+# Abre o span de uma etapa (ou um contexto nulo quando a telemetria está desligada)
+Medidor = Callable[[str], AbstractContextManager[Any]]
+
+T = TypeVar("T")
+
+# Tipos de evento emitidos por create_main_stream
+EVENTO_CIDADE = "cidade"  # cidade recomendada (antes do motivo terminar)
+EVENTO_MOTIVO_TOKEN = "motivo_token"  # trecho novo do texto do motivo
+EVENTO_DESTINO = "destino"  # destino completo e validado
+EVENTO_RESTAURANTES = "restaurantes"
+EVENTO_PASSEIOS = "passeios"
+EVENTO_CONCLUIDO = "concluido"  # roteiro completo, no mesmo formato de create_main_chain
+
+
+@dataclass(frozen=True)
+class EventoRoteiro:
+    """Evento do fluxo de geração do roteiro."""
+
+    tipo: str
+    dados: Any
+
+
+# ---------------------------------------------------------------------------- #
+# Etapas compartilhadas entre a execução direta e a execução em streaming
+# ---------------------------------------------------------------------------- #
+def _resolver_modo(inputs: dict[str, Any], modo_padrao: str) -> str:
+    modo = inputs.get("modo", modo_padrao)
+    if modo not in MODOS_DISPONIVEIS:
+        msg = f"Modo inválido: {modo!r}. Opções: {MODOS_DISPONIVEIS}"
+        project_logger.error(f"[Orquestrador] {msg}")
+        raise ValueError(msg)
+    project_logger.debug("[Orquestrador] Modo de execução: {}", modo)
+    return modo
+
+
+def _criar_medidor(telemetria: Telemetria | None) -> Medidor:
+    """Cria o medidor de spans de uma execução (um trace_id por roteiro)."""
+    trace_id = uuid.uuid4().hex
+
+    def medir(etapa: str) -> AbstractContextManager[Any]:
+        if telemetria is None:
+            return nullcontext()
+        return telemetria.span(etapa, trace_id=trace_id)
+
+    return medir
+
+
+def _normalizar_destino(destino: Any) -> dict[str, Any]:
+    """Normaliza destino para dict (suporta Pydantic BaseModel ou dicts)."""
+    if hasattr(destino, "dict"):
+        destino_dict = destino.model_dump()
+    elif isinstance(destino, dict):
+        destino_dict = destino
+    else:
+        # objeto inesperado: tenta extrair atributos básicos
+        destino_dict = {
+            "cidade": getattr(destino, "cidade", None),
+            "motivo": getattr(destino, "motivo", None),
+        }
+
+    debug_payload("[Orquestrador] Destino normalizado: {!r}", destino_dict)
+    return destino_dict
+
 
+def _validar_cidade(destino_dict: dict[str, Any], nome_chain: str) -> str:
+    """Valida a presença de 'cidade' (campo essencial) e a devolve."""
+    cidade = destino_dict.get("cidade")
+    if not cidade:
+        msg = f"{nome_chain} não retornou 'cidade' válida. Resultado: {destino_dict!r}"
+        project_logger.error(f"[Orquestrador] {msg}")
+        raise ValueError(msg)
+    return cidade
 
-def create_main_chain(model) -> Callable[[dict[str, Any]], dict[str, Any]]:
+
+def _executar_com_fallback(
+    chain: Callable[[dict[str, Any]], T], cidade: str, etapa: str, medir: Medidor, fallback: T
+) -> T:
+    """Executa uma subchain (restaurantes ou passeios) aplicando fallback em caso de erro."""
+    try:
+        with medir(etapa):
+            resultado = chain({"cidade": cidade})
+        debug_payload("[Orquestrador] {} raw: {!r}", etapa.capitalize(), resultado)
+    except Exception:
+        project_logger.exception(f"[Orquestrador] Erro em chain_{etapa} — aplicando fallback vazio")
+        return fallback
+    return resultado
+
+
+def _run_fundido(
+    chain_roteiro_fundido: Callable[[dict[str, Any]], Any], inputs: dict[str, Any], medir: Medidor
+) -> dict[str, Any]:
+    # Uma única chamada: não há subchains independentes para aplicar fallback
+    try:
+        with medir("roteiro_fundido"):
+            roteiro = chain_roteiro_fundido({"interesse": inputs["interesse"]})
+        debug_payload("[Orquestrador] Resultado raw fundido: {!r}", roteiro)
+    except Exception as e:
+        project_logger.exception("[Orquestrador] Falha ao executar chain_roteiro_fundido")
+        raise RuntimeError("Erro ao gerar roteiro no modo fundido") from e
+
+    destino_dict = roteiro.destino.model_dump()
+    _validar_cidade(destino_dict, "chain_roteiro_fundido")
+
+    return {
+        "destino_info": destino_dict,
+        "sugestoes": {
+            "restaurantes": roteiro.restaurantes,
+            "passeios_culturais": roteiro.passeios,
+        },
+    }
+
+
+def create_main_chain(
+    model,
+    modo_padrao: str = MODO_ENCADEADO,
+    hedger_destino: Hedger | None = None,
+    telemetria: Telemetria | None = None,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
     """Cria a função principal que orquestra a geração do roteiro.
 
     Retorna um callable que recebe um dicionário de inputs (ex.: {"interesse": "trekking"})
@@ -27,62 +160,55 @@ def create_main_chain(model) -> Callable[[dict[str, Any]], dict[str, Any]]:
             "passeios_culturais": ListaAtracoes(...)
         }
     }
+
+    O modo de execução pode ser trocado por requisição com a chave `"modo"`
+    (ex.: {"interesse": "trekking", "modo": "fundido"}); na ausência dela,
+    usa-se `modo_padrao`.
+
+    Opcionalmente, `hedger_destino` aplica hedged requests à chain_destino (que
+    está no caminho crítico do modo encadeado) para reduzir a latência de cauda.
+    Os contadores ficam disponíveis em `hedger_destino.stats()`.
+
+    Com `telemetria`, cada etapa (destino, restaurantes, passeios, parsing ou
+    roteiro_fundido) gera um span com tempo, tokens, retries e cache hits.
     """
+    if modo_padrao not in MODOS_DISPONIVEIS:
+        msg = f"Modo inválido: {modo_padrao!r}. Opções: {MODOS_DISPONIVEIS}"
+        raise ValueError(msg)
+
     # Cria as chains (cada uma é um callable que envolve prompt|model|parser + logging)
     chain_destino = create_chain_destino(model)
+    if hedger_destino is not None:
+        chain_destino = hedger_destino.wrap(chain_destino)
     chain_restaurantes = create_chain_restaurantes(model)
     chain_passeios_culturais = create_chain_passeios_culturais(model)
+    chain_roteiro_fundido = create_chain_roteiro_fundido(model)
 
-    def run_main(inputs: dict[str, Any]) -> dict[str, Any]:
-        project_logger.info("[Orquestrador] Iniciando execução do roteiro")
-        project_logger.debug(f"[Orquestrador] Inputs iniciais: {inputs!r}")
-
+    def run_encadeado(inputs: dict[str, Any], medir: Medidor) -> dict[str, Any]:
         # 1) Executa chain_destino e normaliza o resultado
         try:
-            destino = chain_destino(inputs)
-            project_logger.debug(f"[Orquestrador] Resultado raw destino: {destino!r}")
+            with medir("destino"):
+                destino = chain_destino(inputs)
+            debug_payload("[Orquestrador] Resultado raw destino: {!r}", destino)
         except Exception as e:
             project_logger.exception("[Orquestrador] Falha ao executar chain_destino")
             raise RuntimeError("Erro ao determinar destino a partir do interesse do usuário") from e
 
-        # Normalizar destino para dict (suporta Pydantic BaseModel ou dicts)
-        if hasattr(destino, "dict"):
-            destino_dict = destino.model_dump()
-        elif isinstance(destino, dict):
-            destino_dict = destino
-        else:
-            # objeto inesperado: tenta extrair atributos básicos
-            destino_dict = {
-                "cidade": getattr(destino, "cidade", None),
-                "motivo": getattr(destino, "motivo", None),
-            }
-
-        project_logger.debug(f"[Orquestrador] Destino normalizado: {destino_dict!r}")
+        destino_dict = _normalizar_destino(destino)
 
         # 2) Validar presença de 'cidade' (campo essencial)
-        cidade = destino_dict.get("cidade")
-        if not cidade:
-            msg = f"chain_destino não retornou 'cidade' válida. Resultado: {destino_dict!r}"
-            project_logger.error(f"[Orquestrador] {msg}")
-            raise ValueError(msg)
+        cidade = _validar_cidade(destino_dict, "chain_destino")
 
         # 3) Executar subchains (restaurantes e passeios) com tratamento de erro.
         #    Executamos sequencialmente aqui para ter logs claros e controle de fallback.
-        try:
-            restaurantes = chain_restaurantes({"cidade": cidade})
-            project_logger.debug(f"[Orquestrador] Restaurantes raw: {restaurantes!r}")
-        except Exception:
-            project_logger.exception("[Orquestrador] Erro em chain_restaurantes — aplicando fallback vazio")
-            restaurantes = ListaRestaurantes(restaurantes=[])
+        restaurantes = _executar_com_fallback(
+            chain_restaurantes, cidade, "restaurantes", medir, ListaRestaurantes(restaurantes=[])
+        )
+        passeios = _executar_com_fallback(
+            chain_passeios_culturais, cidade, "passeios", medir, ListaAtracoes(atracoes=[])
+        )
 
-        try:
-            passeios = chain_passeios_culturais({"cidade": cidade})
-            project_logger.debug(f"[Orquestrador] Passeios raw: {passeios!r}")
-        except Exception:
-            project_logger.exception("[Orquestrador] Erro em chain_passeios — aplicando fallback vazio")
-            passeios = ListaAtracoes(atracoes=[])
-
-        resultado = {
+        return {
             "destino_info": destino_dict,
             "sugestoes": {
                 "restaurantes": restaurantes,
@@ -90,9 +216,134 @@ def create_main_chain(model) -> Callable[[dict[str, Any]], dict[str, Any]]:
             },
         }
 
+    def run_main(inputs: dict[str, Any]) -> dict[str, Any]:
+        project_logger.info("[Orquestrador] Iniciando execução do roteiro")
+        debug_payload("[Orquestrador] Inputs iniciais: {!r}", inputs)
+
+        modo = _resolver_modo(inputs, modo_padrao)
+        medir = _criar_medidor(telemetria)
+
+        if modo == MODO_FUNDIDO:
+            resultado = _run_fundido(chain_roteiro_fundido, inputs, medir)
+        else:
+            resultado = run_encadeado(inputs, medir)
+
         project_logger.info("[Orquestrador] Execução finalizada com sucesso")
-        project_logger.debug(f"[Orquestrador] Resultado final: {resultado!r}")
+        debug_payload("[Orquestrador] Resultado final: {!r}", resultado)
 
         return resultado
 
     return run_main
+
+
+def create_main_stream(
+    model,
+    modo_padrao: str = MODO_ENCADEADO,
+    telemetria: Telemetria | None = None,
+) -> Callable[[dict[str, Any]], Iterator[EventoRoteiro]]:
+    """Cria a versão em streaming do orquestrador.
+
+    Retorna um callable que recebe os mesmos inputs de `create_main_chain` e gera
+    eventos `EventoRoteiro` assim que cada parte do roteiro fica pronta:
+
+    1. `cidade` e vários `motivo_token` enquanto a chain de destino gera o texto;
+    2. `destino` com o dict completo e validado;
+    3. `restaurantes` e `passeios`, na ordem em que terminarem (as duas subchains
+       rodam em paralelo, já que dependem apenas da cidade);
+    4. `concluido` com o roteiro completo, no formato de `create_main_chain`.
+
+    No modo fundido não há etapas intermediárias: as seções são emitidas juntas
+    quando a chamada única termina. Hedging não se aplica ao destino em streaming.
+    """
+    if modo_padrao not in MODOS_DISPONIVEIS:
+        msg = f"Modo inválido: {modo_padrao!r}. Opções: {MODOS_DISPONIVEIS}"
+        raise ValueError(msg)
+
+    stream_destino = create_chain_destino_stream(model)
+    chain_restaurantes = create_chain_restaurantes(model)
+    chain_passeios_culturais = create_chain_passeios_culturais(model)
+    chain_roteiro_fundido = create_chain_roteiro_fundido(model)
+
+    def stream_destino_com_eventos(inputs: dict[str, Any], medir: Medidor) -> Iterator[EventoRoteiro]:
+        cidade_emitida = False
+        motivo_emitido = ""
+        destino: Any = {}
+        try:
+            with medir("destino"):
+                for destino in stream_destino(inputs):
+                    if not isinstance(destino, dict):
+                        continue
+                    motivo = destino.get("motivo")
+                    # A cidade está completa quando o parser já começou a ler o motivo
+                    if not cidade_emitida and motivo is not None and destino.get("cidade"):
+                        cidade_emitida = True
+                        yield EventoRoteiro(EVENTO_CIDADE, destino["cidade"])
+                    if cidade_emitida and isinstance(motivo, str) and len(motivo) > len(motivo_emitido):
+                        yield EventoRoteiro(EVENTO_MOTIVO_TOKEN, motivo[len(motivo_emitido) :])
+                        motivo_emitido = motivo
+            debug_payload("[Orquestrador] Resultado raw destino: {!r}", destino)
+        except Exception as e:
+            project_logger.exception("[Orquestrador] Falha ao executar chain_destino")
+            raise RuntimeError("Erro ao determinar destino a partir do interesse do usuário") from e
+
+        destino_dict = _normalizar_destino(destino)
+        _validar_cidade(destino_dict, "chain_destino")
+        yield EventoRoteiro(EVENTO_DESTINO, destino_dict)
+
+    def stream_main(inputs: dict[str, Any]) -> Iterator[EventoRoteiro]:
+        project_logger.info("[Orquestrador] Iniciando execução do roteiro (streaming)")
+        debug_payload("[Orquestrador] Inputs iniciais: {!r}", inputs)
+
+        modo = _resolver_modo(inputs, modo_padrao)
+        medir = _criar_medidor(telemetria)
+
+        if modo == MODO_FUNDIDO:
+            resultado = _run_fundido(chain_roteiro_fundido, inputs, medir)
+            yield EventoRoteiro(EVENTO_DESTINO, resultado["destino_info"])
+            yield EventoRoteiro(EVENTO_RESTAURANTES, resultado["sugestoes"]["restaurantes"])
+            yield EventoRoteiro(EVENTO_PASSEIOS, resultado["sugestoes"]["passeios_culturais"])
+        else:
+            destino_dict: dict[str, Any] = {}
+            for evento in stream_destino_com_eventos(inputs, medir):
+                if evento.tipo == EVENTO_DESTINO:
+                    destino_dict = evento.dados
+                yield evento
+
+            cidade = destino_dict["cidade"]
+            subchains = {
+                EVENTO_RESTAURANTES: (chain_restaurantes, ListaRestaurantes(restaurantes=[])),
+                EVENTO_PASSEIOS: (chain_passeios_culturais, ListaAtracoes(atracoes=[])),
+            }
+            sugestoes: dict[str, Any] = {}
+            with ThreadPoolExecutor(max_workers=len(subchains), thread_name_prefix="secao") as executor:
+                # Cada thread recebe uma cópia do contexto (spans de telemetria via contextvars)
+                futuros = {
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        _executar_com_fallback,
+                        chain,
+                        cidade,
+                        tipo,
+                        medir,
+                        fallback,
+                    ): tipo
+                    for tipo, (chain, fallback) in subchains.items()
+                }
+                for futuro in as_completed(futuros):
+                    tipo = futuros[futuro]
+                    sugestoes[tipo] = futuro.result()
+                    yield EventoRoteiro(tipo, sugestoes[tipo])
+
+            resultado = {
+                "destino_info": destino_dict,
+                "sugestoes": {
+                    "restaurantes": sugestoes[EVENTO_RESTAURANTES],
+                    "passeios_culturais": sugestoes[EVENTO_PASSEIOS],
+                },
+            }
+
+        project_logger.info("[Orquestrador] Execução finalizada com sucesso")
+        debug_payload("[Orquestrador] Resultado final: {!r}", resultado)
+        yield EventoRoteiro(EVENTO_CONCLUIDO, resultado)
+
+    return stream_main
@@ -21,10 +21,13 @@ Example:
     ```
 
 Attributes:
-    settings (Settings): Instância global das configurações da aplicação.
+    settings (Settings): Instância global das configurações da aplicação,
+        criada (e validada) apenas no primeiro acesso. Prefira `get_settings()`.
 
 """
 
+from functools import lru_cache
+from typing import Any
 
 from pydantic import SecretStr, field_validator
 from pydantic_settings import BaseSettings
@@ -125,8 +128,21 @@ class Settings(BaseSettings):
         return v
 
 
-# Instância global das configurações
-settings = Settings()  # type: ignore
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Carrega e valida as configurações na primeira chamada e as reutiliza depois.
+
+    Adiar a leitura do `.env` evita que um simples `import config` (ou o `--help`
+    da CLI) pague pela validação ou falhe por falta de chaves de API.
+    """
+    return Settings()  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    """Mantém `from config import settings` funcionando, agora de forma preguiçosa."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
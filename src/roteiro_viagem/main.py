@@ -3,75 +3,225 @@ Executa o fluxo principal do projeto:
 - Recebe interesse de atividade do usuário
 - Gera destino sugerido
 - Lista restaurantes e passeios culturais
+
+Por padrão, cada seção do roteiro é exibida assim que fica pronta (o motivo do
+destino aparece token a token); `--sem-streaming` espera o roteiro completo.
+
+Com `--lote`, processa vários interesses (de um arquivo ou stdin) em um único
+processo, gravando cada roteiro como uma linha JSONL assim que fica pronto.
+
+Os módulos pesados (LangChain, OpenAI, Loguru) só são importados depois que os
+argumentos foram validados, para que `--help` e erros de uso respondam em
+milissegundos.
 """
 
 import argparse
+import sys
+
+from chains.modos import MODO_ENCADEADO, MODOS_DISPONIVEIS
+
+
+TITULO_SUCESSO = "✨ ROTEIRO DE VIAGEM GERADO COM SUCESSO! ✨"
+TITULO_EM_ANDAMENTO = "🧳 ROTEIRO DE VIAGEM"
+
+
+def print_cabecalho(titulo: str = TITULO_SUCESSO) -> None:
+    print("\n" + "=" * 50)
+    print(titulo)
+    print("=" * 50)
+
 
-from chains.orchestrador import create_main_chain
-from utils.llm_setup import create_model, load_environment_variables
-from utils.logger_setup import project_logger
+def print_restaurantes(restaurantes) -> None:
+    if not restaurantes:
+        return
+    print("\n🍴 Restaurantes Recomendados:")
+    lista_restaurantes = getattr(restaurantes, "restaurantes", None)
+    if lista_restaurantes is None:
+        lista_restaurantes = restaurantes.get("restaurantes", [])
+    for r in lista_restaurantes:
+        nome = getattr(r, "nome", None) or r.get("nome")
+        tipo = getattr(r, "tipo", None) or r.get("tipo")
+        descricao = getattr(r, "descricao", None) or r.get("descricao")
+        print(f"   - {nome} ({tipo}): {descricao}")
+
+
+def print_passeios(passeios) -> None:
+    if not passeios:
+        return
+    print("\n🏛️ Passeios Culturais:")
+    lista_passeios = getattr(passeios, "atracoes", None)
+    if lista_passeios is None:
+        lista_passeios = passeios.get("atracoes", [])
+    for p in lista_passeios:
+        nome = getattr(p, "nome", None) or p.get("nome")
+        descricao = getattr(p, "descricao", None) or p.get("descricao")
+        print(f"   - {nome}: {descricao}")
 
 
 def format_and_print_roteiro(resultado: dict) -> None:
     """Formata e apresenta o resultado final no terminal.
     Aceita tanto objetos Pydantic quanto dicionários.
     """
-    print("\n" + "=" * 50)
-    print("✨ ROTEIRO DE VIAGEM GERADO COM SUCESSO! ✨")
-    print("=" * 50)
+    print_cabecalho()
 
     destino_info = resultado.get("destino_info", {})
     sugestoes = resultado.get("sugestoes", {})
 
     # Tratamento seguro para Pydantic ou dict
-    cidade = getattr(destino_info, "cidade", destino_info.get("cidade", "N/A"))
-    motivo = getattr(destino_info, "motivo", destino_info.get("motivo", "N/A"))
+    cidade = getattr(destino_info, "cidade", None) or destino_info.get("cidade", "N/A")
+    motivo = getattr(destino_info, "motivo", None) or destino_info.get("motivo", "N/A")
 
     print(f"\n📍 Destino Recomendado: {cidade}")
     print(f"   Motivo: {motivo}")
 
-    restaurantes = sugestoes.get("restaurantes")
-    if restaurantes:
-        print("\n🍴 Restaurantes Recomendados:")
-        lista_restaurantes = getattr(restaurantes, "restaurantes", restaurantes.get("restaurantes", []))
-        for r in lista_restaurantes:
-            nome = getattr(r, "nome", r.get("nome"))
-            tipo = getattr(r, "tipo", r.get("tipo"))
-            descricao = getattr(r, "descricao", r.get("descricao"))
-            print(f"   - {nome} ({tipo}): {descricao}")
-
-    passeios = sugestoes.get("passeios_culturais")
-    if passeios:
-        print("\n🏛️ Passeios Culturais:")
-        lista_passeios = getattr(passeios, "atracoes", passeios.get("atracoes", []))
-        for p in lista_passeios:
-            nome = getattr(p, "nome", p.get("nome"))
-            descricao = getattr(p, "descricao", p.get("descricao"))
-            print(f"   - {nome}: {descricao}")
+    print_restaurantes(sugestoes.get("restaurantes"))
+    print_passeios(sugestoes.get("passeios_culturais"))
 
     print("\n" + "=" * 50)
 
 
+def render_stream(eventos) -> dict:
+    """Apresenta o roteiro seção por seção, conforme os eventos do orquestrador chegam.
+
+    O motivo do destino é impresso token a token; restaurantes e passeios aparecem
+    assim que cada subchain termina. O título de sucesso só é impresso ao final,
+    depois do evento `concluido`: uma falha no meio do stream não o exibe.
+    Retorna o roteiro completo (evento `concluido`).
+    """
+    from chains.orchestrador import (  # noqa: PLC0415
+        EVENTO_CIDADE,
+        EVENTO_CONCLUIDO,
+        EVENTO_DESTINO,
+        EVENTO_MOTIVO_TOKEN,
+        EVENTO_PASSEIOS,
+        EVENTO_RESTAURANTES,
+    )
+
+    # O roteiro ainda não existe: o título de sucesso só sai depois do `concluido`
+    print_cabecalho(TITULO_EM_ANDAMENTO)
+    motivo_em_streaming = False
+    resultado: dict = {}
+    for evento in eventos:
+        if evento.tipo == EVENTO_CIDADE:
+            print(f"\n📍 Destino Recomendado: {evento.dados}")
+            print("   Motivo: ", end="", flush=True)
+            motivo_em_streaming = True
+        elif evento.tipo == EVENTO_MOTIVO_TOKEN:
+            print(evento.dados, end="", flush=True)
+        elif evento.tipo == EVENTO_DESTINO:
+            if motivo_em_streaming:
+                print()
+            else:
+                # Sem streaming (ex.: modo fundido): a seção chega inteira
+                print(f"\n📍 Destino Recomendado: {evento.dados.get('cidade', 'N/A')}")
+                print(f"   Motivo: {evento.dados.get('motivo', 'N/A')}")
+        elif evento.tipo == EVENTO_RESTAURANTES:
+            print_restaurantes(evento.dados)
+        elif evento.tipo == EVENTO_PASSEIOS:
+            print_passeios(evento.dados)
+        elif evento.tipo == EVENTO_CONCLUIDO:
+            resultado = evento.dados
+        sys.stdout.flush()
+
+    if resultado:
+        print_cabecalho(TITULO_SUCESSO)
+    else:
+        print("\n" + "=" * 50)
+    return resultado
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser de argumentos (sem importar nenhuma dependência pesada)."""
+    parser = argparse.ArgumentParser(description="Gerador de Roteiro de Viagem com LangChain.")
+    parser.add_argument(
+        "interesse",
+        type=str,
+        nargs="?",
+        help="Descreva o seu interesse de viagem. Ex: 'praias históricas no nordeste'",
+    )
+    parser.add_argument(
+        "--modo",
+        choices=MODOS_DISPONIVEIS,
+        default=MODO_ENCADEADO,
+        help="'encadeado' faz 3 chamadas ao LLM; 'fundido' gera o roteiro em uma única chamada.",
+    )
+    parser.add_argument(
+        "--telemetria",
+        metavar="ARQUIVO_JSONL",
+        help="Grava spans por etapa (tempo, tokens, retries, cache hits) neste arquivo JSONL.",
+    )
+    parser.add_argument(
+        "--metricas",
+        action="store_true",
+        help="Ao final, imprime os histogramas por etapa no formato de texto do Prometheus.",
+    )
+    parser.add_argument(
+        "--sem-streaming",
+        action="store_true",
+        help="Espera o roteiro completo antes de exibi-lo (por padrão, as seções aparecem ao ficar prontas).",
+    )
+    parser.add_argument(
+        "--lote",
+        metavar="ARQUIVO",
+        help="Processa um interesse por linha deste arquivo ('-' para stdin) e emite JSONL.",
+    )
+    parser.add_argument(
+        "--saida",
+        metavar="ARQUIVO_JSONL",
+        help="Arquivo JSONL do modo em lote (padrão: stdout). Reexecutar retoma de onde parou.",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Roteiros gerados em paralelo no modo em lote."
+    )
+    return parser
+
+
 def main() -> None:
     """Função principal que executa o fluxo."""
-    parser = argparse.ArgumentParser(description="Gerador de Roteiro de Viagem com LangChain.")
-    parser.add_argument("interesse", type=str, help="Descreva o seu interesse de viagem. Ex: 'praias históricas no nordeste'")
+    parser = build_parser()
     args = parser.parse_args()
+    if (args.interesse is None) == (args.lote is None):
+        parser.error("informe um interesse ou --lote ARQUIVO (mas não ambos)")
+    if args.workers < 1:
+        parser.error("--workers deve ser pelo menos 1")
+
+    # Imports tardios: só pagamos por LangChain/OpenAI quando há trabalho a fazer
+    from chains.orchestrador import create_main_chain, create_main_stream  # noqa: PLC0415
+    from processamento_lote import executar_lote  # noqa: PLC0415
+    from utils.llm_setup import create_model, load_environment_variables  # noqa: PLC0415
+    from utils.logger_setup import project_logger, setup_logger  # noqa: PLC0415
+    from utils.telemetria import Telemetria  # noqa: PLC0415
+
+    # No modo em lote sem --saida, o stdout carrega o JSONL: logs vão para o stderr
+    setup_logger(console=sys.stderr if args.lote and not args.saida else sys.stdout)
 
     try:
         project_logger.info("🚀 Iniciando geração de roteiro...")
-        project_logger.debug(f"Interesse informado pelo usuário: {args.interesse}")
+        project_logger.debug("Interesse informado pelo usuário: {}", args.interesse)
 
         api_key = load_environment_variables()
         model = create_model(api_key)
 
-        roteiro_completo_chain = create_main_chain(model)
+        telemetria = Telemetria(args.telemetria) if args.telemetria or args.metricas else None
+        if args.lote:
+            roteiro_completo_chain = create_main_chain(model, telemetria=telemetria)
+            project_logger.info("📚 Processando lote com {} worker(s)...", args.workers)
+            executar_lote(roteiro_completo_chain, args.lote, args.saida, args.workers, args.modo)
+            if telemetria is not None and args.metricas:
+                print(telemetria.registry.to_prometheus(), file=sys.stderr)
+            return
 
+        inputs = {"interesse": args.interesse, "modo": args.modo}
         project_logger.info("🔍 Executando cadeia principal...")
-        resultado_final = roteiro_completo_chain({"interesse": args.interesse})
-
-        project_logger.info("📄 Roteiro gerado com sucesso. Exibindo resultado...")
-        format_and_print_roteiro(resultado_final)
+        if args.sem_streaming:
+            resultado_final = create_main_chain(model, telemetria=telemetria)(inputs)
+            project_logger.info("📄 Roteiro gerado com sucesso. Exibindo resultado...")
+            format_and_print_roteiro(resultado_final)
+        else:
+            render_stream(create_main_stream(model, telemetria=telemetria)(inputs))
+
+        if telemetria is not None and args.metricas:
+            print(telemetria.registry.to_prometheus())
 
     except Exception as e:
         project_logger.exception(f"❌ Erro durante a execução: {e}")
@@ -32,3 +32,14 @@ class Atracao(BaseModel):
 
 class ListaAtracoes(BaseModel):
     atracoes: list[Atracao]
+
+
+# * Chain 4 - Roteiro completo (modo fundido, uma única chamada ao LLM)
+class RoteiroCompleto(BaseModel):
+    destino: Destino = Field(description="Cidade recomendada e o motivo da escolha.")
+    restaurantes: ListaRestaurantes = Field(
+        description="Restaurantes recomendados na cidade escolhida."
+    )
+    passeios: ListaAtracoes = Field(
+        description="Passeios culturais recomendados na cidade escolhida."
+    )
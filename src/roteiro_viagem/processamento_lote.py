@@ -0,0 +1,151 @@
+"""Processamento em lote de roteiros de viagem
+Lê interesses (um por linha) de um arquivo ou da entrada padrão, gera os roteiros
+concorrentemente com um número limitado de workers e grava cada roteiro concluído
+imediatamente como uma linha JSONL.
+
+A execução é retomável: ao reabrir o mesmo arquivo de saída, as linhas de entrada
+já concluídas com sucesso são puladas.
+"""
+
+import json
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, TextIO
+
+from utils.logger_setup import project_logger  # Loguru
+
+
+def ler_interesses(origem: TextIO) -> Iterator[tuple[int, str]]:
+    """Gera pares (número da linha, interesse), ignorando linhas vazias e comentários."""
+    for numero, linha in enumerate(origem, start=1):
+        interesse = linha.strip()
+        if interesse and not interesse.startswith("#"):
+            yield numero, interesse
+
+
+def linhas_concluidas(caminho_saida: Path) -> set[int]:
+    """Lê um JSONL de saída anterior e devolve as linhas de entrada já concluídas."""
+    concluidas: set[int] = set()
+    if not caminho_saida.exists():
+        return concluidas
+    with caminho_saida.open(encoding="utf-8") as f:
+        for registro_bruto in f:
+            try:
+                registro = json.loads(registro_bruto)
+            except json.JSONDecodeError:
+                # Última linha truncada por uma interrupção: será reprocessada
+                continue
+            if registro.get("status") == "ok":
+                concluidas.add(registro["linha"])
+    return concluidas
+
+
+def _termina_sem_quebra_de_linha(caminho: Path) -> bool:
+    if not caminho.exists() or caminho.stat().st_size == 0:
+        return False
+    with caminho.open("rb") as f:
+        f.seek(-1, 2)
+        return f.read(1) != b"\n"
+
+
+def roteiro_para_dict(resultado: dict[str, Any]) -> dict[str, Any]:
+    """Converte o resultado do orquestrador (com modelos Pydantic) em dict serializável."""
+
+    def normalizar(valor: Any) -> Any:
+        if hasattr(valor, "model_dump"):
+            return valor.model_dump()
+        if isinstance(valor, dict):
+            return {chave: normalizar(v) for chave, v in valor.items()}
+        return valor
+
+    return normalizar(resultado)
+
+
+def processar_lote(
+    roteiro_chain: Callable[[dict[str, Any]], dict[str, Any]],
+    interesses: Iterable[tuple[int, str]],
+    saida: TextIO,
+    workers: int = 4,
+    modo: str | None = None,
+    pular: set[int] | None = None,
+) -> dict[str, int]:
+    """Gera roteiros para cada interesse e grava um JSONL por roteiro concluído.
+
+    No máximo `2 * workers` interesses ficam em memória ao mesmo tempo, então a
+    entrada pode ser arbitrariamente grande (inclusive um stream via stdin).
+
+    Returns:
+        dict[str, int]: Contagem de roteiros "ok", com "erro" e "pulados".
+
+    """
+    pular = pular or set()
+    contagem = {"ok": 0, "erro": 0, "pulados": 0}
+    lock_saida = threading.Lock()
+
+    def gerar(numero: int, interesse: str) -> None:
+        inputs: dict[str, Any] = {"interesse": interesse}
+        if modo is not None:
+            inputs["modo"] = modo
+        try:
+            registro = {
+                "linha": numero,
+                "interesse": interesse,
+                "status": "ok",
+                "roteiro": roteiro_para_dict(roteiro_chain(inputs)),
+            }
+        except Exception as e:  # noqa: BLE001 - o lote continua mesmo com falhas
+            project_logger.error("[Lote] Falha na linha {}: {}", numero, e)
+            registro = {"linha": numero, "interesse": interesse, "status": "erro", "erro": str(e)}
+
+        linha = json.dumps(registro, ensure_ascii=False)
+        with lock_saida:
+            saida.write(linha + "\n")
+            saida.flush()
+            contagem[registro["status"]] += 1
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="roteiro") as executor:
+        em_andamento: set[Future[None]] = set()
+        for numero, interesse in interesses:
+            if numero in pular:
+                contagem["pulados"] += 1
+                continue
+            if len(em_andamento) >= 2 * workers:
+                _, em_andamento = wait(em_andamento, return_when=FIRST_COMPLETED)
+            em_andamento.add(executor.submit(gerar, numero, interesse))
+        wait(em_andamento)
+
+    return contagem
+
+
+def executar_lote(
+    roteiro_chain: Callable[[dict[str, Any]], dict[str, Any]],
+    entrada: str,
+    saida: str | None,
+    workers: int,
+    modo: str | None = None,
+) -> dict[str, int]:
+    """Abre entrada ("-" para stdin) e saída (None para stdout) e processa o lote."""
+    caminho_saida = Path(saida) if saida else None
+    pular = linhas_concluidas(caminho_saida) if caminho_saida else set()
+    if pular:
+        project_logger.info("[Lote] Retomando: {} linha(s) já concluída(s) serão puladas", len(pular))
+
+    origem = sys.stdin if entrada == "-" else Path(entrada).open(encoding="utf-8")  # noqa: SIM115
+    destino = caminho_saida.open("a", encoding="utf-8") if caminho_saida else sys.stdout  # noqa: SIM115
+    if caminho_saida and _termina_sem_quebra_de_linha(caminho_saida):
+        destino.write("\n")  # isola uma última linha truncada por interrupção
+    try:
+        contagem = processar_lote(roteiro_chain, ler_interesses(origem), destino, workers, modo, pular)
+    finally:
+        if origem is not sys.stdin:
+            origem.close()
+        if destino is not sys.stdout:
+            destino.close()
+
+    project_logger.info(
+        "[Lote] Concluído: {ok} ok, {erro} com erro, {pulados} pulado(s)", **contagem
+    )
+    return contagem
@@ -0,0 +1,200 @@
+"""Hedged requests para reduzir a latência de cauda (p99) de uma chain.
+
+Quando a chamada principal não responde até um percentil das latências recentes,
+uma chamada duplicada é disparada; vence a que terminar primeiro. Um orçamento
+limita a fração de chamadas que podem ser duplicadas, controlando a carga extra.
+
+Example:
+    ```python
+    hedger = Hedger(percentil=95, orcamento=0.05)
+    chain_destino = hedger.wrap(create_chain_destino(model))
+    chain_destino({"interesse": "trekking"})
+    print(hedger.stats())
+    ```
+
+Note:
+    As chains do projeto são síncronas, então cada chamada roda em uma thread.
+    As duplicatas têm um pool próprio e pequeno: no pool das primárias, sob
+    carga, a duplicata esperaria na fila atrás das mesmas chamadas lentas que
+    deveria vencer. Com o pool de duplicatas cheio, o hedge é pulado (e contado
+    em `hedges_sem_vaga`). A chamada perdedora é cancelada se ainda não começou; se já estiver
+    em andamento, seu resultado é simplesmente descartado (não é possível
+    interromper uma requisição HTTP síncrona em curso).
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+from utils.logger_setup import project_logger  # Loguru
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """Política de hedging compartilhada entre chamadas de uma mesma chain.
+
+    Attributes:
+        percentil (float): Percentil das latências recentes usado como atraso
+            antes de disparar a chamada duplicada (0-100).
+        orcamento (float): Fração máxima de chamadas que podem ser duplicadas
+            (ex.: 0.05 = no máximo 5%).
+        amostras_minimas (int): Latências necessárias antes de começar a duplicar.
+        atraso_minimo_s (float): Piso, em segundos, para o atraso de hedging.
+        max_hedge_workers (int): Duplicatas simultâneas (pool próprio).
+
+    """
+
+    def __init__(
+        self,
+        percentil: float = 95.0,
+        orcamento: float = 0.05,
+        janela: int = 200,
+        amostras_minimas: int = 20,
+        atraso_minimo_s: float = 0.0,
+        max_workers: int = 16,
+        max_hedge_workers: int = 4,
+    ) -> None:
+        if not 0 < percentil < 100:
+            raise ValueError("percentil deve estar entre 0 e 100")
+        if not 0 <= orcamento <= 1:
+            raise ValueError("orcamento deve estar entre 0 e 1")
+        if janela < amostras_minimas:
+            raise ValueError("janela deve ser maior ou igual a amostras_minimas")
+        if max_hedge_workers < 1:
+            raise ValueError("max_hedge_workers deve ser pelo menos 1")
+
+        self.percentil = percentil
+        self.orcamento = orcamento
+        self.amostras_minimas = amostras_minimas
+        self.atraso_minimo_s = atraso_minimo_s
+        self.max_hedge_workers = max_hedge_workers
+
+        self._latencias: deque[float] = deque(maxlen=janela)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge-primaria")
+        self._executor_hedges = ThreadPoolExecutor(
+            max_workers=max_hedge_workers, thread_name_prefix="hedge-duplicata"
+        )
+        self._hedges_em_andamento = 0
+
+        # Contadores
+        self.chamadas = 0
+        self.hedges_disparados = 0
+        self.hedges_vencedores = 0
+        self.hedges_sem_vaga = 0  # Hedge pulado: pool de duplicatas ocupado
+
+    def wrap(self, fn: Callable[[dict[str, Any]], T]) -> Callable[[dict[str, Any]], T]:
+        """Envolve um callable de chain com a política de hedging."""
+
+        def run_with_hedging(inputs: dict[str, Any]) -> T:
+            return self._executar(fn, inputs)
+
+        return run_with_hedging
+
+    def stats(self) -> dict[str, float]:
+        """Retorna um retrato dos contadores de hedging."""
+        with self._lock:
+            chamadas = self.chamadas
+            disparados = self.hedges_disparados
+            vencedores = self.hedges_vencedores
+            sem_vaga = self.hedges_sem_vaga
+        atraso = self._atraso_hedge()
+        return {
+            "chamadas": chamadas,
+            "hedges_disparados": disparados,
+            "hedges_vencedores": vencedores,
+            "hedges_sem_vaga": sem_vaga,
+            "taxa_hedge": disparados / chamadas if chamadas else 0.0,
+            "atraso_hedge_s": atraso if atraso is not None else float("nan"),
+        }
+
+    def shutdown(self) -> None:
+        """Libera as threads dos pools (chamadas em andamento são concluídas)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor_hedges.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------ #
+    # Internos
+    # ------------------------------------------------------------------ #
+    def _atraso_hedge(self) -> float | None:
+        with self._lock:
+            if len(self._latencias) < self.amostras_minimas:
+                return None
+            ordenadas = sorted(self._latencias)
+        indice = min(len(ordenadas) - 1, int(self.percentil / 100 * len(ordenadas)))
+        return max(self.atraso_minimo_s, ordenadas[indice])
+
+    def _reservar_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges_disparados + 1 > self.orcamento * self.chamadas:
+                return False
+            if self._hedges_em_andamento >= self.max_hedge_workers:
+                # Na fila, a duplicata chegaria tarde demais para competir
+                self.hedges_sem_vaga += 1
+                return False
+            self.hedges_disparados += 1
+            self._hedges_em_andamento += 1
+            return True
+
+    def _liberar_hedge(self, _futuro: Future) -> None:
+        with self._lock:
+            self._hedges_em_andamento -= 1
+
+    def _cronometrar(self, fn: Callable[[dict[str, Any]], T], inputs: dict[str, Any]) -> T:
+        inicio = time.perf_counter()
+        resultado = fn(inputs)
+        with self._lock:
+            self._latencias.append(time.perf_counter() - inicio)
+        return resultado
+
+    def _submeter(
+        self,
+        fn: Callable[[dict[str, Any]], T],
+        inputs: dict[str, Any],
+        executor: ThreadPoolExecutor | None = None,
+    ) -> Future[T]:
+        # Copia o contexto do chamador para que callbacks propagados via
+        # contextvars (ex.: telemetria) também vejam a chamada na thread do pool
+        contexto = contextvars.copy_context()
+        return (executor or self._executor).submit(contexto.run, self._cronometrar, fn, inputs)
+
+    def _executar(self, fn: Callable[[dict[str, Any]], T], inputs: dict[str, Any]) -> T:
+        with self._lock:
+            self.chamadas += 1
+        atraso = self._atraso_hedge()
+
+        primaria = self._submeter(fn, inputs)
+        if atraso is None:
+            return primaria.result()
+
+        concluidas, _ = wait([primaria], timeout=atraso)
+        if concluidas or not self._reservar_hedge():
+            return primaria.result()
+
+        project_logger.debug("[Hedging] Chamada sem resposta após {:.3f}s — disparando duplicata", atraso)
+        hedge = self._submeter(fn, inputs, self._executor_hedges)
+        hedge.add_done_callback(self._liberar_hedge)
+
+        pendentes: set[Future[T]] = {primaria, hedge}
+        primeiro_erro: BaseException | None = None
+        while pendentes:
+            concluidas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            # Em caso de empate, a chamada primária tem preferência
+            for futuro in sorted(concluidas, key=lambda f: f is hedge):
+                erro = futuro.exception()
+                if erro is None:
+                    for outro in pendentes:
+                        outro.cancel()
+                    if futuro is hedge:
+                        with self._lock:
+                            self.hedges_vencedores += 1
+                    return futuro.result()
+                primeiro_erro = primeiro_erro or erro
+
+        # Ambas falharam: propaga o primeiro erro observado
+        raise primeiro_erro  # type: ignore[misc]
@@ -2,44 +2,172 @@
 
 - Loga no console com cores
 - Salva logs em arquivo rotacionado diariamente
-- Mantém logs por 7 dias
+- Mantém logs por 7 dias (a pasta `logs/` só é criada quando o sink de arquivo
+  é configurado, nunca como efeito colateral do import)
+- A escrita em arquivo é feita por uma thread em segundo plano, através de uma
+  fila limitada: o caminho da requisição nunca espera pelo disco
+- Payloads grandes (inputs/outputs das chains) são logados com `debug_payload`,
+  que é preguiçoso e amostrado: com DEBUG desligado, o repr nem é calculado
+
+Os níveis e a taxa de amostragem podem ser definidos pelas variáveis de ambiente
+`ROTEIRO_LOG_LEVEL` (padrão: INFO) e `ROTEIRO_LOG_AMOSTRAGEM` (padrão: 1.0).
 """
 
 import os
+import queue
+import random
 import sys
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, TextIO
 
 from loguru import logger
 
-# Criar pasta de logs se não existir
-os.makedirs("logs", exist_ok=True)
+LOG_FORMAT_CONSOLE = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+LOG_FORMAT_ARQUIVO = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Estado do debug de payloads. Antes de `setup_logger`, o Loguru usa o sink
+# padrão em DEBUG, então os payloads continuam sendo logados.
+_debug_payload_habilitado = True
+_taxa_amostragem = 1.0
+
+
+class BoundedQueueFileSink:
+    """Sink do Loguru que grava em arquivo a partir de uma thread dedicada.
+
+    `write` apenas enfileira a mensagem já formatada (sem bloquear); se a fila
+    estiver cheia, a mensagem é descartada e contabilizada em `descartadas`.
+    O arquivo é rotacionado a cada dia e arquivos antigos são removidos.
+    """
+
+    _SENTINELA = None
+
+    def __init__(self, caminho: str | Path, tamanho_fila: int = 10_000, retencao_dias: int = 7) -> None:
+        self.caminho = Path(caminho)
+        self.retencao_dias = retencao_dias
+        self.descartadas = 0
+        self._fila: queue.Queue[str | None] = queue.Queue(maxsize=tamanho_fila)
+        self._thread = threading.Thread(target=self._consumir, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, mensagem: str) -> None:
+        try:
+            self._fila.put_nowait(str(mensagem))
+        except queue.Full:
+            self.descartadas += 1
+
+    def stop(self) -> None:
+        """Drena a fila e encerra a thread (chamado pelo Loguru em `logger.remove`)."""
+        self._fila.put(self._SENTINELA)
+        self._thread.join(timeout=5)
+
+    def _consumir(self) -> None:
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        dia_atual = date.today()
+        arquivo = self.caminho.open("a", encoding="utf-8")
+        try:
+            while True:
+                lote = [self._fila.get()]
+                # Agrupa o que já estiver na fila em uma única escrita
+                while len(lote) < 512:
+                    try:
+                        lote.append(self._fila.get_nowait())
+                    except queue.Empty:
+                        break
+
+                if date.today() != dia_atual:
+                    arquivo.close()
+                    self._rotacionar(dia_atual)
+                    dia_atual = date.today()
+                    arquivo = self.caminho.open("a", encoding="utf-8")
+
+                encerrar = self._SENTINELA in lote
+                arquivo.write("".join(m for m in lote if m is not self._SENTINELA))
+                arquivo.flush()
+                if encerrar:
+                    return
+        finally:
+            arquivo.close()
 
+    def _rotacionar(self, dia: date) -> None:
+        destino = self.caminho.with_name(f"{self.caminho.stem}.{dia.isoformat()}{self.caminho.suffix}")
+        if self.caminho.exists():
+            self.caminho.replace(destino)
+        antigos = sorted(self.caminho.parent.glob(f"{self.caminho.stem}.*{self.caminho.suffix}"))
+        for arquivo in antigos[: max(0, len(antigos) - self.retencao_dias)]:
+            arquivo.unlink(missing_ok=True)
+
+
+def setup_logger(
+    nivel: str | None = None,
+    nivel_arquivo: str | None = None,
+    taxa_amostragem_debug: float | None = None,
+    caminho_arquivo: str | Path = "logs/project.log",
+    tamanho_fila: int = 10_000,
+    console: TextIO = sys.stdout,
+) -> None:
+    """Configura os sinks do console e do arquivo.
+
+    Args:
+        nivel: Nível do console (padrão: `ROTEIRO_LOG_LEVEL` ou INFO).
+        nivel_arquivo: Nível do arquivo (padrão: o mesmo do console).
+        taxa_amostragem_debug: Fração (0-1) das chamadas de `debug_payload`
+            efetivamente logadas (padrão: `ROTEIRO_LOG_AMOSTRAGEM` ou 1.0).
+        caminho_arquivo: Arquivo de log (rotacionado diariamente).
+        tamanho_fila: Capacidade da fila entre o request path e a thread de escrita.
+        console: Stream do sink de console (use `sys.stderr` quando o stdout
+            carregar dados, como no modo em lote).
+
+    """
+    global _debug_payload_habilitado, _taxa_amostragem  # noqa: PLW0603
+
+    nivel = (nivel or os.getenv("ROTEIRO_LOG_LEVEL", "INFO")).upper()
+    nivel_arquivo = (nivel_arquivo or nivel).upper()
+    if taxa_amostragem_debug is None:
+        taxa_amostragem_debug = float(os.getenv("ROTEIRO_LOG_AMOSTRAGEM", "1.0"))
 
-def setup_logger() -> None:
     # Remove configuração padrão
     logger.remove()
 
     # Log no console (colorido)
-    logger.add(
-        sys.stdout,
-        colorize=True,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-               "<level>{message}</level>",
-        level="DEBUG"
-    )
+    logger.add(console, colorize=True, format=LOG_FORMAT_CONSOLE, level=nivel)
 
-    # Log em arquivo (rotaciona a cada dia, mantém 7 dias)
+    # Log em arquivo, escrito em segundo plano
     logger.add(
-        "logs/project.log",
-        rotation="1 day",
-        retention="7 days",
-        encoding="utf-8",
-        enqueue=True,
-        level="DEBUG"
+        BoundedQueueFileSink(caminho_arquivo, tamanho_fila=tamanho_fila),
+        format=LOG_FORMAT_ARQUIVO,
+        level=nivel_arquivo,
+        colorize=False,
     )
 
-    return logger
+    debug_no = logger.level("DEBUG").no
+    _debug_payload_habilitado = min(logger.level(nivel).no, logger.level(nivel_arquivo).no) <= debug_no
+    _taxa_amostragem = max(0.0, min(1.0, taxa_amostragem_debug))
+
+
+def debug_payload(mensagem: str, *args: Any) -> None:
+    """Loga em DEBUG um payload potencialmente grande, de forma preguiçosa e amostrada.
+
+    A mensagem usa placeholders do Loguru (`{}`/`{!r}`) em vez de f-strings, então
+    os argumentos só são formatados se o registro for de fato emitido.
+
+    Example:
+        ```python
+        debug_payload("[Chain Destino] Saída gerada: {!r}", output)
+        ```
+
+    """
+    if not _debug_payload_habilitado:
+        return
+    if _taxa_amostragem < 1.0 and random.random() >= _taxa_amostragem:  # noqa: S311
+        return
+    project_logger.opt(depth=1).debug(mensagem, *args)
 
 
 # Instância global
@@ -0,0 +1,220 @@
+"""Telemetria local por etapa do orquestrador (sem LangSmith e sem rede).
+
+Cada etapa (destino, restaurantes, passeios, parsing...) vira um *span* com
+tempo de parede, tokens de prompt/completion, retries e cache hits. Os spans são
+gravados em um arquivo JSONL e agregados em um registro de histogramas em
+memória, que pode ser exportado no formato de texto do Prometheus.
+
+Example:
+    ```python
+    telemetria = Telemetria("logs/spans.jsonl")
+    roteiro_chain = create_main_chain(model, telemetria=telemetria)
+    roteiro_chain({"interesse": "trekking"})
+    print(telemetria.registry.to_prometheus())
+    ```
+
+Note:
+    Os tokens são coletados por um callback do LangChain propagado via
+    `contextvars` (mesmo mecanismo de `get_usage_metadata_callback`), então as
+    chains não precisam receber `config` explicitamente.
+"""
+
+import json
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+# Buckets (em segundos) pensados para chamadas a LLM: de 50 ms a 2 minutos
+BUCKETS_LATENCIA_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 120.0)
+
+_span_handler_var: ContextVar["SpanCallbackHandler | None"] = ContextVar(
+    "roteiro_span_handler", default=None
+)
+register_configure_hook(_span_handler_var, inheritable=True)
+
+
+class SpanCallbackHandler(BaseCallbackHandler):
+    """Coleta tokens, retries, cache hits e tempo de parsing de um span."""
+
+    def __init__(self) -> None:
+        self.tokens_prompt = 0
+        self.tokens_completion = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.parsing_s = 0.0
+        self._inicio_parsers: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for geracoes in response.generations:
+            for geracao in geracoes:
+                uso = getattr(getattr(geracao, "message", None), "usage_metadata", None)
+                if not uso:
+                    continue
+                cache_read = (uso.get("input_token_details") or {}).get("cache_read", 0)
+                with self._lock:
+                    self.tokens_prompt += uso.get("input_tokens", 0)
+                    self.tokens_completion += uso.get("output_tokens", 0)
+                    self.cache_hits += 1 if cache_read else 0
+
+    def on_retry(self, retry_state: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def on_chain_start(
+        self, serialized: dict[str, Any] | None, inputs: Any, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        nome = kwargs.get("name") or (serialized or {}).get("name") or ""
+        if "Parser" in nome:
+            with self._lock:
+                self._inicio_parsers[run_id] = time.perf_counter()
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._fechar_parser(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._fechar_parser(run_id)
+
+    def _fechar_parser(self, run_id: UUID) -> None:
+        with self._lock:
+            inicio = self._inicio_parsers.pop(run_id, None)
+            if inicio is not None:
+                self.parsing_s += time.perf_counter() - inicio
+
+
+class HistogramRegistry:
+    """Registro em memória de histogramas e contadores, exportável para Prometheus."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS_LATENCIA_S) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._histogramas: dict[tuple[str, tuple[tuple[str, str], ...]], list[float]] = {}
+        self._contadores: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, nome: str, valor: float, **labels: str) -> None:
+        """Registra uma observação no histograma `nome`."""
+        chave = (nome, tuple(sorted(labels.items())))
+        with self._lock:
+            # Layout: [contagem por bucket..., +Inf, soma]
+            estado = self._histogramas.setdefault(chave, [0.0] * (len(self.buckets) + 2))
+            estado[bisect_left(self.buckets, valor)] += 1
+            estado[-1] += valor
+
+    def inc(self, nome: str, valor: float = 1.0, **labels: str) -> None:
+        """Incrementa o contador `nome`."""
+        chave = (nome, tuple(sorted(labels.items())))
+        with self._lock:
+            self._contadores[chave] = self._contadores.get(chave, 0.0) + valor
+
+    def to_prometheus(self) -> str:
+        """Exporta o registro no formato de texto do Prometheus."""
+        with self._lock:
+            histogramas = {k: list(v) for k, v in self._histogramas.items()}
+            contadores = dict(self._contadores)
+
+        linhas: list[str] = []
+        tipos_emitidos: set[str] = set()
+        for (nome, labels), estado in sorted(histogramas.items()):
+            if nome not in tipos_emitidos:
+                linhas.append(f"# TYPE {nome} histogram")
+                tipos_emitidos.add(nome)
+            acumulado = 0.0
+            for limite, contagem in zip((*self.buckets, float("inf")), estado[:-1], strict=True):
+                acumulado += contagem
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                linhas.append(f"{nome}_bucket{_formatar_labels(labels, le=le)} {acumulado:g}")
+            linhas.append(f"{nome}_sum{_formatar_labels(labels)} {estado[-1]:.6f}")
+            linhas.append(f"{nome}_count{_formatar_labels(labels)} {acumulado:g}")
+        for (nome, labels), valor in sorted(contadores.items()):
+            if nome not in tipos_emitidos:
+                linhas.append(f"# TYPE {nome} counter")
+                tipos_emitidos.add(nome)
+            linhas.append(f"{nome}{_formatar_labels(labels)} {valor:g}")
+        return "\n".join(linhas) + "\n"
+
+
+def _formatar_labels(labels: tuple[tuple[str, str], ...], **extras: str) -> str:
+    pares = [*labels, *extras.items()]
+    if not pares:
+        return ""
+    return "{" + ",".join(f'{chave}="{valor}"' for chave, valor in pares) + "}"
+
+
+class Telemetria:
+    """Gera spans por etapa, grava em JSONL e alimenta o registro de histogramas."""
+
+    def __init__(self, caminho_jsonl: str | Path | None = "logs/spans.jsonl") -> None:
+        self.caminho_jsonl = Path(caminho_jsonl) if caminho_jsonl else None
+        self.registry = HistogramRegistry()
+        self._lock_arquivo = threading.Lock()
+        if self.caminho_jsonl is not None:
+            self.caminho_jsonl.parent.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def span(self, etapa: str, trace_id: str | None = None) -> Iterator[SpanCallbackHandler]:
+        """Mede a etapa `etapa`, coletando métricas das chamadas ao LLM feitas dentro dela.
+
+        O tempo gasto nos output parsers é emitido também como um span filho
+        `parsing`, para separar o custo de geração do custo de validação.
+        """
+        handler = SpanCallbackHandler()
+        token = _span_handler_var.set(handler)
+        inicio_epoch = time.time()
+        inicio = time.perf_counter()
+        status = "ok"
+        try:
+            yield handler
+        except BaseException:
+            status = "erro"
+            raise
+        finally:
+            duracao = time.perf_counter() - inicio
+            _span_handler_var.reset(token)
+            trace_id = trace_id or uuid.uuid4().hex
+            self._registrar(
+                {
+                    "trace_id": trace_id,
+                    "etapa": etapa,
+                    "inicio": inicio_epoch,
+                    "duracao_s": round(duracao, 6),
+                    "tokens_prompt": handler.tokens_prompt,
+                    "tokens_completion": handler.tokens_completion,
+                    "retries": handler.retries,
+                    "cache_hits": handler.cache_hits,
+                    "status": status,
+                }
+            )
+            if handler.parsing_s:
+                self._registrar(
+                    {
+                        "trace_id": trace_id,
+                        "etapa": "parsing",
+                        "etapa_pai": etapa,
+                        "duracao_s": round(handler.parsing_s, 6),
+                        "status": status,
+                    }
+                )
+
+    def _registrar(self, registro: dict[str, Any]) -> None:
+        etapa = registro["etapa"]
+        self.registry.observe("roteiro_etapa_duracao_segundos", registro["duracao_s"], etapa=etapa)
+        self.registry.inc("roteiro_etapa_total", etapa=etapa, status=registro["status"])
+        for campo in ("tokens_prompt", "tokens_completion", "retries", "cache_hits"):
+            if registro.get(campo):
+                self.registry.inc(f"roteiro_etapa_{campo}_total", registro[campo], etapa=etapa)
+
+        if self.caminho_jsonl is not None:
+            linha = json.dumps(registro, ensure_ascii=False)
+            with self._lock_arquivo, self.caminho_jsonl.open("a", encoding="utf-8") as f:
+                f.write(linha + "\n")
@@ -0,0 +1,27 @@
+"""Orçamento de startup das CLIs (`roteiro_viagem.benchmarks.perfil_importacao`)."""
+
+import pytest
+
+from roteiro_viagem.benchmarks.perfil_importacao import ALVOS_PADRAO, Alvo, perfilar
+
+# Mesma quantidade de execuções da CLI: a mediana absorve a variação do runner
+EXECUCOES = 5
+
+ALVOS_COM_ORCAMENTO = [alvo for alvo in ALVOS_PADRAO if alvo.orcamento_ms is not None]
+
+
+@pytest.mark.parametrize("alvo", ALVOS_COM_ORCAMENTO, ids=lambda alvo: alvo.nome)
+def test_startup_dentro_do_orcamento(alvo: Alvo):
+    """Cada alvo termina com o código esperado e dentro do seu orçamento."""
+    perfil = perfilar(alvo, EXECUCOES)
+
+    # Um main.py que quebra na importação também termina rápido
+    assert perfil.codigo_saida == alvo.codigo_esperado, (
+        f"{alvo.nome}: código de saída {perfil.codigo_saida}, "
+        f"esperado {alvo.codigo_esperado}"
+    )
+    assert perfil.cumulativo_us, f"{alvo.nome}: saída de -X importtime vazia"
+    assert not perfil.estourou, (
+        f"{alvo.nome}: mediana de {perfil.mediana_ms:.1f} ms excede o orçamento de "
+        f"{alvo.orcamento_ms:.0f} ms"
+    )
@@ -0,0 +1,48 @@
+"""Heurística de clareza do caminho rápido (`question_assistant.is_clear_question`)."""
+
+import importlib
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+RAIZ_PROJECTS = Path(__file__).resolve().parents[1] / "projects"
+
+# (pergunta, clara?) — uma pergunta "clara" pula a reformulação pelo LLM
+CASOS = [
+    ("O que é uma lista em Python", True),
+    ("Por que usar um decorator em python", True),
+    ("Como criar uma classe em Python", True),
+    ("Qual a diferença entre lista e tupla em python", True),
+    ("python lista vs tupla diferença?", True),
+    ("What is a generator in python", True),
+    ("me explica isso por favor python", False),
+    ("acho que python e legal demais", False),
+    ("use python como calculadora no terminal", False),
+    ("como usar python", False),  # Curta demais
+    ("Como faço uma receita de bolo de cenoura", False),  # Fora do domínio
+]
+
+
+@pytest.fixture(scope="module")
+def question_assistant(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    """Importa o módulo com o log (`question_assistant.log`) em uma pasta temporária.
+
+    Returns:
+        ModuleType: O módulo `question_assistant`.
+
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("question_assistant"))
+        mp.syspath_prepend(str(RAIZ_PROJECTS))
+        return importlib.import_module(
+            "agentstate_langgraph_linear_flow.question_assistant"
+        )
+
+
+@pytest.mark.parametrize(("pergunta", "clara"), CASOS)
+def test_is_clear_question(
+    question_assistant: ModuleType, pergunta: str, *, clara: bool
+):
+    """Só perguntas do domínio, com forma de pergunta, vão direto à resposta."""
+    assert question_assistant.is_clear_question(pergunta) is clara
@@ -0,0 +1,134 @@
+"""Cache em disco das ferramentas do agente (`agent_ai_from_scratch.tool_cache`)."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from agent_ai_from_scratch.parallel_tools import with_timeout
+from agent_ai_from_scratch.tool_cache import LocalBackendTool, ToolCache, cache_tool
+
+RESPOSTAS = {"LangChain agents": "Agentes escolhem ferramentas a cada passo."}
+CONCORRENTES = 16
+
+
+def criar_backend(latency_s: float = 0.0) -> LocalBackendTool:
+    """Backend offline com uma resposta conhecida.
+
+    Returns:
+        LocalBackendTool: Ferramenta que conta as chamadas recebidas.
+
+    """
+    return LocalBackendTool(
+        name="search",
+        description="Busca local",
+        responses=RESPOSTAS,
+        latency_s=latency_s,
+    )
+
+
+def test_threads_concorrentes_fazem_uma_chamada(tmp_path: Path):
+    """16 threads com a mesma consulta esperam uma única busca no backend."""
+    backend = criar_backend(latency_s=0.2)
+    search = cache_tool(backend, ToolCache(tmp_path / "cache.sqlite"), 3600)
+    barreira = threading.Barrier(CONCORRENTES)
+    resultados: list[str] = []
+
+    def consultar() -> None:
+        barreira.wait()
+        resultados.append(search.invoke("LangChain agents"))
+
+    threads = [threading.Thread(target=consultar) for _ in range(CONCORRENTES)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert backend.calls == 1
+    assert resultados == [RESPOSTAS["LangChain agents"]] * CONCORRENTES
+
+
+def test_corrotinas_concorrentes_fazem_uma_chamada(tmp_path: Path):
+    """16 corrotinas com a mesma consulta esperam uma única busca no backend."""
+    backend = criar_backend(latency_s=0.2)
+    search = cache_tool(backend, ToolCache(tmp_path / "cache.sqlite"), 3600)
+
+    async def consultar_todas() -> list[str]:
+        return await asyncio.gather(
+            *(search.ainvoke("LangChain agents") for _ in range(CONCORRENTES))
+        )
+
+    resultados = asyncio.run(consultar_todas())
+
+    assert backend.calls == 1
+    assert resultados == [RESPOSTAS["LangChain agents"]] * CONCORRENTES
+
+
+def test_timeout_do_lider_nao_cancela_quem_espera(tmp_path: Path):
+    """O timeout de quem iniciou a busca não derruba as chamadas coalescidas."""
+    backend = criar_backend(latency_s=0.5)
+    search = cache_tool(backend, ToolCache(tmp_path / "cache.sqlite"), 3600)
+    rapida, paciente = with_timeout(search, 0.2), with_timeout(search, 5)
+
+    async def consultar() -> list[str]:
+        return await asyncio.gather(
+            rapida.ainvoke("LangChain agents"), paciente.ainvoke("LangChain agents")
+        )
+
+    resultado_rapida, resultado_paciente = asyncio.run(consultar())
+
+    assert "excedeu o limite" in resultado_rapida
+    assert resultado_paciente == RESPOSTAS["LangChain agents"]
+    assert backend.calls == 1
+    # A busca abandonada pelo líder terminou e ficou no cache
+    assert search.invoke("LangChain agents") == RESPOSTAS["LangChain agents"]
+    assert backend.calls == 1
+
+
+def test_entrada_expira_apos_ttl(tmp_path: Path):
+    """Depois do TTL a consulta volta ao backend; antes, vem do cache."""
+    backend = criar_backend()
+    cache = ToolCache(tmp_path / "cache.sqlite")
+    search = cache_tool(backend, cache, ttl_seconds=0.2)
+
+    search.invoke("LangChain agents")
+    search.invoke("LangChain agents")
+    chamadas_antes = backend.calls
+    assert chamadas_antes == 1
+
+    time.sleep(0.3)
+    search.invoke("LangChain agents")
+    assert backend.calls == chamadas_antes + 1
+    assert cache.purge_expired() == 0  # A entrada foi renovada pela nova busca
+
+
+def test_variantes_normalizadas_compartilham_entrada(tmp_path: Path):
+    """Caixa, espaços e pontuação final não geram chaves diferentes."""
+    backend = criar_backend()
+    cache = ToolCache(tmp_path / "cache.sqlite")
+    search = cache_tool(backend, cache, 3600)
+
+    variantes = ["LangChain agents", "  langchain   AGENTS? ", "LANGCHAIN AGENTS!"]
+    resultados = {search.invoke(consulta) for consulta in variantes}
+
+    assert backend.calls == 1
+    assert resultados == {RESPOSTAS["LangChain agents"]}
+    assert cache.stats()["search"]["hits"] == len(variantes) - 1
+
+
+def test_entradas_persistem_ao_reabrir(tmp_path: Path):
+    """Um novo `ToolCache` no mesmo arquivo encontra os resultados gravados."""
+    caminho = tmp_path / "cache.sqlite"
+    primeiro = criar_backend()
+    cache = ToolCache(caminho)
+    cache_tool(primeiro, cache, 3600).invoke("LangChain agents")
+    cache.close()
+
+    segundo = criar_backend()
+    reaberto = ToolCache(caminho)
+    resultado = cache_tool(segundo, reaberto, 3600).invoke("LangChain agents")
+    reaberto.close()
+
+    assert primeiro.calls == 1
+    assert segundo.calls == 0
+    assert resultado == RESPOSTAS["LangChain agents"]